@@ -5,23 +5,31 @@
 
 import os
 import asyncio
+import copy
 import json
-import hashlib
 import re
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import threading
+import time
+from typing import Annotated, Dict, Any, List, Optional, Tuple
+from datetime import datetime
 from dataclasses import dataclass
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
 from langchain_core.tools import tool
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver  # unused but kept if you plan to use
-from langgraph.prebuilt import ToolNode
-from pymongo import MongoClient
+from langgraph.channels.untracked_value import UntrackedValue
+from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel
-from .ecommerce_service import EcommerceService
+from .ecommerce_service import EcommerceService, cart_memo_scope, create_mongo_client
 from .rag_knowledge_base import get_knowledge_base, search_knowledge, get_context
+from .response_cache import ResponseCache, create_backend
+from .checkpointer import create_checkpointer
+from .intent_router import INTENT_ROUTER_ENABLED, IntentRouter, render as render_intent
+from .pc_builder import PC_BUILDER_STEP_INDEX, PC_BUILDER_STEPS, CandidatePool, component, parse_selection, render_step, render_summary
+from .semantic_cache import CATALOG, SEMANTIC_CACHE_ENABLED, SemanticCache
+from .session_store import MAX_MESSAGES, SessionStore
+from .tool_executor import ToolExecutor
 
 # Global registry so LangChain tools can access the EcommerceService instance
 ECOMMERCE_SERVICE = None
@@ -65,56 +73,53 @@ class AgentConfig:
 # MongoDB-based Memory Store
 class MongoDBMemoryStore:
     def __init__(self, config: AgentConfig):
-        self.client = MongoClient(config.mongo_uri)
+        # Async client shares the pool settings used by EcommerceService
+        self.client = create_mongo_client(config.mongo_uri)
         self.db = self.client[config.db_name]
         self.conversations = self.db.conversations
+        self.sessions = SessionStore(self.conversations)
         print("MongoDB conversation storage initialized successfully")
 
+    async def load_session(self, session_id: str, limit: int = 6) -> Tuple[List[Dict], Optional[Dict]]:
+        """Recent messages and metadata of a session in one read (metadata is None for a new session)"""
+        messages, metadata = await self.sessions.load(session_id, limit=limit)
+        print(f"[debug] Loaded {len(messages)} messages for session: {session_id}")
+        return messages, metadata
+
+    async def append_to_session(self, session_id: str, messages: List[Dict], metadata: Dict,
+                                previous_metadata: Dict = None):
+        """Append a turn's new messages and write only the metadata keys that changed"""
+        await self.sessions.append(session_id, messages, metadata, previous_metadata)
+        print(f"[debug] Appended {len(messages)} messages for session: {session_id}")
+
     async def save_conversation(self, session_id: str, messages: List[Dict], metadata: Dict = None):
         """Save conversation to MongoDB - keep only recent messages to avoid bloat"""
-        # Limit messages to last 50 to prevent database bloat
-        MAX_MESSAGES = 50
         if len(messages) > MAX_MESSAGES:
-            messages = messages[-MAX_MESSAGES:]
             print(f"[debug] Trimmed messages to last {MAX_MESSAGES} for session: {session_id}")
-        
-        doc = {
-            "session_id": session_id,
-            "messages": messages,
-            "metadata": metadata or {},
-            "timestamp": datetime.utcnow(),
-            "last_updated": datetime.utcnow()
-        }
-        
-        # Upsert conversation (update if exists, insert if not)
-        self.conversations.replace_one(
-            {"session_id": session_id}, 
-            doc, 
-            upsert=True
-        )
-        print(f"[debug] Saved {len(messages)} messages for session: {session_id}")
+        await self.sessions.replace(session_id, messages, metadata)
+        print(f"[debug] Saved {min(len(messages), MAX_MESSAGES)} messages for session: {session_id}")
 
     async def load_conversation(self, session_id: str, limit: int = 20) -> List[Dict]:
         """Load conversation from MongoDB - only load recent messages for performance"""
-        doc = self.conversations.find_one({"session_id": session_id})
-        if doc:
-            messages = doc.get("messages", [])
-            # Only keep the last N messages to avoid processing too much history
-            limited_messages = messages[-limit:] if len(messages) > limit else messages
-            print(f"[debug] Loaded {len(limited_messages)} messages (out of {len(messages)} total) for session: {session_id}")
-            return limited_messages
-        print(f"[debug] No conversation found for session: {session_id}")
-        return []
+        messages, metadata = await self.sessions.load(session_id, limit=limit)
+        if metadata is None:
+            print(f"[debug] No conversation found for session: {session_id}")
+        else:
+            print(f"[debug] Loaded {len(messages)} messages for session: {session_id}")
+        return messages
+
+    async def flush(self):
+        """Write any queued session updates to MongoDB"""
+        await self.sessions.flush_all()
 
     async def get_all_sessions(self) -> List[str]:
         """Get all session IDs"""
-        sessions = list(self.conversations.find({}, {"session_id": 1, "_id": 0}))
+        sessions = await self.conversations.find({}, {"session_id": 1, "_id": 0}).to_list(length=None)
         return [s["session_id"] for s in sessions]
 
     async def clear_session(self, session_id: str):
         """Clear a specific session"""
-        result = self.conversations.delete_one({"session_id": session_id})
-        if result.deleted_count > 0:
+        if await self.sessions.delete(session_id) > 0:
             print(f"[debug] Cleared conversation for session: {session_id}")
         else:
             print(f"[debug] No conversation found to clear for session: {session_id}")
@@ -150,67 +155,20 @@ class MongoDBMemoryStore:
             print(f"[debug] Error creating summary: {e}")
             return ""
 
-class ResponseCache:
-    """Simple in-memory cache for LLM responses to avoid repeated calls"""
-    def __init__(self, max_size: int = 100, ttl_minutes: int = 30):
-        self.cache: Dict[str, Dict] = {}
-        self.max_size = max_size
-        self.ttl_minutes = ttl_minutes
-    
-    def _generate_key(self, query: str, context_summary: str = "") -> str:
-        """Generate cache key from query and context"""
-        content = f"{query.lower().strip()}{context_summary}"
-        return hashlib.md5(content.encode()).hexdigest()
-    
-    def get(self, query: str, context_summary: str = "") -> Optional[str]:
-        """Get cached response if available and not expired"""
-        key = self._generate_key(query, context_summary)
-        
-        if key not in self.cache:
-            return None
-        
-        cached_data = self.cache[key]
-        created_at = datetime.fromisoformat(cached_data["created_at"])
-        
-        # Check if expired
-        if datetime.now() - created_at > timedelta(minutes=self.ttl_minutes):
-            del self.cache[key]
-            return None
-        
-        print(f"[debug] Cache hit for query: {query[:50]}...")
-        return cached_data["response"]
-    
-    def set(self, query: str, response: str, context_summary: str = ""):
-        """Cache response with expiration"""
-        key = self._generate_key(query, context_summary)
-        
-        # Clean up old entries if cache is full
-        if len(self.cache) >= self.max_size:
-            # Remove oldest entry
-            oldest_key = min(self.cache.keys(), 
-                           key=lambda k: self.cache[k]["created_at"])
-            del self.cache[oldest_key]
-        
-        self.cache[key] = {
-            "response": response,
-            "created_at": datetime.now().isoformat(),
-            "query": query[:100]  # Store truncated query for debugging
-        }
-        print(f"[debug] Cached response for query: {query[:50]}...")
-
 # Agent State
 @dataclass
 class AgentState:
-    messages: List[Dict] = None
+    # Per-turn fields are untracked channels: they start fresh every turn and are never checkpointed
+    messages: Annotated[List[Dict], UntrackedValue(list)] = None
     session_id: str = ""
-    user_input: str = ""
-    ai_response: str = ""
-    needs_human_approval: bool = False
-    human_feedback: Optional[str] = None
-    context: Dict[str, Any] = None
+    user_input: Annotated[str, UntrackedValue(str)] = ""
+    ai_response: Annotated[str, UntrackedValue(str)] = ""
+    needs_human_approval: Annotated[bool, UntrackedValue(bool)] = False
+    human_feedback: Annotated[Optional[str], UntrackedValue(str)] = None
+    context: Annotated[Dict[str, Any], UntrackedValue(dict)] = None
     user_id: str = ""  # For e-commerce operations
-    ecommerce_data: Dict = None  # Store e-commerce related data
-    lc_messages: List[Any] = None  # LangChain message history for ReAct loop
+    ecommerce_data: Annotated[Dict, UntrackedValue(dict)] = None  # Store e-commerce related data
+    lc_messages: Annotated[List[Any], UntrackedValue(list)] = None  # LangChain message history for ReAct loop
     
     # Checkout flow control
     checkout_step: str = "none"  # none, cart, shipping, coupon, review, order, completed
@@ -220,7 +178,14 @@ class AgentState:
     # PC Builder flow control
     pc_builder_step: str = "none"  # none, ram, ssd, cpu, gpu, psu, motherboard, aircooler, case, completed
     in_pc_builder_flow: bool = False  # Flag for PC builder flow
-    pc_builder_data: Dict = None  # Store PC builder data (build_id, products, etc.)
+    pc_builder_data: Dict = None  # Selected components, the products on screen, and build_id once saved
+
+    # Set once a durable checkpoint holds the flow state above (older sessions keep it in metadata)
+    checkpointed: bool = False
+
+    # Session snapshot as loaded, so _save_memory writes only what this turn changed
+    loaded_message_count: Annotated[int, UntrackedValue(int)] = 0
+    loaded_metadata: Annotated[Dict, UntrackedValue(dict)] = None
 
     def __post_init__(self):
         if self.messages is None:
@@ -235,6 +200,8 @@ class AgentState:
             self.checkout_data = {}
         if self.pc_builder_data is None:
             self.pc_builder_data = {}
+        if self.loaded_metadata is None:
+            self.loaded_metadata = {}
 
 # Human-in-the-Loop Manager
 class HITLManager:
@@ -1267,8 +1234,8 @@ async def search_knowledge_base_tool(query: str) -> Dict:
         Dict containing search results with relevant information
     """
     try:
-        from rag_knowledge_base import search_knowledge
-        results = search_knowledge(query, top_k=3)
+        # Retrieval is CPU-bound; keep it off the event loop so other tool calls run meanwhile
+        results = await asyncio.to_thread(search_knowledge, query, top_k=3)
         
         if not results:
             return {
@@ -1301,12 +1268,12 @@ async def get_product_information_tool(product_query: str) -> Dict:
         Dict containing relevant product information from knowledge base
     """
     try:
-        from rag_knowledge_base import get_context
-        context = get_context(f"product {product_query}", max_length=800)
+        # Retrieval is CPU-bound; keep it off the event loop so other tool calls run meanwhile
+        context = await asyncio.to_thread(get_context, f"product {product_query}", max_length=800)
         
         if "No relevant information found" in context:
             # Try a broader search
-            context = get_context(product_query, max_length=800)
+            context = await asyncio.to_thread(get_context, product_query, max_length=800)
         
         return {
             "success": True,
@@ -1333,6 +1300,7 @@ class AgenticAI:
                 model="gpt-4o-mini",  # Correct model name
                 temperature=0.2,  # Slightly higher for better instruction following
                 max_tokens=400,   # Slightly increased for tool responses
+                streaming=True,   # Lets stream_chat forward tokens as they are generated
             )
             print(f"[debug] ChatOpenAI client initialized with gpt-4o-mini")
         except Exception as e:
@@ -1341,12 +1309,15 @@ class AgenticAI:
 
         self.memory_store = MongoDBMemoryStore(config)
         self.hitl_manager = HITLManager()
-        self.response_cache = ResponseCache(max_size=50, ttl_minutes=15)  # Cache for 15 minutes
+        self.response_cache = ResponseCache(max_size=50, ttl_minutes=15, backend=create_backend())  # Cache for 15 minutes
+        # Second tier: answers to differently worded versions of the same question
+        self.semantic_cache = SemanticCache() if SEMANTIC_CACHE_ENABLED else None
         
         # Try to initialize EcommerceService
         try:
             from .ecommerce_service import EcommerceService
             self.ecommerce = EcommerceService(config.mongo_uri, config.ecommerce_db_name)
+            self.ecommerce.catalog.add_listener(self._on_catalog_change)
             print("✅ E-commerce service initialized successfully")
         except Exception as e:
             print(f"⚠️ E-commerce service initialization failed: {e}")
@@ -1404,11 +1375,31 @@ class AgenticAI:
             get_product_information_tool,
         ]
         self.llm_with_tools = self.llm.bind_tools(self.tools)
-        # Underlying ToolNode runnable used by our wrapper node
-        self.tool_node = ToolNode(self.tools)
-
-        # Build the graph
-        self.graph = self._build_graph()
+        # Runs the tool calls for our tools node
+        self.tool_executor = ToolExecutor(self.tools)
+        # Answers deterministic intents without the LLM
+        self.intent_router = IntentRouter() if INTENT_ROUTER_ENABLED else None
+        # PC builder candidates, shared by every session and prefetched one step ahead
+        self.pc_candidates = CandidatePool(self.ecommerce)
+
+        # The graph is compiled on first use, once its checkpointer can be opened on the event loop
+        self.checkpointer = None
+        self.checkpoint_durable = False
+        self.graph = None
+        self._graph_lock = asyncio.Lock()
+
+    def _on_catalog_change(self, event: str, product_id: Optional[str], product: Optional[Dict]):
+        """Catalog listener: cached answers and tool results may quote stale products, prices or stock"""
+        if self.semantic_cache is not None:
+            self.semantic_cache.invalidate_intent(CATALOG)
+        self.tool_executor.clear_cache()
+        self.pc_candidates.clear()
+
+    async def _semantic_cache_call(self, method, *args):
+        """Run a semantic cache get/set, on a worker thread when it embeds with the sentence model"""
+        if self.semantic_cache.embedder is not None:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
 
     # =============== CHECKOUT FLOW NODES (Deterministic) ===============
     
@@ -2137,152 +2128,94 @@ Keep your response concise and helpful."""
         
         return state
     
-    async def _pc_builder_ram_node(self, state: AgentState) -> AgentState:
-        """Handle RAM selection step."""
-        print("[debug] PC Builder: RAM step")
+    async def _pc_builder_step_node(self, state: AgentState) -> AgentState:
+        """Handle one PC builder step: the list, a selection, a skip, or a question (see PC_BUILDER_STEPS)."""
+        step = PC_BUILDER_STEPS[PC_BUILDER_STEP_INDEX.get(state.pc_builder_step, 0)]
+        print(f"[debug] PC Builder: {step.label} step")
         
         # Ensure we're marked as in PC builder flow
         state.in_pc_builder_flow = True
-        state.pc_builder_step = "ram"
+        state.pc_builder_step = step.key
         
-        user_input_lower = state.user_input.lower() if state.user_input else ""
+        if not self.ecommerce:
+            state.ai_response = "Sorry, the PC builder is not available right now."
+            state.in_pc_builder_flow = False
+            return self._pc_builder_reply(state)
+        
+        products = state.pc_builder_data.get("products")
+        if not products:
+            # First visit (or a build started before the step engine): show this step's list
+            state.pc_builder_data.setdefault("components", {})
+            return await self._pc_builder_advance(state, PC_BUILDER_STEP_INDEX[step.key])
         
         # If we have products shown and user asks a question, handle it
-        if state.pc_builder_data.get("ram_products") and self._is_question_or_conversation(state.user_input):
-            return await self._handle_pc_builder_question(state, "ram", state.pc_builder_data["ram_products"])
-        
-        # Check if user is responding with a selection
-        if state.pc_builder_data.get("ram_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            if "0" in user_input_lower or "skip" in user_input_lower:
-                # User skipped RAM - show SSD immediately
-                state.pc_builder_step = "ssd"
-                
-                # Get SSD products
-                ssd_products = await self.ecommerce.get_products(limit=5, category="SSD")
-                state.pc_builder_data["ssd_products"] = ssd_products
-                
-                if not ssd_products:
-                    state.ai_response = "⏭️ Skipped RAM selection.\n\nSorry, no SSD products available right now."
-                    state.in_pc_builder_flow = False
-                else:
-                    response = "⏭️ Skipped RAM selection.\n\n"
-                    response += "💾 **PC Builder - Step 2: Select SSD**\n\n"
-                    response += "Choose an SSD option:\n\n"
-                    
-                    for idx, product in enumerate(ssd_products, 1):
-                        response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                        if product.get('description'):
-                            response += f"   {product['description'][:80]}...\n"
-                        response += "\n"
-                    
-                    response += "**0. Skip this step**\n\n"
-                    response += "Enter the number of your choice (or 0 to skip):"
-                    
-                    state.ai_response = response
-                
-                state.messages.append({
-                    "role": "assistant",
-                    "content": state.ai_response,
-                    "timestamp": datetime.utcnow().isoformat(),
-                })
-                return state
+        if self._is_question_or_conversation(state.user_input):
+            return await self._handle_pc_builder_question(state, step.key, products)
+        
+        selection = parse_selection(state.user_input)
+        if selection is None:
+            # Not a number: show the current list again
+            return await self._pc_builder_advance(state, PC_BUILDER_STEP_INDEX[step.key])
+        
+        if selection == 0:
+            notes = f"⏭️ Skipped {step.label} selection.\n\n"
+        elif selection <= len(products):
+            selected = products[selection - 1]
+            # The build is kept in the flow state and saved once, after the last step
+            state.pc_builder_data.setdefault("components", {})[step.key] = component(selected)
+            notes = f"✅ **{selected['name']}** selected!\n\n"
+        else:
+            state.ai_response = "Invalid selection. Please enter a number from the list or 0 to skip."
+            return self._pc_builder_reply(state)
+        
+        return await self._pc_builder_advance(state, PC_BUILDER_STEP_INDEX[step.key] + 1, notes)
+    
+    async def _pc_builder_advance(self, state: AgentState, index: int, notes: str = "") -> AgentState:
+        """Show the first step from `index` on that has products, or finish the build."""
+        for position in range(index, len(PC_BUILDER_STEPS)):
+            step = PC_BUILDER_STEPS[position]
+            products = await self.pc_candidates.get(step.category)
+            if not products:
+                notes += f"Sorry, no {step.label} products available right now.\n\n"
+                continue
             
-            # User selected a RAM product
-            import re
-            match = re.search(r'(\d+)', user_input_lower)
-            if match:
-                try:
-                    selection = int(match.group(1))
-                    ram_products = state.pc_builder_data.get("ram_products", [])
-                    
-                    if 1 <= selection <= len(ram_products):
-                        selected_ram = ram_products[selection - 1]
-                        
-                        # Add component to build
-                        build_id = state.pc_builder_data.get("build_id")
-                        if build_id:
-                            result = await self.ecommerce.add_component_to_build(
-                                build_id, "ram", selected_ram["_id"]
-                            )
-                            
-                            if result.get("success"):
-                                state.pc_builder_step = "ssd"
-                                
-                                # Get SSD products immediately
-                                ssd_products = await self.ecommerce.get_products(limit=5, category="SSD")
-                                state.pc_builder_data["ssd_products"] = ssd_products
-                                
-                                if not ssd_products:
-                                    state.ai_response = f"✅ **{selected_ram['name']}** selected!\n\nSorry, no SSD products available right now."
-                                    state.in_pc_builder_flow = False
-                                else:
-                                    # Format response with SSD options
-                                    response = f"✅ **{selected_ram['name']}** selected!\n\n"
-                                    response += "💾 **PC Builder - Step 2: Select SSD**\n\n"
-                                    response += "Choose an SSD option:\n\n"
-                                    
-                                    for idx, product in enumerate(ssd_products, 1):
-                                        response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                                        if product.get('description'):
-                                            response += f"   {product['description'][:80]}...\n"
-                                        response += "\n"
-                                    
-                                    response += "**0. Skip this step**\n\n"
-                                    response += "Enter the number of your choice (or 0 to skip):"
-                                    
-                                    state.ai_response = response
-                                
-                                state.messages.append({
-                                    "role": "assistant",
-                                    "content": state.ai_response,
-                                    "timestamp": datetime.utcnow().isoformat(),
-                                })
-                                return state
-                except (ValueError, IndexError):
-                    pass
+            state.pc_builder_step = step.key
+            state.pc_builder_data["products"] = products
+            # Fetch the next step's candidates while the user is choosing
+            if position + 1 < len(PC_BUILDER_STEPS):
+                self.pc_candidates.prefetch(PC_BUILDER_STEPS[position + 1].category)
             
-            state.ai_response = "Invalid selection. Please enter a number from the list or 0 to skip."
-            state.messages.append({
-                "role": "assistant",
-                "content": state.ai_response,
-                "timestamp": datetime.utcnow().isoformat(),
-            })
-            return state
-        
-        # First time - start PC build and show RAM products
-        if not state.pc_builder_data.get("build_id"):
-            # Start PC build
-            result = await self.ecommerce.start_pc_build(state.user_id, state.session_id)
-            if result.get("success"):
-                state.pc_builder_data["build_id"] = result.get("build_id")
-            else:
-                state.ai_response = f"Failed to start PC build: {result.get('message')}"
-                state.in_pc_builder_flow = False
-                return state
+            state.ai_response = notes + render_step(step, products)
+            return self._pc_builder_reply(state)
         
-        # Get RAM products
-        ram_products = await self.ecommerce.get_products(limit=5, category="RAM")
-        state.pc_builder_data["ram_products"] = ram_products
+        return await self._pc_builder_finish(state, notes)
+    
+    async def _pc_builder_finish(self, state: AgentState, notes: str) -> AgentState:
+        """Save the build held in the flow state and show its summary."""
+        state.pc_builder_data.pop("products", None)
+        components = state.pc_builder_data.get("components", {})
         
-        if not ram_products:
-            state.ai_response = "Sorry, no RAM products available right now."
+        if not components:
+            state.ai_response = notes + "No components were selected, so there is no build to save. You can start a new build anytime!"
             state.in_pc_builder_flow = False
-            return state
+            state.pc_builder_step = "none"
+            state.pc_builder_data = {}
+            return self._pc_builder_reply(state)
         
-        # Format response with numbered options
-        response = "🖥️ **PC Builder - Step 1: Select RAM**\n\n"
-        response += "Choose a RAM option:\n\n"
-        
-        for idx, product in enumerate(ram_products, 1):
-            response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-            if product.get('description'):
-                response += f"   {product['description'][:80]}...\n"
-            response += "\n"
-        
-        response += "**0. Skip this step**\n\n"
-        response += "Enter the number of your choice (or 0 to skip):"
+        result = await self.ecommerce.save_pc_build(state.user_id, state.session_id, components)
+        if not result.get("success"):
+            state.ai_response = notes + f"Failed to save PC build: {result.get('message')}"
+            state.in_pc_builder_flow = False
+            state.pc_builder_step = "none"
+            state.pc_builder_data = {}
+            return self._pc_builder_reply(state)
         
-        state.ai_response = response
+        state.pc_builder_step = "completed"
+        state.pc_builder_data["build_id"] = result["build_id"]
+        state.ai_response = notes + render_summary(result["pcBuild"])
+        return self._pc_builder_reply(state)
+    
+    def _pc_builder_reply(self, state: AgentState) -> AgentState:
         state.messages.append({
             "role": "assistant",
             "content": state.ai_response,
@@ -2290,832 +2223,6 @@ Keep your response concise and helpful."""
         })
         return state
     
-    async def _pc_builder_ssd_node(self, state: AgentState) -> AgentState:
-        """Handle SSD selection step."""
-        print("[debug] PC Builder: SSD step")
-        
-        # Ensure we're marked as in PC builder flow
-        state.in_pc_builder_flow = True
-        state.pc_builder_step = "ssd"
-        
-        user_input_lower = state.user_input.lower() if state.user_input else ""
-        
-        # If we have products shown and user asks a question, handle it
-        if state.pc_builder_data.get("ssd_products") and self._is_question_or_conversation(state.user_input):
-            return await self._handle_pc_builder_question(state, "ssd", state.pc_builder_data["ssd_products"])
-        
-        # Check if user is responding with a selection
-        if state.pc_builder_data.get("ssd_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            if "0" in user_input_lower or "skip" in user_input_lower:
-                # User skipped SSD - show CPU immediately
-                state.pc_builder_step = "cpu"
-                
-                # Get CPU products
-                cpu_products = await self.ecommerce.get_products(limit=5, category="CPU")
-                state.pc_builder_data["cpu_products"] = cpu_products
-                
-                if not cpu_products:
-                    state.ai_response = "⏭️ Skipped SSD selection.\n\nSorry, no CPU products available right now."
-                    state.in_pc_builder_flow = False
-                else:
-                    response = "⏭️ Skipped SSD selection.\n\n"
-                    response += "⚙️ **PC Builder - Step 3: Select CPU**\n\n"
-                    response += "Choose a CPU option:\n\n"
-                    
-                    for idx, product in enumerate(cpu_products, 1):
-                        response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                        if product.get('description'):
-                            response += f"   {product['description'][:80]}...\n"
-                        response += "\n"
-                    
-                    response += "**0. Skip this step**\n\n"
-                    response += "Enter the number of your choice (or 0 to skip):"
-                    
-                    state.ai_response = response
-                
-                state.messages.append({
-                    "role": "assistant",
-                    "content": state.ai_response,
-                    "timestamp": datetime.utcnow().isoformat(),
-                })
-                return state
-            
-            # User selected an SSD product
-            import re
-            match = re.search(r'(\d+)', user_input_lower)
-            if match:
-                try:
-                    selection = int(match.group(1))
-                    ssd_products = state.pc_builder_data.get("ssd_products", [])
-                    
-                    if 1 <= selection <= len(ssd_products):
-                        selected_ssd = ssd_products[selection - 1]
-                        
-                        # Add component to build
-                        build_id = state.pc_builder_data.get("build_id")
-                        if build_id:
-                            result = await self.ecommerce.add_component_to_build(
-                                build_id, "ssd", selected_ssd["_id"]
-                            )
-                            
-                            if result.get("success"):
-                                state.pc_builder_step = "cpu"
-                                
-                                # Get CPU products immediately
-                                cpu_products = await self.ecommerce.get_products(limit=5, category="CPU")
-                                state.pc_builder_data["cpu_products"] = cpu_products
-                                
-                                if not cpu_products:
-                                    state.ai_response = f"✅ **{selected_ssd['name']}** selected!\n\nSorry, no CPU products available right now."
-                                    state.in_pc_builder_flow = False
-                                else:
-                                    # Format response with CPU options
-                                    response = f"✅ **{selected_ssd['name']}** selected!\n\n"
-                                    response += "⚙️ **PC Builder - Step 3: Select CPU**\n\n"
-                                    response += "Choose a CPU option:\n\n"
-                                    
-                                    for idx, product in enumerate(cpu_products, 1):
-                                        response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                                        if product.get('description'):
-                                            response += f"   {product['description'][:80]}...\n"
-                                        response += "\n"
-                                    
-                                    response += "**0. Skip this step**\n\n"
-                                    response += "Enter the number of your choice (or 0 to skip):"
-                                    
-                                    state.ai_response = response
-                                
-                                state.messages.append({
-                                    "role": "assistant",
-                                    "content": state.ai_response,
-                                    "timestamp": datetime.utcnow().isoformat(),
-                                })
-                                return state
-                except (ValueError, IndexError):
-                    pass
-            
-            state.ai_response = "Invalid selection. Please enter a number from the list or 0 to skip."
-            state.messages.append({
-                "role": "assistant",
-                "content": state.ai_response,
-                "timestamp": datetime.utcnow().isoformat(),
-            })
-            return state
-        
-        # Get SSD products
-        ssd_products = await self.ecommerce.get_products(limit=5, category="SSD")
-        state.pc_builder_data["ssd_products"] = ssd_products
-        
-        if not ssd_products:
-            state.ai_response = "Sorry, no SSD products available right now."
-            state.pc_builder_step = "cpu"
-            return state
-        
-        # Format response with numbered options
-        response = "💾 **PC Builder - Step 2: Select SSD**\n\n"
-        response += "Choose an SSD option:\n\n"
-        
-        for idx, product in enumerate(ssd_products, 1):
-            response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-            if product.get('description'):
-                response += f"   {product['description'][:80]}...\n"
-            response += "\n"
-        
-        response += "**0. Skip this step**\n\n"
-        response += "Enter the number of your choice (or 0 to skip):"
-        
-        state.ai_response = response
-        return state
-    
-    async def _pc_builder_cpu_node(self, state: AgentState) -> AgentState:
-        """Handle CPU selection step."""
-        print("[debug] PC Builder: CPU step")
-        
-        # Ensure we're marked as in PC builder flow
-        state.in_pc_builder_flow = True
-        state.pc_builder_step = "cpu"
-        
-        user_input_lower = state.user_input.lower() if state.user_input else ""
-        
-        # If we have products shown and user asks a question, handle it
-        if state.pc_builder_data.get("cpu_products") and self._is_question_or_conversation(state.user_input):
-            return await self._handle_pc_builder_question(state, "cpu", state.pc_builder_data["cpu_products"])
-        
-        # Check if user is responding with a selection
-        if state.pc_builder_data.get("cpu_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            if "0" in user_input_lower or "skip" in user_input_lower:
-                # User skipped CPU - move to GPU
-                state.pc_builder_step = "gpu"
-                
-                # Immediately show GPU products
-                gpu_products = await self.ecommerce.get_products(limit=5, category="GPU")
-                state.pc_builder_data["gpu_products"] = gpu_products
-                
-                if not gpu_products:
-                    state.ai_response = "⏭️ Skipped CPU selection.\n\nSorry, no GPU products available right now."
-                    state.pc_builder_step = "psu"
-                    return state
-                
-                # Format GPU response
-                response = "⏭️ Skipped CPU selection.\n\n"
-                response += "🎮 **PC Builder - Step 4: Select GPU**\n\n"
-                response += "Choose a GPU option:\n\n"
-                
-                for idx, product in enumerate(gpu_products, 1):
-                    response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                    if product.get('description'):
-                        response += f"   {product['description'][:80]}...\n"
-                    response += "\n"
-                
-                response += "**0. Skip this step**\n\n"
-                response += "Enter the number of your choice (or 0 to skip):"
-                
-                state.ai_response = response
-                return state
-            
-            # User selected a CPU product
-            import re
-            match = re.search(r'(\d+)', user_input_lower)
-            if match:
-                try:
-                    selection = int(match.group(1))
-                    cpu_products = state.pc_builder_data.get("cpu_products", [])
-                    
-                    if 1 <= selection <= len(cpu_products):
-                        selected_cpu = cpu_products[selection - 1]
-                        
-                        # Add component to build
-                        build_id = state.pc_builder_data.get("build_id")
-                        if build_id:
-                            result = await self.ecommerce.add_component_to_build(
-                                build_id, "cpu", selected_cpu["_id"]
-                            )
-                            
-                            if result.get("success"):
-                                state.pc_builder_step = "gpu"
-                                
-                                # Immediately show GPU products
-                                gpu_products = await self.ecommerce.get_products(limit=5, category="GPU")
-                                state.pc_builder_data["gpu_products"] = gpu_products
-                                
-                                if not gpu_products:
-                                    state.ai_response = f"✅ **{selected_cpu['name']}** selected!\n\nSorry, no GPU products available right now."
-                                    state.pc_builder_step = "psu"
-                                    return state
-                                
-                                # Format GPU response
-                                response = f"✅ **{selected_cpu['name']}** selected!\n\n"
-                                response += "🎮 **PC Builder - Step 4: Select GPU**\n\n"
-                                response += "Choose a GPU option:\n\n"
-                                
-                                for idx, product in enumerate(gpu_products, 1):
-                                    response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                                    if product.get('description'):
-                                        response += f"   {product['description'][:80]}...\n"
-                                    response += "\n"
-                                
-                                response += "**0. Skip this step**\n\n"
-                                response += "Enter the number of your choice (or 0 to skip):"
-                                
-                                state.ai_response = response
-                                return state
-                except (ValueError, IndexError):
-                    pass
-            
-            state.ai_response = "Invalid selection. Please enter a number from the list or 0 to skip."
-            return state
-        
-        # Get CPU products
-        cpu_products = await self.ecommerce.get_products(limit=5, category="CPU")
-        state.pc_builder_data["cpu_products"] = cpu_products
-        
-        if not cpu_products:
-            state.ai_response = "Sorry, no CPU products available right now."
-            state.pc_builder_step = "completed"
-            return state
-        
-        # Format response with numbered options
-        response = "⚙️ **PC Builder - Step 3: Select CPU**\n\n"
-        response += "Choose a CPU option:\n\n"
-        
-        for idx, product in enumerate(cpu_products, 1):
-            response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-            if product.get('description'):
-                response += f"   {product['description'][:80]}...\n"
-            response += "\n"
-        
-        response += "**0. Skip this step**\n\n"
-        response += "Enter the number of your choice (or 0 to skip):"
-        
-        state.ai_response = response
-        return state
-    
-    async def _pc_builder_gpu_node(self, state: AgentState) -> AgentState:
-        """Handle GPU selection step."""
-        print("[debug] PC Builder: GPU step")
-        
-        # Ensure we're marked as in PC builder flow
-        state.in_pc_builder_flow = True
-        state.pc_builder_step = "gpu"
-        
-        user_input_lower = state.user_input.lower() if state.user_input else ""
-        
-        # If we have products shown and user asks a question, handle it
-        if state.pc_builder_data.get("gpu_products") and self._is_question_or_conversation(state.user_input):
-            return await self._handle_pc_builder_question(state, "gpu", state.pc_builder_data["gpu_products"])
-        
-        # Always fetch GPU products fresh if not showing them for the first time
-        if not state.pc_builder_data.get("gpu_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            gpu_products = await self.ecommerce.get_products(limit=5, category="GPU")
-            state.pc_builder_data["gpu_products"] = gpu_products
-            print(f"[debug] Fetched {len(gpu_products)} GPU products for selection")
-        
-        # Check if user is responding with a selection
-        if state.pc_builder_data.get("gpu_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            if "0" in user_input_lower or "skip" in user_input_lower:
-                # User skipped GPU - move to PSU
-                state.pc_builder_step = "psu"
-                
-                # Immediately show PSU products
-                psu_products = await self.ecommerce.get_products(limit=5, category="PSU")
-                state.pc_builder_data["psu_products"] = psu_products
-                
-                if not psu_products:
-                    state.ai_response = "⏭️ Skipped GPU selection.\n\nSorry, no PSU products available right now."
-                    state.pc_builder_step = "completed"
-                    return state
-                
-                # Format PSU response
-                response = "⏭️ Skipped GPU selection.\n\n"
-                response += "⚡ **PC Builder - Step 5: Select PSU**\n\n"
-                response += "Choose a PSU option:\n\n"
-                
-                for idx, product in enumerate(psu_products, 1):
-                    response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                    if product.get('description'):
-                        response += f"   {product['description'][:80]}...\n"
-                    response += "\n"
-                
-                response += "**0. Skip this step**\n\n"
-                response += "Enter the number of your choice (or 0 to skip):"
-                
-                state.ai_response = response
-                return state
-            
-            # User selected a GPU product
-            import re
-            match = re.search(r'(\d+)', user_input_lower)
-            if match:
-                try:
-                    selection = int(match.group(1))
-                    gpu_products = state.pc_builder_data.get("gpu_products", [])
-                    
-                    print(f"[debug] GPU selection: {selection}, available products: {len(gpu_products)}")
-                    
-                    if 1 <= selection <= len(gpu_products):
-                        selected_gpu = gpu_products[selection - 1]
-                        
-                        # Add component to build
-                        build_id = state.pc_builder_data.get("build_id")
-                        if build_id:
-                            result = await self.ecommerce.add_component_to_build(
-                                build_id, "gpu", selected_gpu["_id"]
-                            )
-                            
-                            if result.get("success"):
-                                state.pc_builder_step = "psu"
-                                
-                                # Immediately show PSU products
-                                psu_products = await self.ecommerce.get_products(limit=5, category="PSU")
-                                state.pc_builder_data["psu_products"] = psu_products
-                                
-                                if not psu_products:
-                                    state.ai_response = f"✅ **{selected_gpu['name']}** selected!\n\nSorry, no PSU products available right now."
-                                    state.pc_builder_step = "completed"
-                                    return state
-                                
-                                # Format PSU response
-                                response = f"✅ **{selected_gpu['name']}** selected!\n\n"
-                                response += "⚡ **PC Builder - Step 5: Select PSU**\n\n"
-                                response += "Choose a PSU option:\n\n"
-                                
-                                for idx, product in enumerate(psu_products, 1):
-                                    response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                                    if product.get('description'):
-                                        response += f"   {product['description'][:80]}...\n"
-                                    response += "\n"
-                                
-                                response += "**0. Skip this step**\n\n"
-                                response += "Enter the number of your choice (or 0 to skip):"
-                                
-                                state.ai_response = response
-                                return state
-                            else:
-                                print(f"[debug] Failed to add GPU: {result.get('message')}")
-                                state.ai_response = f"Failed to add GPU: {result.get('message')}"
-                                return state
-                except (ValueError, IndexError) as e:
-                    print(f"[debug] Exception in GPU selection: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    pass
-            
-            state.ai_response = "Invalid selection. Please enter a number from the list or 0 to skip."
-            return state
-        
-        # Get GPU products
-        gpu_products = await self.ecommerce.get_products(limit=5, category="GPU")
-        state.pc_builder_data["gpu_products"] = gpu_products
-        
-        if not gpu_products:
-            state.ai_response = "Sorry, no GPU products available right now."
-            state.pc_builder_step = "psu"
-            return state
-        
-        # Format response with numbered options
-        response = "🎮 **PC Builder - Step 4: Select GPU**\n\n"
-        response += "Choose a GPU option:\n\n"
-        
-        for idx, product in enumerate(gpu_products, 1):
-            response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-            if product.get('description'):
-                response += f"   {product['description'][:80]}...\n"
-            response += "\n"
-        
-        response += "**0. Skip this step**\n\n"
-        response += "Enter the number of your choice (or 0 to skip):"
-        
-        state.ai_response = response
-        return state
-    
-    async def _pc_builder_psu_node(self, state: AgentState) -> AgentState:
-        """Handle PSU selection step."""
-        print("[debug] PC Builder: PSU step")
-        
-        # Ensure we're marked as in PC builder flow
-        state.in_pc_builder_flow = True
-        state.pc_builder_step = "psu"
-        
-        user_input_lower = state.user_input.lower() if state.user_input else ""
-        
-        # If we have products shown and user asks a question, handle it
-        if state.pc_builder_data.get("psu_products") and self._is_question_or_conversation(state.user_input):
-            return await self._handle_pc_builder_question(state, "psu", state.pc_builder_data["psu_products"])
-        
-        # Always fetch PSU products fresh if not showing them for the first time
-        if not state.pc_builder_data.get("psu_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            psu_products = await self.ecommerce.get_products(limit=5, category="PSU")
-            state.pc_builder_data["psu_products"] = psu_products
-            print(f"[debug] Fetched {len(psu_products)} PSU products for selection")
-        
-        # Check if user is responding with a selection
-        if state.pc_builder_data.get("psu_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            if "0" in user_input_lower or "skip" in user_input_lower:
-                # User skipped PSU - move to next step
-                state.pc_builder_step = "motherboard"
-                state.ai_response = "⏭️ Skipped PSU selection.\n\nLet's continue to the next component."
-                return state
-            
-            # User selected a PSU product
-            import re
-            match = re.search(r'(\d+)', user_input_lower)
-            if match:
-                try:
-                    selection = int(match.group(1))
-                    psu_products = state.pc_builder_data.get("psu_products", [])
-                    
-                    if 1 <= selection <= len(psu_products):
-                        selected_psu = psu_products[selection - 1]
-                        
-                        # Add component to build
-                        build_id = state.pc_builder_data.get("build_id")
-                        if build_id:
-                            result = await self.ecommerce.add_component_to_build(
-                                build_id, "psu", selected_psu["_id"]
-                            )
-                            
-                            if result.get("success"):
-                                state.pc_builder_step = "motherboard"
-                                
-                                # Immediately show motherboard options
-                                motherboard_products = await self.ecommerce.get_products(limit=5, category="Motherboard")
-                                state.pc_builder_data["motherboard_products"] = motherboard_products
-                                
-                                if not motherboard_products:
-                                    state.ai_response = f"✅ **{selected_psu['name']}** selected!\n\nSorry, no Motherboard products available. Moving to next step."
-                                    state.pc_builder_step = "aircooler"
-                                    return state
-                                
-                                # Format response with next step
-                                response = f"✅ **{selected_psu['name']}** selected!\n\n"
-                                response += "🔲 **PC Builder - Step 6: Select Motherboard**\n\n"
-                                response += "Choose a Motherboard option:\n\n"
-                                
-                                for idx, product in enumerate(motherboard_products, 1):
-                                    response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                                    if product.get('description'):
-                                        response += f"   {product['description'][:80]}...\n"
-                                    response += "\n"
-                                
-                                response += "**0. Skip this step**\n\n"
-                                response += "Enter the number of your choice (or 0 to skip):"
-                                
-                                state.ai_response = response
-                                return state
-                except (ValueError, IndexError):
-                    pass
-            
-            state.ai_response = "Invalid selection. Please enter a number from the list or 0 to skip."
-            return state
-        
-        # Get PSU products
-        psu_products = await self.ecommerce.get_products(limit=5, category="PSU")
-        state.pc_builder_data["psu_products"] = psu_products
-        
-        if not psu_products:
-            state.ai_response = "Sorry, no PSU products available right now."
-            state.pc_builder_step = "completed"
-            return state
-        
-        # Format response with numbered options
-        response = "⚡ **PC Builder - Step 5: Select PSU**\n\n"
-        response += "Choose a PSU option:\n\n"
-        
-        for idx, product in enumerate(psu_products, 1):
-            response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-            if product.get('description'):
-                response += f"   {product['description'][:80]}...\n"
-            response += "\n"
-        
-        response += "**0. Skip this step**\n\n"
-        response += "Enter the number of your choice (or 0 to skip):"
-        
-        state.ai_response = response
-        return state
-    
-    async def _pc_builder_motherboard_node(self, state: AgentState) -> AgentState:
-        """Handle Motherboard selection step."""
-        print("[debug] PC Builder: Motherboard step")
-        
-        # Ensure we're marked as in PC builder flow
-        state.in_pc_builder_flow = True
-        state.pc_builder_step = "motherboard"
-        
-        user_input_lower = state.user_input.lower() if state.user_input else ""
-        
-        # If we have products shown and user asks a question, handle it
-        if state.pc_builder_data.get("motherboard_products") and self._is_question_or_conversation(state.user_input):
-            return await self._handle_pc_builder_question(state, "motherboard", state.pc_builder_data["motherboard_products"])
-        
-        # Always fetch Motherboard products fresh if not showing them for the first time
-        if not state.pc_builder_data.get("motherboard_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            motherboard_products = await self.ecommerce.get_products(limit=5, category="Motherboard")
-            state.pc_builder_data["motherboard_products"] = motherboard_products
-            print(f"[debug] Fetched {len(motherboard_products)} Motherboard products for selection")
-        
-        # Check if user is responding with a selection
-        if state.pc_builder_data.get("motherboard_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            if "0" in user_input_lower or "skip" in user_input_lower:
-                # User skipped Motherboard - move to next step
-                state.pc_builder_step = "aircooler"
-                state.ai_response = "⏭️ Skipped Motherboard selection.\n\nLet's continue to the next component."
-                return state
-            
-            # User selected a Motherboard product
-            import re
-            match = re.search(r'(\d+)', user_input_lower)
-            if match:
-                try:
-                    selection = int(match.group(1))
-                    motherboard_products = state.pc_builder_data.get("motherboard_products", [])
-                    
-                    if 1 <= selection <= len(motherboard_products):
-                        selected_motherboard = motherboard_products[selection - 1]
-                        
-                        # Add component to build
-                        build_id = state.pc_builder_data.get("build_id")
-                        if build_id:
-                            result = await self.ecommerce.add_component_to_build(
-                                build_id, "motherboard", selected_motherboard["_id"]
-                            )
-                            
-                            if result.get("success"):
-                                state.pc_builder_step = "aircooler"
-                                
-                                # Immediately show aircooler options
-                                aircooler_products = await self.ecommerce.get_products(limit=5, category="AirCooler")
-                                state.pc_builder_data["aircooler_products"] = aircooler_products
-                                
-                                if not aircooler_products:
-                                    state.ai_response = f"✅ **{selected_motherboard['name']}** selected!\n\nSorry, no Air Cooler products available. Moving to next step."
-                                    state.pc_builder_step = "case"
-                                    return state
-                                
-                                # Format response with next step
-                                response = f"✅ **{selected_motherboard['name']}** selected!\n\n"
-                                response += "❄️ **PC Builder - Step 7: Select Air Cooler**\n\n"
-                                response += "Choose an Air Cooler option:\n\n"
-                                
-                                for idx, product in enumerate(aircooler_products, 1):
-                                    response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                                    if product.get('description'):
-                                        response += f"   {product['description'][:80]}...\n"
-                                    response += "\n"
-                                
-                                response += "**0. Skip this step**\n\n"
-                                response += "Enter the number of your choice (or 0 to skip):"
-                                
-                                state.ai_response = response
-                                return state
-                except (ValueError, IndexError):
-                    pass
-            
-            state.ai_response = "Invalid selection. Please enter a number from the list or 0 to skip."
-            return state
-        
-        # Get Motherboard products
-        motherboard_products = await self.ecommerce.get_products(limit=5, category="Motherboard")
-        state.pc_builder_data["motherboard_products"] = motherboard_products
-        
-        if not motherboard_products:
-            state.ai_response = "Sorry, no Motherboard products available right now."
-            state.pc_builder_step = "aircooler"
-            return state
-        
-        # Format response with numbered options
-        response = "🔲 **PC Builder - Step 6: Select Motherboard**\n\n"
-        response += "Choose a Motherboard option:\n\n"
-        
-        for idx, product in enumerate(motherboard_products, 1):
-            response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-            if product.get('description'):
-                response += f"   {product['description'][:80]}...\n"
-            response += "\n"
-        
-        response += "**0. Skip this step**\n\n"
-        response += "Enter the number of your choice (or 0 to skip):"
-        
-        state.ai_response = response
-        return state
-    
-    async def _pc_builder_aircooler_node(self, state: AgentState) -> AgentState:
-        """Handle Air Cooler selection step."""
-        print("[debug] PC Builder: Air Cooler step")
-        
-        # Ensure we're marked as in PC builder flow
-        state.in_pc_builder_flow = True
-        state.pc_builder_step = "aircooler"
-        
-        user_input_lower = state.user_input.lower() if state.user_input else ""
-        
-        # If we have products shown and user asks a question, handle it
-        if state.pc_builder_data.get("aircooler_products") and self._is_question_or_conversation(state.user_input):
-            return await self._handle_pc_builder_question(state, "aircooler", state.pc_builder_data["aircooler_products"])
-        
-        # Always fetch Air Cooler products fresh if not showing them for the first time
-        if not state.pc_builder_data.get("aircooler_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            aircooler_products = await self.ecommerce.get_products(limit=5, category="AirCooler")
-            state.pc_builder_data["aircooler_products"] = aircooler_products
-            print(f"[debug] Fetched {len(aircooler_products)} Air Cooler products for selection")
-        
-        # Check if user is responding with a selection
-        if state.pc_builder_data.get("aircooler_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            if "0" in user_input_lower or "skip" in user_input_lower:
-                # User skipped Air Cooler - move to next step
-                state.pc_builder_step = "case"
-                state.ai_response = "⏭️ Skipped Air Cooler selection.\n\nLet's continue to the next component."
-                return state
-            
-            # User selected an Air Cooler product
-            import re
-            match = re.search(r'(\d+)', user_input_lower)
-            if match:
-                try:
-                    selection = int(match.group(1))
-                    aircooler_products = state.pc_builder_data.get("aircooler_products", [])
-                    
-                    if 1 <= selection <= len(aircooler_products):
-                        selected_aircooler = aircooler_products[selection - 1]
-                        
-                        # Add component to build
-                        build_id = state.pc_builder_data.get("build_id")
-                        if build_id:
-                            result = await self.ecommerce.add_component_to_build(
-                                build_id, "aircooler", selected_aircooler["_id"]
-                            )
-                            
-                            if result.get("success"):
-                                state.pc_builder_step = "case"
-                                
-                                # Immediately show case options
-                                case_products = await self.ecommerce.get_products(limit=5, category="Case")
-                                state.pc_builder_data["case_products"] = case_products
-                                
-                                if not case_products:
-                                    state.ai_response = f"✅ **{selected_aircooler['name']}** selected!\n\nSorry, no Case products available. Completing build."
-                                    state.pc_builder_step = "completed"
-                                    return state
-                                
-                                # Format response with next step
-                                response = f"✅ **{selected_aircooler['name']}** selected!\n\n"
-                                response += "📦 **PC Builder - Step 8: Select Case**\n\n"
-                                response += "Choose a Case option:\n\n"
-                                
-                                for idx, product in enumerate(case_products, 1):
-                                    response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-                                    if product.get('description'):
-                                        response += f"   {product['description'][:80]}...\n"
-                                    response += "\n"
-                                
-                                response += "**0. Skip this step**\n\n"
-                                response += "Enter the number of your choice (or 0 to skip):"
-                                
-                                state.ai_response = response
-                                return state
-                except (ValueError, IndexError):
-                    pass
-            
-            state.ai_response = "Invalid selection. Please enter a number from the list or 0 to skip."
-            return state
-        
-        # Get Air Cooler products
-        aircooler_products = await self.ecommerce.get_products(limit=5, category="AirCooler")
-        state.pc_builder_data["aircooler_products"] = aircooler_products
-        
-        if not aircooler_products:
-            state.ai_response = "Sorry, no Air Cooler products available right now."
-            state.pc_builder_step = "case"
-            return state
-        
-        # Format response with numbered options
-        response = "❄️ **PC Builder - Step 7: Select Air Cooler**\n\n"
-        response += "Choose an Air Cooler option:\n\n"
-        
-        for idx, product in enumerate(aircooler_products, 1):
-            response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-            if product.get('description'):
-                response += f"   {product['description'][:80]}...\n"
-            response += "\n"
-        
-        response += "**0. Skip this step**\n\n"
-        response += "Enter the number of your choice (or 0 to skip):"
-        
-        state.ai_response = response
-        return state
-    
-    async def _pc_builder_case_node(self, state: AgentState) -> AgentState:
-        """Handle Case selection step."""
-        print("[debug] PC Builder: Case step")
-        
-        # Ensure we're marked as in PC builder flow
-        state.in_pc_builder_flow = True
-        state.pc_builder_step = "case"
-        
-        user_input_lower = state.user_input.lower() if state.user_input else ""
-        
-        # If we have products shown and user asks a question, handle it
-        if state.pc_builder_data.get("case_products") and self._is_question_or_conversation(state.user_input):
-            return await self._handle_pc_builder_question(state, "case", state.pc_builder_data["case_products"])
-        
-        # Always fetch Case products fresh if not showing them for the first time
-        if not state.pc_builder_data.get("case_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            case_products = await self.ecommerce.get_products(limit=5, category="Case")
-            state.pc_builder_data["case_products"] = case_products
-            print(f"[debug] Fetched {len(case_products)} Case products for selection")
-        
-        # Check if user is responding with a selection
-        if state.pc_builder_data.get("case_products") and (user_input_lower.strip().isdigit() or "skip" in user_input_lower):
-            if "0" in user_input_lower or "skip" in user_input_lower:
-                # User skipped Case - complete build
-                state.pc_builder_step = "completed"
-                state.ai_response = "⏭️ Skipped Case selection.\n\nYour PC build is complete. Would you like to add components to your cart?"
-                return state
-            
-            # User selected a Case product
-            import re
-            match = re.search(r'(\d+)', user_input_lower)
-            if match:
-                try:
-                    selection = int(match.group(1))
-                    case_products = state.pc_builder_data.get("case_products", [])
-                    
-                    if 1 <= selection <= len(case_products):
-                        selected_case = case_products[selection - 1]
-                        
-                        # Add component to build
-                        build_id = state.pc_builder_data.get("build_id")
-                        if build_id:
-                            result = await self.ecommerce.add_component_to_build(
-                                build_id, "case", selected_case["_id"]
-                            )
-                            
-                            if result.get("success"):
-                                state.pc_builder_step = "completed"
-                                
-                                # Get build summary
-                                build_result = await self.ecommerce.get_pc_build(build_id)
-                                if build_result.get("success"):
-                                    build = build_result["pcBuild"]
-                                    components = build.get("components", {})
-                                    total_price = build.get("totalPrice", 0)
-                                    
-                                    summary = f"✅ **{selected_case['name']}** selected!\n\n"
-                                    summary += "🎉 **Your PC Build is Complete!**\n\n"
-                                    summary += "**Components:**\n"
-                                    if "ram" in components:
-                                        summary += f"• RAM: {components['ram']['name']} (${components['ram']['price']})\n\n"
-                                    if "ssd" in components:
-                                        summary += f"• SSD: {components['ssd']['name']} (${components['ssd']['price']})\n\n"
-                                    if "cpu" in components:
-                                        summary += f"• CPU: {components['cpu']['name']} (${components['cpu']['price']})\n\n"
-                                    if "gpu" in components:
-                                        summary += f"• GPU: {components['gpu']['name']} (${components['gpu']['price']})\n\n"
-                                    if "psu" in components:
-                                        summary += f"• PSU: {components['psu']['name']} (${components['psu']['price']})\n\n"
-                                    if "motherboard" in components:
-                                        summary += f"• Motherboard: {components['motherboard']['name']} (${components['motherboard']['price']})\n\n"
-                                    if "aircooler" in components:
-                                        summary += f"• Air Cooler: {components['aircooler']['name']} (${components['aircooler']['price']})\n\n"
-                                    if "case" in components:
-                                        summary += f"• Case: {components['case']['name']} (${components['case']['price']})\n\n"
-                                    summary += f"\n**Total: ${total_price}**\n\n"
-                                    summary += "Would you like to add these components to your cart? (yes/no)"
-                                    
-                                    state.ai_response = summary
-                                else:
-                                    state.ai_response = f"✅ Build complete! {result.get('message')}"
-                                return state
-                except (ValueError, IndexError):
-                    pass
-            
-            state.ai_response = "Invalid selection. Please enter a number from the list or 0 to skip."
-            return state
-        
-        # Get Case products
-        case_products = await self.ecommerce.get_products(limit=5, category="Case")
-        state.pc_builder_data["case_products"] = case_products
-        
-        if not case_products:
-            state.ai_response = "Sorry, no Case products available right now."
-            state.pc_builder_step = "completed"
-            return state
-        
-        # Format response with numbered options
-        response = "📦 **PC Builder - Step 8: Select Case**\n\n"
-        response += "Choose a Case option:\n\n"
-        
-        for idx, product in enumerate(case_products, 1):
-            response += f"**{idx}. {product['name']}** - ${product['price']}\n"
-            if product.get('description'):
-                response += f"   {product['description'][:80]}...\n"
-            response += "\n"
-        
-        response += "**0. Skip this step**\n\n"
-        response += "Enter the number of your choice (or 0 to skip):"
-        
-        state.ai_response = response
-        return state
-    
     async def _pc_builder_completed_node(self, state: AgentState) -> AgentState:
         """Handle completion and cart addition."""
         print("[debug] PC Builder: Completed step")
@@ -3141,7 +2248,7 @@ Keep your response concise and helpful."""
         state.pc_builder_step = "none"
         state.pc_builder_data = {}
         print("[debug] PC Builder completed, exiting flow")
-        return state
+        return self._pc_builder_reply(state)
 
     def _build_graph(self) -> StateGraph:
         """Build the LangGraph workflow with dual paths: deterministic checkout flow + general LLM flow."""
@@ -3157,14 +2264,9 @@ Keep your response concise and helpful."""
         workflow.add_node("save_memory", self._save_memory)
         
         # Add PC Builder flow nodes
-        workflow.add_node("pc_builder_ram", self._pc_builder_ram_node)
-        workflow.add_node("pc_builder_ssd", self._pc_builder_ssd_node)
-        workflow.add_node("pc_builder_cpu", self._pc_builder_cpu_node)
-        workflow.add_node("pc_builder_gpu", self._pc_builder_gpu_node)
-        workflow.add_node("pc_builder_psu", self._pc_builder_psu_node)
-        workflow.add_node("pc_builder_motherboard", self._pc_builder_motherboard_node)
-        workflow.add_node("pc_builder_aircooler", self._pc_builder_aircooler_node)
-        workflow.add_node("pc_builder_case", self._pc_builder_case_node)
+        # One node per step, all run by the step engine
+        for step in PC_BUILDER_STEPS:
+            workflow.add_node(f"pc_builder_{step.key}", self._pc_builder_step_node)
         workflow.add_node("pc_builder_completed", self._pc_builder_completed_node)
         
         # Add checkout-specific nodes for deterministic flow
@@ -3183,14 +2285,7 @@ Keep your response concise and helpful."""
             self._determine_flow_route,
             {
                 "general": "agent_llm",
-                "pc_builder_ram": "pc_builder_ram",
-                "pc_builder_ssd": "pc_builder_ssd",
-                "pc_builder_cpu": "pc_builder_cpu",
-                "pc_builder_gpu": "pc_builder_gpu",
-                "pc_builder_psu": "pc_builder_psu",
-                "pc_builder_motherboard": "pc_builder_motherboard",
-                "pc_builder_aircooler": "pc_builder_aircooler",
-                "pc_builder_case": "pc_builder_case",
+                **{f"pc_builder_{step.key}": f"pc_builder_{step.key}" for step in PC_BUILDER_STEPS},
                 "pc_builder_completed": "pc_builder_completed",
                 "checkout_shipping": "checkout_shipping",
                 "checkout_coupon": "checkout_coupon",
@@ -3245,34 +2340,57 @@ Keep your response concise and helpful."""
         workflow.add_edge("save_memory", END)
         
         # PC Builder flow edges
-        workflow.add_edge("pc_builder_ram", "save_memory")
-        workflow.add_edge("pc_builder_ssd", "save_memory")
-        workflow.add_edge("pc_builder_cpu", "save_memory")
-        workflow.add_edge("pc_builder_gpu", "save_memory")
-        workflow.add_edge("pc_builder_psu", "save_memory")
-        workflow.add_edge("pc_builder_motherboard", "save_memory")
-        workflow.add_edge("pc_builder_aircooler", "save_memory")
-        workflow.add_edge("pc_builder_case", "save_memory")
+        for step in PC_BUILDER_STEPS:
+            workflow.add_edge(f"pc_builder_{step.key}", "save_memory")
         workflow.add_edge("pc_builder_completed", "save_memory")
 
         # Set entry point
         workflow.set_entry_point("load_memory")
 
-        # Compile with increased recursion limit to handle multi-step checkout
-        compiled = workflow.compile()
+        # Checkpoints are keyed by session (thread_id), so each turn starts from the saved flow state
+        compiled = workflow.compile(checkpointer=self.checkpointer)
         return compiled
 
+    async def get_graph(self):
+        """The compiled graph, opening its checkpointer and compiling on first use"""
+        if self.graph is None:
+            async with self._graph_lock:
+                if self.graph is None:
+                    self.checkpointer, self.checkpoint_durable = await create_checkpointer(
+                        self.config.mongo_uri, self.config.db_name
+                    )
+                    self.graph = self._build_graph()
+        return self.graph
+
+    def _turn_input(self, message: str, session_id: str, user_id: str) -> Dict:
+        """
+        Graph input for one turn
+
+        Only per-turn values are passed, so the checkpointed flow state of the
+        session is kept; an empty user_id keeps the one saved for the session.
+        """
+        turn = {"user_input": message, "session_id": session_id}
+        if user_id:
+            turn["user_id"] = user_id
+        return turn
+
+    def _turn_config(self, session_id: str, recursion_limit: int = 25) -> Dict:
+        config = {"recursion_limit": recursion_limit}
+        if self.checkpointer is not None:
+            config["configurable"] = {"thread_id": session_id}
+        return config
+
     async def _load_memory(self, state: AgentState) -> AgentState:
         """Load conversation history from MongoDB - ultra-minimal for speed"""
-        # Load recent messages to preserve multi-step checkout flow context
-        messages = await self.memory_store.load_conversation(state.session_id, limit=6)
+        # Recent messages (to preserve multi-step checkout flow context) and metadata in one read
+        messages, metadata = await self.memory_store.load_session(state.session_id, limit=6)
         state.messages = messages
+        state.loaded_message_count = len(messages)
+        state.loaded_metadata = copy.deepcopy(metadata) if metadata else {}
         
         # Check for user_id in metadata first (faster), then fallback to scanning messages
-        doc = self.memory_store.conversations.find_one({"session_id": state.session_id})
-        print(f"[debug] MongoDB doc found: {doc is not None}")
-        if doc and doc.get("metadata"):
-            metadata = doc["metadata"]
+        print(f"[debug] MongoDB doc found: {metadata is not None}")
+        if metadata:
             print(f"[debug] Metadata keys: {list(metadata.keys())}")
             print(f"[debug] Metadata in_checkout_flow: {metadata.get('in_checkout_flow')}")
             print(f"[debug] Metadata checkout_step: {metadata.get('checkout_step')}")
@@ -3281,27 +2399,31 @@ Keep your response concise and helpful."""
                 state.user_id = metadata["user_id"]
                 print(f"[debug] Loaded user_id from metadata: {state.user_id}")
             
-            # Restore checkout flow state (always restore, even if False)
-            if "in_checkout_flow" in metadata:
-                state.in_checkout_flow = metadata.get("in_checkout_flow", False)
-                state.checkout_step = metadata.get("checkout_step", "none")
-                state.checkout_data = metadata.get("checkout_data", {})
-                print(f"[debug] Restored checkout flow: step={state.checkout_step}, in_flow={state.in_checkout_flow}")
-                print(f"[debug] Restored checkout_data keys: {list(state.checkout_data.keys())}")
+            if self.checkpoint_durable and state.checkpointed:
+                # Flow state came in typed from the session checkpoint
+                print(f"[debug] Resumed from checkpoint: checkout step={state.checkout_step}, pc builder step={state.pc_builder_step}")
             else:
-                print(f"[debug] No checkout flow state found in metadata")
+                # Restore checkout flow state (always restore, even if False)
+                if "in_checkout_flow" in metadata:
+                    state.in_checkout_flow = metadata.get("in_checkout_flow", False)
+                    state.checkout_step = metadata.get("checkout_step", "none")
+                    state.checkout_data = metadata.get("checkout_data", {})
+                    print(f"[debug] Restored checkout flow: step={state.checkout_step}, in_flow={state.in_checkout_flow}")
+                    print(f"[debug] Restored checkout_data keys: {list(state.checkout_data.keys())}")
+                else:
+                    print(f"[debug] No checkout flow state found in metadata")
             
-            # Restore PC builder flow state (always restore, even if False)
-            if "in_pc_builder_flow" in metadata:
-                state.in_pc_builder_flow = metadata.get("in_pc_builder_flow", False)
-                state.pc_builder_step = metadata.get("pc_builder_step", "none")
-                state.pc_builder_data = metadata.get("pc_builder_data", {})
-                print(f"[debug] Restored PC builder flow: step={state.pc_builder_step}, in_flow={state.in_pc_builder_flow}")
-                print(f"[debug] Restored pc_builder_data keys: {list(state.pc_builder_data.keys())}")
-            else:
-                print(f"[debug] No PC builder flow state found in metadata")
+                # Restore PC builder flow state (always restore, even if False)
+                if "in_pc_builder_flow" in metadata:
+                    state.in_pc_builder_flow = metadata.get("in_pc_builder_flow", False)
+                    state.pc_builder_step = metadata.get("pc_builder_step", "none")
+                    state.pc_builder_data = metadata.get("pc_builder_data", {})
+                    print(f"[debug] Restored PC builder flow: step={state.pc_builder_step}, in_flow={state.in_pc_builder_flow}")
+                    print(f"[debug] Restored pc_builder_data keys: {list(state.pc_builder_data.keys())}")
+                else:
+                    print(f"[debug] No PC builder flow state found in metadata")
         else:
-            print(f"[debug] No metadata found in doc")
+            print(f"[debug] No metadata found for session")
             # Fallback: scan messages (only if not in metadata)
             for msg in reversed(messages):  # Check most recent first
                 if msg.get("role") == "system" and msg.get("user_id"):
@@ -3390,6 +2512,31 @@ Keep your response concise and helpful."""
                 traceback.print_exc()
                 # Fall through to LLM if direct call fails
         
+        # lc_messages is rebuilt every turn, so it is empty only on the turn's first pass; later
+        # passes come back from _tools_node and must not repeat the fast path or the cache lookup
+        first_pass = not state.lc_messages
+
+        # FAST PATH: deterministic read-only intents (cart, orders, categories...) go straight to their tool
+        if first_pass and self.intent_router is not None:
+            route = self.intent_router.route(state.user_input, state.user_id)
+            if route:
+                reply = None
+                try:
+                    result = await self.tool_executor.invoke(route["tool"], route["args"])
+                    reply = render_intent(route["intent"], result)
+                except Exception as e:
+                    print(f"[ERROR] Fast path {route['tool']} failed: {e}")
+                if reply:
+                    print(f"[debug] Fast path: {route['intent']} via {route['source']} ({route['confidence']:.2f}), skipping LLM")
+                    state.ai_response = reply
+                    state.messages.append({
+                        "role": "assistant",
+                        "content": state.ai_response,
+                        "timestamp": datetime.utcnow().isoformat(),
+                    })
+                    return state
+                # Otherwise fall through to the LLM
+        
         # First pass: build LangChain message history
         if not state.lc_messages:
             system_prompt = (
@@ -3441,8 +2588,8 @@ Keep your response concise and helpful."""
 
             state.lc_messages = msgs
 
-        # Check cache for simple queries (no tool calls needed)
-        if state.user_input and not any(keyword in state.user_input.lower() for keyword in [
+        # Check cache for simple queries (no tool calls needed), once per turn
+        if first_pass and state.user_input and not any(keyword in state.user_input.lower() for keyword in [
             'cart', 'order', 'buy', 'purchase', 'add', 'remove', 'update', 'apply', 'coupon'
         ]):
             # Create context summary for cache key
@@ -3451,7 +2598,9 @@ Keep your response concise and helpful."""
                 recent_context = " ".join([msg.get("content", "")[:50] for msg in state.messages[-3:]])
                 context_summary = recent_context[:200]
             
-            cached_response = self.response_cache.get(state.user_input, context_summary)
+            cached_response = await self.response_cache.get(state.user_input, context_summary)
+            if not cached_response and self.semantic_cache is not None:
+                cached_response = await self._semantic_cache_call(self.semantic_cache.get, state.user_input)
             if cached_response:
                 print(f"[debug] Using cached response, skipping LLM call")
                 state.ai_response = cached_response
@@ -3466,11 +2615,13 @@ Keep your response concise and helpful."""
         print(f"[debug] Calling LLM with {len(state.lc_messages)} messages...")
         try:
             # Add timeout to individual LLM call
+            llm_started = time.monotonic()
             response = await asyncio.wait_for(
                 self.llm_with_tools.ainvoke(state.lc_messages),
                 timeout=60.0  # 60 second timeout for LLM call (increased for better thinking time)
             )
-            print(f"[debug] LLM response received")
+            llm_seconds = time.monotonic() - llm_started
+            print(f"[debug] LLM response received in {llm_seconds:.2f}s")
             state.lc_messages.append(response)
 
             # If the LLM decided to answer directly (no tool calls), finalize response
@@ -3508,7 +2659,10 @@ Keep your response concise and helpful."""
                     if len(state.messages) > 0:
                         recent_context = " ".join([msg.get("content", "")[:50] for msg in state.messages[-3:]])
                         context_summary = recent_context[:200]
-                    self.response_cache.set(state.user_input, response.content, context_summary)
+                    await self.response_cache.set(state.user_input, response.content, context_summary)
+                    if self.semantic_cache is not None:
+                        await self._semantic_cache_call(self.semantic_cache.set, state.user_input,
+                                                        response.content, llm_seconds)
                 
                 state.messages.append(
                     {
@@ -3540,21 +2694,19 @@ Keep your response concise and helpful."""
             state.ai_response = f"I encountered an error: {str(e)}. Please try again."
             return state
 
-    async def _tools_node(self, state: AgentState) -> AgentState:
-        """Wrapper around ToolNode to execute tools based on the last AIMessage.tool_calls."""
-        # ToolNode expects either a list of messages or {"messages": [...]}
+    async def _tools_node(self, state: AgentState, config: RunnableConfig) -> AgentState:
+        """Execute the tool calls of the last AIMessage (read-only calls concurrently, each with a deadline)."""
         if not state.lc_messages:
             # Nothing to do
             return state
 
         try:
             print(f"[debug] Executing tools...")
-            # Call underlying ToolNode; it will run all requested tools
-            result = await self.tool_node.ainvoke({"messages": state.lc_messages})
+            tool_calls = getattr(state.lc_messages[-1], "tool_calls", None) or []
+            result = await self.tool_executor.run(tool_calls, config)
             print(f"[debug] Tools execution completed")
 
-            # ToolNode may return a list of ToolMessages or {"messages": [...]}
-            if isinstance(result, list):
+            if result:
                 for msg in result:
                     state.lc_messages.append(msg)
                     content = getattr(msg, "content", "") or ""
@@ -3562,14 +2714,6 @@ Keep your response concise and helpful."""
                         state.context["last_cart_tool"] = content
                         print(f"[debug] Captured cart tool output: {content[:200]}")
                 print(f"[debug] Added {len(result)} tool messages")
-            elif isinstance(result, dict) and "messages" in result:
-                for msg in result["messages"]:
-                    state.lc_messages.append(msg)
-                    content = getattr(msg, "content", "") or ""
-                    if "cart" in content.lower() and "item" in content.lower():
-                        state.context["last_cart_tool"] = content
-                        print(f"[debug] Captured cart tool output: {content[:200]}")
-                print(f"[debug] Added {len(result['messages'])} tool messages from dict")
                 
                 # SMART TRIMMING: Preserve message pairs (AIMessage with tool_calls + ToolMessage)
                 if len(state.lc_messages) > 8:  # Trim if too many messages
@@ -3595,8 +2739,6 @@ Keep your response concise and helpful."""
                     trimmed.extend(recent_msgs)
                     state.lc_messages = trimmed
                     print(f"[debug] Trimmed to {len(state.lc_messages)} messages with valid tool pairs")
-            else:
-                print(f"[debug] Unexpected tool result type: {type(result)}")
         except Exception as e:
             print(f"[ERROR] Error in tools_node: {e}")
             import traceback
@@ -3677,36 +2819,44 @@ Keep your response concise and helpful."""
         if state.user_id:
             metadata["user_id"] = state.user_id
         
-        # ALWAYS store checkout flow state in metadata for persistence (even if False/none)
-        metadata["in_checkout_flow"] = state.in_checkout_flow
-        metadata["checkout_step"] = state.checkout_step
-        metadata["checkout_data"] = state.checkout_data if state.checkout_data else {}
-        
-        # Store PC builder flow state in metadata for persistence
-        metadata["in_pc_builder_flow"] = state.in_pc_builder_flow
-        metadata["pc_builder_step"] = state.pc_builder_step
-        metadata["pc_builder_data"] = state.pc_builder_data if state.pc_builder_data else {}
+        if self.checkpoint_durable:
+            # The flow state is written with the turn's checkpoint instead
+            state.checkpointed = True
+        else:
+            # ALWAYS store checkout flow state in metadata for persistence (even if False/none)
+            metadata["in_checkout_flow"] = state.in_checkout_flow
+            metadata["checkout_step"] = state.checkout_step
+            metadata["checkout_data"] = state.checkout_data if state.checkout_data else {}
+            
+            # Store PC builder flow state in metadata for persistence
+            metadata["in_pc_builder_flow"] = state.in_pc_builder_flow
+            metadata["pc_builder_step"] = state.pc_builder_step
+            metadata["pc_builder_data"] = state.pc_builder_data if state.pc_builder_data else {}
         
         print(f"[debug] Saving checkout state: in_flow={state.in_checkout_flow}, step={state.checkout_step}")
         print(f"[debug] Saving PC builder state: in_flow={state.in_pc_builder_flow}, step={state.pc_builder_step}")
         
-        await self.memory_store.save_conversation(
+        # Only the messages added this turn and the metadata keys that changed are written
+        await self.memory_store.append_to_session(
             state.session_id,
-            state.messages,
-            metadata
+            state.messages[state.loaded_message_count:],
+            metadata,
+            state.loaded_metadata
         )
         return state
 
     async def chat(self, message: str, session_id: str = "default", user_id: str = "") -> Dict:
         """Main chat interface"""
-        initial_state = AgentState(
-            user_input=message,
-            session_id=session_id,
-            user_id=user_id
-        )
-
-        # Run the graph
-        final_state = await self.graph.ainvoke(initial_state)
+        graph = await self.get_graph()
+
+        # Run the graph; the cart is read from MongoDB at most once per turn.
+        # The checkpoint is written once, when the run exits.
+        with cart_memo_scope():
+            final_state = await graph.ainvoke(
+                self._turn_input(message, session_id, user_id),
+                config=self._turn_config(session_id),
+                durability="exit"
+            )
 
         return {
             "response": final_state["ai_response"],
@@ -3716,149 +2866,106 @@ Keep your response concise and helpful."""
         }
 
     async def stream_chat(self, message: str, session_id: str = "default", user_id: str = ""):
-        """Stream chat responses for better user experience"""
-        try:
-            # Send initial status
-            yield {
-                "type": "status",
-                "content": "Processing your message...",
+        """
+        Stream chat responses as the graph runs
+        
+        Tokens from the agent's LLM are forwarded as they arrive ("content"
+        events carry the cumulative text so far), tool calls are reported as
+        "status" events, and a final "complete" event carries the response
+        from the finished graph state, which may differ from the streamed
+        text (cached answers, deterministic checkout / PC builder replies,
+        post-processing overrides).
+        """
+        def event(event_type: str, content: str, **extra) -> Dict:
+            return {
+                "type": event_type,
+                "content": content,
                 "session_id": session_id,
                 "needs_approval": False,
-                "context": {}
+                "context": {},
+                **extra
             }
+        
+        try:
+            yield event("status", "Processing your message...")
             
-            initial_state = AgentState(
-                user_input=message,
-                session_id=session_id,
-                user_id=user_id
-            )
-
-            # Load conversation history first
-            yield {
-                "type": "status", 
-                "content": "Loading conversation history...",
-                "session_id": session_id,
-                "needs_approval": False,
-                "context": {}
-            }
+            graph = await self.get_graph()
             
-            # Use the full graph to process the request
-            # This ensures proper context and configuration
-            yield {
-                "type": "status",
-                "content": "Processing...",
-                "session_id": session_id,
-                "needs_approval": False,
-                "context": {}
-            }
+            print(f"[debug] About to stream graph events for message: {message}")
             
-            print(f"[debug] About to invoke graph for streaming with message: {message}")
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 120.0
+            result = None
+            streamed_content = ""
             
-            # Add timeout protection to prevent hanging
-            import asyncio
-            try:
-                # Increased timeout and recursion limit for multi-step checkout
-                result = await asyncio.wait_for(
-                    self.graph.ainvoke(initial_state, config={"recursion_limit": 50}),
-                    timeout=120.0
+            with cart_memo_scope():
+                # Increased recursion limit for multi-step checkout
+                events = graph.astream_events(
+                    self._turn_input(message, session_id, user_id),
+                    config=self._turn_config(session_id, recursion_limit=50),
+                    version="v2",
+                    durability="exit"
                 )
-            except asyncio.TimeoutError:
-                print("[ERROR] Graph execution timed out after 120 seconds")
-                yield {
-                    "type": "error",
-                    "content": "Request is taking longer than expected. Please try again.",
-                    "session_id": session_id,
-                    "needs_approval": False,
-                    "context": {}
-                }
-                return
-            print(f"[debug] Graph result type: {type(result)}")
-            print(f"[debug] Graph result keys: {result.keys() if isinstance(result, dict) else 'Not a dict'}")
+                try:
+                    while True:
+                        try:
+                            # Bound the whole run, not each event
+                            graph_event = await asyncio.wait_for(events.__anext__(), timeout=deadline - loop.time())
+                        except StopAsyncIteration:
+                            break
+                        
+                        kind = graph_event["event"]
+                        node = graph_event.get("metadata", {}).get("langgraph_node")
+                        
+                        if kind == "on_chat_model_start" and node == "agent_llm":
+                            # Each ReAct step starts a fresh answer
+                            streamed_content = ""
+                        elif kind == "on_chat_model_stream" and node == "agent_llm":
+                            token = graph_event["data"]["chunk"].content
+                            if isinstance(token, str) and token:
+                                streamed_content += token
+                                yield event("content", streamed_content, is_partial=True)
+                        elif kind == "on_tool_start":
+                            tool_name = graph_event.get("name", "tool").replace("_", " ")
+                            yield event("status", f"Running {tool_name}...", tool=graph_event.get("name"))
+                        elif kind == "on_chain_end" and not graph_event.get("parent_ids"):
+                            # The root run's output is the final graph state
+                            result = graph_event["data"].get("output")
+                except asyncio.TimeoutError:
+                    print("[ERROR] Graph execution timed out after 120 seconds")
+                    yield event("error", "Request is taking longer than expected. Please try again.")
+                    return
+                finally:
+                    await events.aclose()
             
-            # Extract the AI response, handling different possible keys
             ai_response = ""
             if isinstance(result, dict):
-                print(f"[debug] Looking for ai_response in result...")
                 ai_response = result.get("ai_response", "")
-                print(f"[debug] ai_response found: {ai_response[:100]}..." if ai_response else "[debug] ai_response is empty")
-                
                 if not ai_response:
-                    # Try other possible keys
-                    print(f"[debug] ai_response empty, trying other keys...")
-                    ai_response = result.get("response", "")
-                    if not ai_response:
-                        # Check if there are messages
-                        messages = result.get("messages", [])
-                        if messages and len(messages) > 0:
-                            last_msg = messages[-1]
-                            if isinstance(last_msg, dict) and last_msg.get("role") == "assistant":
-                                ai_response = last_msg.get("content", "")
-                            else:
-                                ai_response = str(last_msg)
-                        else:
-                            ai_response = "I found your request but couldn't generate a proper response. Let me try to help you with MacBook information."
+                    messages = result.get("messages") or []
+                    last_msg = messages[-1] if messages else None
+                    if isinstance(last_msg, dict) and last_msg.get("role") == "assistant":
+                        ai_response = last_msg.get("content", "")
             else:
-                print(f"[debug] Result is not a dict: {result}")
-                ai_response = "I apologize, but I couldn't process your request properly."
-            
-            print(f"[debug] Final ai_response: {ai_response[:100]}..." if ai_response else "[debug] Final ai_response is empty")
+                print(f"[debug] Graph stream ended without a final state: {result}")
             
             if not ai_response or ai_response.strip() == "":
-                ai_response = "I found some MacBook products but encountered an issue generating the response. We have MacBook Pro models available. Would you like me to search again or provide specific details?"
-            
-            # Stream the response word by word
-            words = ai_response.split()
-            if not words:  # Safety check
-                words = ["I", "apologize", "for", "the", "technical", "issue.", "Please", "try", "again."]
-                ai_response = " ".join(words)
+                ai_response = streamed_content or "I apologize, but I couldn't process your request properly. Please try again."
             
-            streamed_content = ""
+            print(f"[debug] Final ai_response: {ai_response[:100]}...")
             
-            yield {
-                "type": "status",
-                "content": "Generating response...",
-                "session_id": session_id,
-                "needs_approval": False,
-                "context": {}
-            }
-            
-            print(f"[debug] Starting to stream {len(words)} words")
-            
-            for i, word in enumerate(words):
-                streamed_content += word + " "
-                
-                yield {
-                    "type": "content",
-                    "content": streamed_content.strip(),
-                    "session_id": session_id,
-                    "needs_approval": result.get("needs_human_approval", False) if isinstance(result, dict) else False,
-                    "context": result.get("context", {}) if isinstance(result, dict) else {},
-                    "is_partial": i < len(words) - 1
-                }
-                
-                # Add small delay for streaming effect
-                await asyncio.sleep(0.03)
-            
-            # Send final complete response
-            yield {
-                "type": "complete",
-                "content": ai_response,
-                "session_id": session_id,
-                "needs_approval": result.get("needs_human_approval", False) if isinstance(result, dict) else False,
-                "context": result.get("context", {}) if isinstance(result, dict) else {}
-            }
+            yield event(
+                "complete",
+                ai_response,
+                needs_approval=result.get("needs_human_approval", False) if isinstance(result, dict) else False,
+                context=result.get("context", {}) if isinstance(result, dict) else {}
+            )
             
         except Exception as e:
             print(f"Error in stream_chat: {e}")
             import traceback
             traceback.print_exc()
-            yield {
-                "type": "error",
-                "content": f"I encountered an error: {str(e)}. Please try again.",
-                "session_id": session_id,
-                "needs_approval": False,
-                "context": {}
-            }
+            yield event("error", f"I encountered an error: {str(e)}. Please try again.")
 
     async def get_conversation_history(self, session_id: str) -> List[Dict]:
         """Get conversation history for a session"""
@@ -3867,6 +2974,9 @@ Keep your response concise and helpful."""
     async def clear_conversation(self, session_id: str):
         """Clear conversation history for a session"""
         await self.memory_store.clear_session(session_id)
+        await self.get_graph()
+        if self.checkpointer is not None:
+            await self.checkpointer.adelete_thread(session_id)
 
     def get_pending_approvals(self) -> Dict:
         """Get pending human approvals"""
@@ -3956,6 +3066,35 @@ Keep your response concise and helpful."""
             print(f"Error getting popular products: {e}")
             return []
 
-# Initialize the agent
-config = AgentConfig()
-agent = AgenticAI(config)
\ No newline at end of file
+# Shared agent instance, created on first use so importing this module stays cheap
+_agent = None
+_agent_lock = threading.Lock()
+
+def get_agent() -> AgenticAI:
+    """Get or create the shared AgenticAI instance"""
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                _agent = AgenticAI(AgentConfig())
+    return _agent
+
+def peek_agent() -> Optional[AgenticAI]:
+    """Return the shared agent if it has been created, without creating it"""
+    return _agent
+
+def __getattr__(name):
+    # Keeps `from ai_agent import agent` working for the standalone scripts
+    if name == "agent":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+async def warm_up_agent():
+    """Open the MongoDB connection pools and load the catalog and search index before the first chat"""
+    current = get_agent()
+    await current.memory_store.client.admin.command('ping')
+    await current.get_graph()
+    if current.ecommerce is not None and await current.ecommerce.ping():
+        # Loading the catalog cache also builds the search index from it
+        if not await current.ecommerce.start_catalog_cache():
+            await current.ecommerce.refresh_search_index()
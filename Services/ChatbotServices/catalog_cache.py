@@ -0,0 +1,350 @@
+"""
+In-process Product Catalog Cache
+Holds the product catalog in memory with category, price, rating and recency indexes,
+kept coherent with MongoDB through a change stream (or polling on standalone servers)
+"""
+
+import asyncio
+import bisect
+import heapq
+import os
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+# Seconds between catalog polls when change streams are unavailable
+CATALOG_POLL_SECONDS = float(os.getenv("CATALOG_POLL_SECONDS", "30"))
+
+# Server error code for "$changeStream is only supported on replica sets"
+CHANGE_STREAM_UNSUPPORTED = 40573
+
+# Seconds to wait before re-opening a change stream that failed
+CHANGE_STREAM_RETRY_SECONDS = 5.0
+
+# Event names passed to listeners
+UPSERT = "upsert"
+REMOVE = "remove"
+RELOAD = "reload"
+
+
+def _number(value) -> Optional[float]:
+    """Numeric sort key, or None for missing / non-numeric values"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+class _SortedIndex:
+    """Sorted (key, product_id) pairs supporting range scans and ordered iteration"""
+
+    def __init__(self):
+        self.entries: List[Tuple[float, str]] = []
+
+    def add(self, key: Optional[float], product_id: str):
+        if key is not None:
+            bisect.insort(self.entries, (key, product_id))
+
+    def remove(self, key: Optional[float], product_id: str):
+        if key is None:
+            return
+        position = bisect.bisect_left(self.entries, (key, product_id))
+        if position < len(self.entries) and self.entries[position] == (key, product_id):
+            del self.entries[position]
+
+    def range(self, low: Optional[float], high: Optional[float]) -> List[str]:
+        start = 0 if low is None else bisect.bisect_left(self.entries, low, key=lambda entry: entry[0])
+        end = len(self.entries) if high is None else bisect.bisect_right(self.entries, high, key=lambda entry: entry[0])
+        return [product_id for _, product_id in self.entries[start:end]]
+
+    def ascending(self) -> Iterable[str]:
+        return (product_id for _, product_id in self.entries)
+
+    def descending(self) -> Iterable[str]:
+        return (product_id for _, product_id in reversed(self.entries))
+
+
+class CatalogCache:
+    """
+    Read-through copy of the products collection
+
+    Products are stored serialized (ObjectIds as strings) and keyed by id, with
+    secondary indexes by category, price, average rating and creation time, so
+    the agent's catalog reads are answered from memory. After the initial load
+    a background task applies changes from a MongoDB change stream; on
+    standalone servers, which don't support change streams, it polls for
+    documents whose updatedAt moved and reloads when the product count or the
+    newest product id changes.
+    Listeners are notified of every change (used to keep the search index in
+    sync).
+    """
+
+    def __init__(self, collection, serialize: Callable[[Dict], Dict],
+                 poll_interval: float = CATALOG_POLL_SECONDS):
+        self.collection = collection
+        self.serialize = serialize
+        self.poll_interval = poll_interval
+
+        self.products: Dict[str, Dict] = {}
+        self.by_category: Dict[str, Set[str]] = {}
+        self.price_index = _SortedIndex()
+        self.rating_index = _SortedIndex()
+        self.created_index = _SortedIndex()
+
+        self.ready = False
+        self.mode: Optional[str] = None
+        self._high_water: Optional[datetime] = None
+        self._listeners: List[Callable[[str, Optional[str], Optional[Dict]], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    # =============== LIFECYCLE ===============
+
+    def add_listener(self, listener: Callable[[str, Optional[str], Optional[Dict]], None]):
+        """Register listener(event, product_id, product) called after every change"""
+        self._listeners.append(listener)
+
+    async def start(self):
+        """Load the catalog and start following changes"""
+        if self._task is not None:
+            return
+        await self.reload()
+        self._task = asyncio.create_task(self._follow_changes())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def reload(self):
+        """Replace the cached catalog with a fresh copy of the collection"""
+        documents = await self.collection.find({}).to_list(length=None)
+        self.products = {}
+        self.by_category = {}
+        self.price_index = _SortedIndex()
+        self.rating_index = _SortedIndex()
+        self.created_index = _SortedIndex()
+        self._high_water = None
+        for document in documents:
+            self._insert(self.serialize(document))
+        self.ready = True
+        print(f"[debug] Catalog cache loaded {len(self.products)} products")
+        self._notify(RELOAD, None, None)
+
+    def stats(self) -> Dict:
+        return {
+            "ready": self.ready,
+            "mode": self.mode,
+            "products": len(self.products),
+            "categories": len(self.by_category),
+        }
+
+    # =============== MAINTENANCE ===============
+
+    def _insert(self, product: Dict):
+        product_id = product["_id"]
+        self.products[product_id] = product
+        self.by_category.setdefault(product.get("category"), set()).add(product_id)
+        self.price_index.add(_number(product.get("price")), product_id)
+        self.rating_index.add(_number(product.get("averageRating")), product_id)
+        created = product.get("createdAt")
+        if isinstance(created, datetime):
+            self.created_index.add(created.timestamp(), product_id)
+        updated = product.get("updatedAt")
+        if isinstance(updated, datetime) and (self._high_water is None or updated > self._high_water):
+            self._high_water = updated
+
+    def _delete(self, product_id: str):
+        product = self.products.pop(product_id, None)
+        if product is None:
+            return
+        category = product.get("category")
+        members = self.by_category.get(category)
+        if members is not None:
+            members.discard(product_id)
+            if not members:
+                del self.by_category[category]
+        self.price_index.remove(_number(product.get("price")), product_id)
+        self.rating_index.remove(_number(product.get("averageRating")), product_id)
+        created = product.get("createdAt")
+        if isinstance(created, datetime):
+            self.created_index.remove(created.timestamp(), product_id)
+
+    def apply_upsert(self, document: Dict):
+        """Insert or replace one product from a raw MongoDB document"""
+        product = self.serialize(dict(document))
+        self._delete(product["_id"])
+        self._insert(product)
+        self._notify(UPSERT, product["_id"], product)
+
+    def apply_delete(self, product_id: str):
+        self._delete(str(product_id))
+        self._notify(REMOVE, str(product_id), None)
+
+    def _notify(self, event: str, product_id: Optional[str], product: Optional[Dict]):
+        for listener in self._listeners:
+            try:
+                listener(event, product_id, product)
+            except Exception as e:
+                print(f"[debug] Catalog listener failed on {event}: {e}")
+
+    async def _follow_changes(self):
+        while True:
+            try:
+                self.mode = "change_stream"
+                await self._watch()
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAM_UNSUPPORTED or "replica set" in str(e).lower():
+                    print("[debug] Change streams unavailable, catalog cache falling back to polling")
+                    await self._poll_forever()
+                    return
+                print(f"[debug] Catalog change stream failed: {e}")
+            except PyMongoError as e:
+                print(f"[debug] Catalog change stream failed: {e}")
+
+            # Events may have been missed while the stream was down
+            await asyncio.sleep(CHANGE_STREAM_RETRY_SECONDS)
+            try:
+                await self.reload()
+            except PyMongoError as e:
+                print(f"[debug] Catalog reload failed: {e}")
+
+    async def _watch(self):
+        async with self.collection.watch(full_document="updateLookup") as stream:
+            async for change in stream:
+                operation = change.get("operationType")
+                if operation in ("insert", "update", "replace"):
+                    document = change.get("fullDocument")
+                    if document is not None:
+                        self.apply_upsert(document)
+                    else:
+                        # Deleted before the update lookup ran
+                        self.apply_delete(change["documentKey"]["_id"])
+                elif operation == "delete":
+                    self.apply_delete(change["documentKey"]["_id"])
+                elif operation in ("drop", "rename", "invalidate"):
+                    await self.reload()
+                    return
+
+    async def _poll_forever(self):
+        self.mode = "polling"
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self._poll_once()
+            except PyMongoError as e:
+                print(f"[debug] Catalog poll failed: {e}")
+
+    async def _poll_once(self):
+        if self._high_water is not None:
+            # $gte: another write may land in the same millisecond as the high-water mark
+            changed = await self.collection.find({"updatedAt": {"$gte": self._high_water}}).to_list(length=None)
+            for document in changed:
+                product = self.serialize(dict(document))
+                if self.products.get(product["_id"]) != product:
+                    self.apply_upsert(document)
+        # Deletions (and documents without updatedAt) only show up in the count and
+        # the newest id; a delete plus an insert leaves the count unchanged
+        summary = await self.collection.aggregate([
+            {"$group": {"_id": None, "count": {"$sum": 1}, "last_id": {"$max": "$_id"}}}
+        ]).to_list(length=1)
+        count, last_id = (summary[0]["count"], str(summary[0]["last_id"])) if summary else (0, None)
+        # Product ids are ObjectIds, whose hex strings sort like the ids
+        if count != len(self.products) or last_id != max(self.products, default=None):
+            await self.reload()
+
+    # =============== QUERIES ===============
+    # Results are shallow copies so callers can't mutate the cached documents
+
+    def get(self, product_id: str) -> Optional[Dict]:
+        product = self.products.get(str(product_id))
+        return dict(product) if product is not None else None
+
+    def get_many(self, product_ids: Iterable[str]) -> Dict[str, Dict]:
+        return {
+            str(product_id): dict(self.products[str(product_id)])
+            for product_id in product_ids if str(product_id) in self.products
+        }
+
+    def categories(self) -> List[str]:
+        return sorted(category for category in self.by_category if category is not None)
+
+    def query(self, category: str = None, min_price: float = None, max_price: float = None,
+              sort_by: str = None, limit: int = 20) -> List[Dict]:
+        """Filter and sort like EcommerceService.get_products"""
+        candidates: Optional[Set[str]] = None
+        if category:
+            candidates = self.by_category.get(category, set())
+        if min_price is not None or max_price is not None:
+            in_range = set(self.price_index.range(min_price, max_price))
+            candidates = in_range if candidates is None else candidates & in_range
+
+        def matching(ordered: Iterable[str]) -> Iterable[str]:
+            return ordered if candidates is None else (pid for pid in ordered if pid in candidates)
+
+        if sort_by == "price_asc":
+            ordered = self._with_unindexed(self.price_index.ascending(), self.price_index)
+        elif sort_by == "price_desc":
+            ordered = self._with_unindexed(self.price_index.descending(), self.price_index)
+        elif sort_by == "rating_desc":
+            ordered = self._with_unindexed(self.rating_index.descending(), self.rating_index)
+        elif sort_by == "name_asc":
+            pool = self.products if candidates is None else candidates
+            ordered = heapq.nsmallest(limit, pool, key=lambda pid: str(self.products[pid].get("name", "")))
+        else:
+            # Default: newest first
+            ordered = self._with_unindexed(self.created_index.descending(), self.created_index)
+
+        results = []
+        for product_id in matching(ordered):
+            results.append(dict(self.products[product_id]))
+            if len(results) >= limit:
+                break
+        return results
+
+    def _with_unindexed(self, ordered: Iterable[str], index: _SortedIndex) -> Iterable[str]:
+        """Indexed products in order, then products missing the sort field"""
+        yield from ordered
+        if len(index.entries) < len(self.products):
+            indexed = {product_id for _, product_id in index.entries}
+            yield from (product_id for product_id in self.products if product_id not in indexed)
+
+    def featured(self, limit: int, min_rating: float, created_since: datetime) -> List[Dict]:
+        """Highly rated or recently added products, best rated first"""
+        def is_featured(product: Dict) -> bool:
+            rating = _number(product.get("averageRating"))
+            created = product.get("createdAt")
+            return ((rating is not None and rating >= min_rating)
+                    or (isinstance(created, datetime) and created >= created_since))
+
+        matches = [product for product in self.products.values() if is_featured(product)]
+        matches.sort(key=lambda p: (_number(p.get("averageRating")) or float("-inf"),
+                                    p.get("createdAt") if isinstance(p.get("createdAt"), datetime) else datetime.min),
+                     reverse=True)
+        return [dict(product) for product in matches[:limit]]
+
+    def price_range(self) -> Optional[Dict]:
+        entries = self.price_index.entries
+        if not entries:
+            return None
+        return {
+            "min_price": self.products[entries[0][1]]["price"],
+            "max_price": self.products[entries[-1][1]]["price"],
+            "avg_price": sum(price for price, _ in entries) / len(entries),
+        }
+
+    def low_stock(self, threshold: int) -> List[Dict]:
+        matches = [
+            product for product in self.products.values()
+            if _number(product.get("stock")) is not None and product["stock"] <= threshold
+        ]
+        matches.sort(key=lambda p: p["stock"])
+        return [dict(product) for product in matches]
+
+    def newest(self, limit: int) -> List[Dict]:
+        return self.query(limit=limit)
@@ -0,0 +1,107 @@
+"""
+Agent Graph Checkpointer
+Durable LangGraph checkpoints for the checkout and PC builder flows, keyed by session
+
+Backends (AGENT_CHECKPOINTER):
+    auto    - mongo when langgraph-checkpoint-mongodb is installed, else sqlite
+              when langgraph-checkpoint-sqlite is installed, else none (default)
+    mongo   - the chatbot MongoDB database, shared by every worker and host
+    sqlite  - a local SQLite file, for single-host and local runs
+    memory  - LangGraph's in-process MemorySaver (development only: not shared
+              between workers and never pruned)
+    none    - no checkpoints; flow state is kept in the conversation metadata
+
+Only the typed flow state of AgentState is checkpointed (per-turn fields are
+untracked channels) and the agent writes one checkpoint per turn, at the end
+of the run, so a checkpoint is a few hundred bytes rather than the whole state.
+"""
+
+import asyncio
+import os
+from typing import Tuple
+
+from langgraph.checkpoint.memory import MemorySaver
+
+try:
+    from pymongo import MongoClient
+    from langgraph.checkpoint.mongodb import MongoDBSaver
+    MONGODB_CHECKPOINTER_AVAILABLE = True
+except ImportError:
+    MONGODB_CHECKPOINTER_AVAILABLE = False
+
+try:
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    SQLITE_CHECKPOINTER_AVAILABLE = True
+except ImportError:
+    SQLITE_CHECKPOINTER_AVAILABLE = False
+
+AGENT_CHECKPOINTER = os.getenv("AGENT_CHECKPOINTER", "auto").lower()
+AGENT_CHECKPOINT_SQLITE_PATH = os.getenv(
+    "AGENT_CHECKPOINT_SQLITE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "agent_checkpoints.sqlite")
+)
+# Mongo checkpoints expire through a TTL index; abandoned flows don't need to live forever
+AGENT_CHECKPOINT_TTL_DAYS = float(os.getenv("AGENT_CHECKPOINT_TTL_DAYS", "30"))
+
+CHECKPOINT_COLLECTION = "agent_checkpoints"
+CHECKPOINT_WRITES_COLLECTION = "agent_checkpoint_writes"
+
+
+def _resolve(name: str) -> str:
+    if name != "auto":
+        return name
+    if MONGODB_CHECKPOINTER_AVAILABLE:
+        return "mongo"
+    if SQLITE_CHECKPOINTER_AVAILABLE:
+        return "sqlite"
+    return "none"
+
+
+def _mongo_saver(mongo_uri: str, db_name: str):
+    # Blocking: the saver uses the sync driver and creates its indexes here
+    client = MongoClient(mongo_uri, serverSelectionTimeoutMS=5000)
+    return MongoDBSaver(
+        client,
+        db_name=db_name,
+        checkpoint_collection_name=CHECKPOINT_COLLECTION,
+        writes_collection_name=CHECKPOINT_WRITES_COLLECTION,
+        ttl=int(AGENT_CHECKPOINT_TTL_DAYS * 24 * 3600) if AGENT_CHECKPOINT_TTL_DAYS > 0 else None,
+    )
+
+
+async def create_checkpointer(mongo_uri: str, db_name: str, name: str = AGENT_CHECKPOINTER) -> Tuple[object, bool]:
+    """
+    Checkpointer for the agent graph
+
+    Must be called from the event loop the graph runs on (the SQLite saver
+    binds to it).
+
+    Returns:
+        (checkpointer or None, durable) - durable is True when checkpoints
+        survive restarts and are visible to every worker
+    """
+    name = _resolve(name)
+    try:
+        if name == "mongo":
+            if not MONGODB_CHECKPOINTER_AVAILABLE:
+                print("[debug] AGENT_CHECKPOINTER=mongo but langgraph-checkpoint-mongodb is not installed")
+                return None, False
+            saver = await asyncio.to_thread(_mongo_saver, mongo_uri, db_name)
+            print(f"[debug] Agent checkpoints in MongoDB collection {db_name}.{CHECKPOINT_COLLECTION}")
+            return saver, True
+        if name == "sqlite":
+            if not SQLITE_CHECKPOINTER_AVAILABLE:
+                print("[debug] AGENT_CHECKPOINTER=sqlite but langgraph-checkpoint-sqlite is not installed")
+                return None, False
+            saver = AsyncSqliteSaver(await aiosqlite.connect(AGENT_CHECKPOINT_SQLITE_PATH))
+            await saver.setup()
+            print(f"[debug] Agent checkpoints in {AGENT_CHECKPOINT_SQLITE_PATH}")
+            return saver, True
+        if name == "memory":
+            return MemorySaver(), False
+        if name != "none":
+            print(f"[debug] Unknown agent checkpointer '{name}', flow state stays in conversation metadata")
+    except Exception as e:
+        print(f"[debug] Agent checkpointer '{name}' unavailable ({e}), flow state stays in conversation metadata")
+    return None, False
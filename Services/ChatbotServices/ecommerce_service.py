@@ -5,13 +5,82 @@ Provides Python interface to interact with Node.js/MongoDB e-commerce functional
 """
 
 import asyncio
+import contextvars
 import json
+import os
+import re
+import time
 import uuid
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from bson import ObjectId
 from bson.errors import InvalidId
+from .catalog_cache import REMOVE, RELOAD, UPSERT, CatalogCache
+from .product_search_index import ProductSearchIndex
+
+
+# Connection pool settings shared by every async MongoDB client in the chatbot
+MONGO_POOL_OPTIONS = {
+    "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", "50")),
+    "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", "5")),
+    "maxIdleTimeMS": int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "60000")),
+    "waitQueueTimeoutMS": int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000")),
+    "serverSelectionTimeoutMS": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000")),
+    "connectTimeoutMS": int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000")),
+    "retryWrites": True,
+}
+
+
+def create_mongo_client(mongo_uri: str) -> AsyncIOMotorClient:
+    """Create an async MongoDB client with the shared pool settings"""
+    return AsyncIOMotorClient(mongo_uri, **MONGO_POOL_OPTIONS)
+
+
+# Product fields rendered for cart items and copied into order items
+CART_PRODUCT_PROJECTION = {
+    "name": 1, "price": 1, "imageUrl": 1, "image": 1, "stock": 1,
+    "category": 1, "brand": 1, "averageRating": 1
+}
+
+# Serve catalog reads from the in-process catalog cache (CATALOG_CACHE_ENABLED, default true)
+CATALOG_CACHE_ENABLED = os.getenv("CATALOG_CACHE_ENABLED", "true").lower() == "true"
+
+# Default product order when reading MongoDB directly; matches the catalog cache's created
+# index, which breaks createdAt ties on the product id
+NEWEST_FIRST = [("createdAt", -1), ("_id", -1)]
+
+# Fields loaded into the in-process product search index
+SEARCH_INDEX_PROJECTION = {"name": 1, "brand": 1, "category": 1, "description": 1}
+
+# Seconds before the search index is rebuilt from the catalog in the background
+SEARCH_INDEX_REFRESH_SECONDS = float(os.getenv("PRODUCT_SEARCH_REFRESH_SECONDS", "300"))
+
+# Cart items memoized per user for the duration of one chat turn (see cart_memo_scope)
+_cart_memo: contextvars.ContextVar = contextvars.ContextVar("cart_memo", default=None)
+
+
+@contextmanager
+def cart_memo_scope():
+    """
+    Memoize get_cart_items for the duration of one request
+
+    The agent's tools and checkout nodes read the cart several times per turn;
+    inside this scope only the first read hits MongoDB. Any cart mutation
+    clears the memo, so reads after a write always see fresh data.
+    """
+    token = _cart_memo.set({})
+    try:
+        yield
+    finally:
+        _cart_memo.reset(token)
+
+
+def _invalidate_cart_memo():
+    memo = _cart_memo.get()
+    if memo:
+        memo.clear()
 
 
 class EcommerceService:
@@ -19,7 +88,9 @@ class EcommerceService:
     
     def __init__(self, mongo_uri: str, db_name: str = "TechHive"):
         """Initialize connection to main e-commerce database"""
-        self.client = MongoClient(mongo_uri)
+        # Async driver: queries never block the event loop. The client connects
+        # lazily, so use ping() to verify connectivity.
+        self.client = create_mongo_client(mongo_uri)
         self.db = self.client[db_name]
         
         # Collections
@@ -30,14 +101,29 @@ class EcommerceService:
         self.shippings = self.db.shippings
         self.coupons = self.db.coupons
         self.counters = self.db.counters
-        
-        # Test connection
+        self.db_name = db_name
+
+        # In-process product search, built from the catalog on first search
+        self.search_index = ProductSearchIndex()
+        self._search_index_built_at: Optional[float] = None
+        self._search_index_task: Optional[asyncio.Task] = None
+        self._search_index_lock = asyncio.Lock()
+
+        # In-memory copy of the catalog, loaded by start_catalog_cache(). Until it
+        # is ready, product reads go to MongoDB.
+        self.catalog = CatalogCache(self.products, self._serialize_doc)
+        self.catalog.add_listener(self._on_catalog_change)
+        print(f"[debug] E-commerce database client configured: {db_name}")
+
+    async def ping(self) -> bool:
+        """Check that the e-commerce database is reachable"""
         try:
-            self.client.admin.command('ping')
-            print(f"✅ Connected to e-commerce database: {db_name}")
+            await self.client.admin.command('ping')
+            print(f"✅ Connected to e-commerce database: {self.db_name}")
+            return True
         except Exception as e:
             print(f"❌ Failed to connect to e-commerce database: {e}")
-            raise
+            return False
 
     def _serialize_doc(self, doc: Dict) -> Dict:
         """Convert MongoDB document to JSON-serializable format"""
@@ -55,6 +141,32 @@ class EcommerceService:
         
         return doc
 
+    # =============== CATALOG CACHE ===============
+
+    async def start_catalog_cache(self) -> bool:
+        """Load the catalog into memory and keep it in sync with MongoDB"""
+        if not CATALOG_CACHE_ENABLED:
+            return False
+        try:
+            await self.catalog.start()
+            return True
+        except Exception as e:
+            print(f"⚠️ Catalog cache failed to start, product reads will use MongoDB: {e}")
+            return False
+
+    def _use_catalog(self) -> bool:
+        return CATALOG_CACHE_ENABLED and self.catalog.ready
+
+    def _on_catalog_change(self, event: str, product_id: Optional[str], product: Optional[Dict]):
+        """Keep the search index in step with the catalog cache"""
+        if event == UPSERT:
+            self.search_index.upsert(product)
+        elif event == REMOVE:
+            self.search_index.remove(product_id)
+        elif event == RELOAD:
+            self.search_index.build(list(self.catalog.products.values()))
+            self._search_index_built_at = time.monotonic()
+
     # =============== PRODUCT OPERATIONS ===============
     
     async def get_products(self, limit: int = 20, category: str = None, min_price: float = None, max_price: float = None, sort_by: str = None) -> List[Dict]:
@@ -62,6 +174,11 @@ class EcommerceService:
         try:
             print(f"[debug] Getting products with filters - limit: {limit}, category: {category}, price range: {min_price}-{max_price}, sort: {sort_by}")
             
+            if self._use_catalog():
+                products = self.catalog.query(category, min_price, max_price, sort_by, limit)
+                print(f"[debug] Found {len(products)} products (catalog cache)")
+                return products
+            
             # Build query filter
             query = {}
             
@@ -87,7 +204,7 @@ class EcommerceService:
             elif sort_by == "rating_desc":
                 sort_option = [("averageRating", -1)]
             else:
-                sort_option = [("createdAt", -1)]  # Default: newest first
+                sort_option = NEWEST_FIRST  # Default: newest first, as the catalog cache orders it
             
             print(f"[debug] Query: {query}")
             print(f"[debug] Sort: {sort_option}")
@@ -98,7 +215,7 @@ class EcommerceService:
                 cursor = cursor.sort(sort_option)
             cursor = cursor.limit(limit)
             
-            products = list(cursor)
+            products = await cursor.to_list(length=None)
             print(f"[debug] Found {len(products)} products")
             
             return [self._serialize_doc(product) for product in products]
@@ -106,46 +223,89 @@ class EcommerceService:
             print(f"Error fetching products: {e}")
             return []
 
+    async def refresh_search_index(self) -> int:
+        """
+        Rebuild the product search index from the catalog
+
+        Returns:
+            Number of products indexed
+        """
+        async with self._search_index_lock:
+            if self._use_catalog():
+                products = list(self.catalog.products.values())
+            else:
+                products = await self.products.find({}, SEARCH_INDEX_PROJECTION).to_list(length=None)
+            await asyncio.to_thread(self.search_index.build, products)
+            self._search_index_built_at = time.monotonic()
+            print(f"[debug] Product search index built with {len(self.search_index)} products")
+            return len(self.search_index)
+
+    async def _ensure_search_index(self):
+        """Build the index on first use; afterwards refresh it in the background when stale"""
+        if self._search_index_built_at is None:
+            await self.refresh_search_index()
+            return
+        if self._use_catalog():
+            # The catalog listener applies every change to the index
+            return
+        stale = time.monotonic() - self._search_index_built_at > SEARCH_INDEX_REFRESH_SECONDS
+        if stale and (self._search_index_task is None or self._search_index_task.done()):
+            self._search_index_task = asyncio.create_task(self.refresh_search_index())
+
     async def search_products(self, query: str, limit: int = 10) -> List[Dict]:
-        """Search products by name or description"""
+        """Search products by relevance over name, brand, category and description"""
         try:
             print(f"[debug] Searching products with query: '{query}', limit: {limit}")
             
-            # Test database connection first
             try:
-                self.client.admin.command('ping')
-                print(f"[debug] Database connection is alive for search")
-            except Exception as conn_e:
-                print(f"[debug] Database connection failed during search: {conn_e}")
+                await self._ensure_search_index()
+                ranked = self.search_index.search(query, limit)
+            except Exception as index_e:
+                print(f"[debug] Search index unavailable, falling back to regex search: {index_e}")
+                return await self._regex_search_products(query, limit)
+            
+            if not ranked:
+                print(f"[debug] Found 0 products")
                 return []
             
-            # Create text search query
-            search_filter = {
-                "$or": [
-                    {"name": {"$regex": query, "$options": "i"}},
-                    {"description": {"$regex": query, "$options": "i"}}
-                ]
-            }
+            products_by_id = await self.get_products_by_ids([product_id for product_id, _ in ranked])
             
-            print(f"[debug] Search filter: {search_filter}")
-            products = list(self.products.find(search_filter).limit(limit))
-            print(f"[debug] Found {len(products)} products")
+            # Return in relevance order; skip products deleted since the last refresh
+            results = [products_by_id[product_id] for product_id, _ in ranked if product_id in products_by_id]
+            print(f"[debug] Found {len(results)} products")
             
-            if products:
-                print(f"[debug] First product: {products[0].get('name', 'No name')}")
+            if results:
+                print(f"[debug] First product: {results[0].get('name', 'No name')}")
             
-            return [self._serialize_doc(product) for product in products]
+            return results
         except Exception as e:
             print(f"[debug] Error searching products: {type(e).__name__}: {e}")
             import traceback
             traceback.print_exc()
             return []
 
+    async def _regex_search_products(self, query: str, limit: int) -> List[Dict]:
+        """Unindexed substring search, used only when the search index cannot be built"""
+        pattern = re.escape(query)
+        search_filter = {
+            "$or": [
+                {"name": {"$regex": pattern, "$options": "i"}},
+                {"description": {"$regex": pattern, "$options": "i"}}
+            ]
+        }
+        products = await self.products.find(search_filter).limit(limit).to_list(length=None)
+        return [self._serialize_doc(product) for product in products]
+
     async def get_product_by_id(self, product_id: str) -> Optional[Dict]:
         """Get detailed information about a specific product"""
         try:
             print(f"[debug] Getting product details for ID: {product_id}")
-            product = self.products.find_one({"_id": ObjectId(product_id)})
+            if self._use_catalog():
+                product = self.catalog.get(product_id)
+                if product is None:
+                    print(f"[debug] Product not found for ID: {product_id}")
+                return product
+            product = await self.products.find_one({"_id": ObjectId(product_id)})
             
             if product:
                 product_data = self._serialize_doc(product)
@@ -165,7 +325,9 @@ class EcommerceService:
     async def get_product_categories(self) -> List[str]:
         """Get all unique product categories"""
         try:
-            categories = self.products.distinct("category")
+            if self._use_catalog():
+                return self.catalog.categories()
+            categories = await self.products.distinct("category")
             print(f"[debug] Found categories: {categories}")
             return categories
         except Exception as e:
@@ -176,7 +338,10 @@ class EcommerceService:
         """Get products in a specific category"""
         try:
             print(f"[debug] Getting products in category: {category}")
-            products = list(self.products.find({"category": category}).limit(limit))
+            if self._use_catalog():
+                return self.catalog.query(category=category, limit=limit)
+            # Same order as the catalog cache, so results don't depend on whether it is warm
+            products = await self.products.find({"category": category}).sort(NEWEST_FIRST).limit(limit).to_list(length=None)
             print(f"[debug] Found {len(products)} products in {category}")
             return [self._serialize_doc(product) for product in products]
         except Exception as e:
@@ -187,12 +352,17 @@ class EcommerceService:
         """Get featured products (high rated or recently added)"""
         try:
             # Get products with high ratings or recently added
-            featured = list(self.products.find({
+            month_start = datetime.utcnow().replace(day=1)  # This month
+            if self._use_catalog():
+                featured = self.catalog.featured(limit, min_rating=4.0, created_since=month_start)
+                print(f"[debug] Found {len(featured)} featured products (catalog cache)")
+                return featured
+            featured = await self.products.find({
                 "$or": [
                     {"averageRating": {"$gte": 4.0}},
-                    {"createdAt": {"$gte": datetime.utcnow().replace(day=1)}}  # This month
+                    {"createdAt": {"$gte": month_start}}
                 ]
-            }).sort([("averageRating", -1), ("createdAt", -1)]).limit(limit))
+            }).sort([("averageRating", -1), ("createdAt", -1)]).limit(limit).to_list(length=None)
             
             print(f"[debug] Found {len(featured)} featured products")
             return [self._serialize_doc(product) for product in featured]
@@ -203,6 +373,12 @@ class EcommerceService:
     async def get_price_range(self) -> Dict:
         """Get the price range of all products"""
         try:
+            if self._use_catalog():
+                price_info = self.catalog.price_range()
+                if price_info is None:
+                    return {"min_price": 0, "max_price": 0, "avg_price": 0}
+                return {**price_info, "avg_price": round(price_info["avg_price"], 2)}
+            
             pipeline = [
                 {"$group": {
                     "_id": None,
@@ -212,7 +388,7 @@ class EcommerceService:
                 }}
             ]
             
-            result = list(self.products.aggregate(pipeline))
+            result = await self.products.aggregate(pipeline).to_list(length=None)
             if result:
                 price_info = result[0]
                 return {
@@ -228,7 +404,9 @@ class EcommerceService:
     async def get_low_stock_products(self, threshold: int = 10) -> List[Dict]:
         """Get products with low stock"""
         try:
-            products = list(self.products.find({"stock": {"$lte": threshold}}).sort([("stock", 1)]))
+            if self._use_catalog():
+                return self.catalog.low_stock(threshold)
+            products = await self.products.find({"stock": {"$lte": threshold}}).sort([("stock", 1)]).to_list(length=None)
             print(f"[debug] Found {len(products)} products with low stock (<= {threshold})")
             return [self._serialize_doc(product) for product in products]
         except Exception as e:
@@ -240,7 +418,7 @@ class EcommerceService:
     async def get_user_by_id(self, user_id: str) -> Optional[Dict]:
         """Get user by ID"""
         try:
-            user = self.users.find_one({"_id": ObjectId(user_id)})
+            user = await self.users.find_one({"_id": ObjectId(user_id)})
             if user:
                 # Don't return password
                 user.pop('password', None)
@@ -256,7 +434,7 @@ class EcommerceService:
     async def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user by email"""
         try:
-            user = self.users.find_one({"email": email})
+            user = await self.users.find_one({"email": email})
             if user:
                 # Don't return password
                 user.pop('password', None)
@@ -271,31 +449,20 @@ class EcommerceService:
     async def get_cart_items(self, user_id: str) -> List[Dict]:
         """Get all items in user's cart"""
         try:
+            memo = _cart_memo.get()
+            if memo is not None and user_id in memo:
+                print(f"[debug] Using memoized cart items for user: {user_id}")
+                return [dict(item, product=dict(item["product"])) for item in memo[user_id]]
+
             print(f"[debug] Getting cart items for user: {user_id}")
             
             # Find the user's cart
-            cart = self.carts.find_one({"user": user_id})
+            cart = await self.carts.find_one({"user": user_id}, {"items": 1})
             print(f"[debug] Cart found: {bool(cart)}")
             
-            if not cart or 'items' not in cart:
-                print(f"[debug] No cart or items found for user: {user_id}")
-                return []
-            
-            # Get items with product details
-            cart_items = []
-            for item in cart['items']:
-                product_id = item.get('product')
-                if product_id:
-                    # Get product details
-                    product = self.products.find_one({"_id": ObjectId(product_id)})
-                    if product:
-                        cart_item = {
-                            "_id": str(item.get('_id', '')),
-                            "product": self._serialize_doc(product),
-                            "quantity": item.get('quantity', 1),
-                            "cartItemId": str(item.get('_id', ''))
-                        }
-                        cart_items.append(cart_item)
+            cart_items = await self._build_cart_items(cart)
+            if memo is not None:
+                memo[user_id] = [dict(item, product=dict(item["product"])) for item in cart_items]
             
             print(f"[debug] Found {len(cart_items)} cart items")
             return cart_items
@@ -306,9 +473,63 @@ class EcommerceService:
             traceback.print_exc()
             return []
 
+    async def _build_cart_items(self, cart: Optional[Dict]) -> List[Dict]:
+        """Join a cart's items with their products using a single $in query"""
+        if not cart or not cart.get('items'):
+            return []
+
+        product_ids = []
+        for item in cart['items']:
+            try:
+                if item.get('product'):
+                    product_ids.append(ObjectId(str(item['product'])))
+            except InvalidId:
+                print(f"[debug] Skipping cart item with invalid product ID: {item.get('product')}")
+
+        if self._use_catalog():
+            cached = self.catalog.get_many(str(product_id) for product_id in product_ids)
+            products_by_id = {
+                product_id: {field: product[field] for field in ("_id", *CART_PRODUCT_PROJECTION) if field in product}
+                for product_id, product in cached.items()
+            }
+        else:
+            products = await self.products.find(
+                {"_id": {"$in": product_ids}}, CART_PRODUCT_PROJECTION
+            ).to_list(length=None)
+            products_by_id = {str(product["_id"]): self._serialize_doc(product) for product in products}
+
+        # Keep cart order; items whose product no longer exists are dropped
+        cart_items = []
+        for item in cart['items']:
+            product = products_by_id.get(str(item.get('product')))
+            if product:
+                cart_items.append({
+                    "_id": str(item.get('_id', '')),
+                    "product": dict(product),
+                    "quantity": item.get('quantity', 1),
+                    "cartItemId": str(item.get('_id', ''))
+                })
+        return cart_items
+
+    async def get_products_by_ids(self, product_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch several products in one query, keyed by string ID"""
+        if self._use_catalog():
+            return self.catalog.get_many(product_ids)
+        object_ids = []
+        for product_id in product_ids:
+            try:
+                object_ids.append(ObjectId(str(product_id)))
+            except InvalidId:
+                print(f"[debug] Invalid product ID format: {product_id}")
+        if not object_ids:
+            return {}
+        products = await self.products.find({"_id": {"$in": object_ids}}).to_list(length=None)
+        return {str(product["_id"]): self._serialize_doc(product) for product in products}
+
     async def add_to_cart(self, user_id: str, product_id: str, quantity: int = 1) -> Dict:
         """Add item to cart"""
         try:
+            _invalidate_cart_memo()
             # Get product details
             product = await self.get_product_by_id(product_id)
             if not product:
@@ -317,7 +538,7 @@ class EcommerceService:
             product_oid = ObjectId(product_id)
 
             # Find user's cart
-            cart = self.carts.find_one({"user": user_id})
+            cart = await self.carts.find_one({"user": user_id})
             
             if cart:
                 # Cart exists, check if product is already in cart
@@ -330,7 +551,7 @@ class EcommerceService:
                 if existing_item_index is not None:
                     # Update quantity of existing item
                     new_quantity = cart["items"][existing_item_index]["quantity"] + quantity
-                    self.carts.update_one(
+                    await self.carts.update_one(
                         {"_id": cart["_id"]},
                         {"$set": {f"items.{existing_item_index}.quantity": new_quantity}}
                     )
@@ -347,7 +568,7 @@ class EcommerceService:
                         "product": product_oid,
                         "quantity": quantity
                     }
-                    self.carts.update_one(
+                    await self.carts.update_one(
                         {"_id": cart["_id"]},
                         {"$push": {"items": new_item}}
                     )
@@ -370,7 +591,7 @@ class EcommerceService:
                     "updatedAt": datetime.utcnow()
                 }
                 
-                result = self.carts.insert_one(cart_doc)
+                result = await self.carts.insert_one(cart_doc)
                 return {
                     "success": True,
                     "message": f"Created cart and added {product['name']}",
@@ -386,13 +607,14 @@ class EcommerceService:
     async def remove_from_cart(self, cart_item_id: str) -> Dict:
         """Remove item from cart"""
         try:
+            _invalidate_cart_memo()
             # Find the cart that contains this item
-            cart = self.carts.find_one({"items._id": ObjectId(cart_item_id)})
+            cart = await self.carts.find_one({"items._id": ObjectId(cart_item_id)})
             if not cart:
                 return {"success": False, "message": "Cart item not found"}
             
             # Remove the item from the items array
-            result = self.carts.update_one(
+            result = await self.carts.update_one(
                 {"_id": cart["_id"]},
                 {"$pull": {"items": {"_id": ObjectId(cart_item_id)}}}
             )
@@ -410,16 +632,17 @@ class EcommerceService:
     async def update_cart_quantity(self, cart_item_id: str, quantity: int) -> Dict:
         """Update quantity of cart item"""
         try:
+            _invalidate_cart_memo()
             if quantity < 1:
                 return {"success": False, "message": "Quantity must be at least 1"}
 
             # Find the cart that contains this item
-            cart = self.carts.find_one({"items._id": ObjectId(cart_item_id)})
+            cart = await self.carts.find_one({"items._id": ObjectId(cart_item_id)})
             if not cart:
                 return {"success": False, "message": "Cart item not found"}
             
             # Update the specific item's quantity in the array
-            result = self.carts.update_one(
+            result = await self.carts.update_one(
                 {"_id": cart["_id"], "items._id": ObjectId(cart_item_id)},
                 {"$set": {"items.$.quantity": quantity}}
             )
@@ -437,10 +660,11 @@ class EcommerceService:
     async def increase_quantity(self, cart_item_id: str) -> Dict:
         """Increase quantity of cart item by 1"""
         try:
+            _invalidate_cart_memo()
             print(f"[debug] Increasing quantity for cart_item_id: {cart_item_id}")
             
             # Find the cart that contains this item
-            cart = self.carts.find_one({"items._id": ObjectId(cart_item_id)})
+            cart = await self.carts.find_one({"items._id": ObjectId(cart_item_id)})
             if not cart:
                 print(f"[debug] No cart found with items._id: {cart_item_id}")
                 return {"success": False, "message": "Cart item not found"}
@@ -462,7 +686,7 @@ class EcommerceService:
             print(f"[debug] Target item found: quantity={target_item['quantity']}")
             
             # Get product to check stock
-            product = self.products.find_one({"_id": ObjectId(target_item["product"])})
+            product = await self.products.find_one({"_id": ObjectId(target_item["product"])}, {"stock": 1})
             if not product:
                 print(f"[debug] Product not found: {target_item['product']}")
                 return {"success": False, "message": "Product not found"}
@@ -474,7 +698,7 @@ class EcommerceService:
                 return {"success": False, "message": f"Only {product['stock']} items in stock"}
             
             # Increase quantity by 1
-            result = self.carts.update_one(
+            result = await self.carts.update_one(
                 {"_id": cart["_id"], "items._id": ObjectId(cart_item_id)},
                 {"$inc": {"items.$.quantity": 1}}
             )
@@ -495,8 +719,9 @@ class EcommerceService:
     async def decrease_quantity(self, cart_item_id: str) -> Dict:
         """Decrease quantity of cart item by 1"""
         try:
+            _invalidate_cart_memo()
             # Find the cart that contains this item
-            cart = self.carts.find_one({"items._id": ObjectId(cart_item_id)})
+            cart = await self.carts.find_one({"items._id": ObjectId(cart_item_id)})
             if not cart:
                 return {"success": False, "message": "Cart item not found"}
             
@@ -516,7 +741,7 @@ class EcommerceService:
                 return await self.remove_from_cart(cart_item_id)
             
             # Decrease quantity by 1
-            result = self.carts.update_one(
+            result = await self.carts.update_one(
                 {"_id": cart["_id"], "items._id": ObjectId(cart_item_id)},
                 {"$inc": {"items.$.quantity": -1}}
             )
@@ -566,7 +791,9 @@ class EcommerceService:
         """Get popular products (you can implement logic based on your needs)"""
         try:
             # For now, just return recent products
-            products = list(self.products.find().sort("createdAt", -1).limit(limit))
+            if self._use_catalog():
+                return self.catalog.newest(limit)
+            products = await self.products.find().sort("createdAt", -1).limit(limit).to_list(length=None)
             return [self._serialize_doc(product) for product in products]
         except Exception as e:
             print(f"Error fetching popular products: {e}")
@@ -582,18 +809,18 @@ class EcommerceService:
         """Get next order number from counter collection (matches backend logic)"""
         try:
             # Try to find and increment counter
-            counter = self.counters.find_one({"id": "order"})
+            counter = await self.counters.find_one({"id": "order"})
             if counter:
                 # Update and get new value
-                self.counters.update_one(
+                await self.counters.update_one(
                     {"id": "order"},
                     {"$inc": {"seq": 1}}
                 )
-                updated_counter = self.counters.find_one({"id": "order"})
+                updated_counter = await self.counters.find_one({"id": "order"})
                 return updated_counter["seq"]
             else:
                 # Initialize if doesn't exist
-                self.counters.insert_one({"id": "order", "seq": 1})
+                await self.counters.insert_one({"id": "order", "seq": 1})
                 return 1
         except Exception as e:
             print(f"Error getting next order number: {e}")
@@ -606,7 +833,7 @@ class EcommerceService:
         """Get all orders for a specific user"""
         try:
             print(f"[debug] Getting orders for user: {user_id}")
-            orders = list(self.orders.find({"user": user_id}).sort("createdAt", -1))
+            orders = await self.orders.find({"user": user_id}).sort("createdAt", -1).to_list(length=None)
             serialized_orders = [self._serialize_doc(order) for order in orders]
             print(f"[debug] Found {len(serialized_orders)} orders")
             return {"success": True, "orders": serialized_orders}
@@ -618,7 +845,7 @@ class EcommerceService:
         """Get detailed information about a specific order"""
         try:
             print(f"[debug] Getting order details for: {order_id}")
-            order = self.orders.find_one({"_id": ObjectId(order_id)})
+            order = await self.orders.find_one({"_id": ObjectId(order_id)})
             if not order:
                 return {"success": False, "message": "Order not found"}
             return {"success": True, "order": self._serialize_doc(order)}
@@ -645,7 +872,7 @@ class EcommerceService:
             if user_id:
                 query["user"] = user_id
             
-            order = self.orders.find_one(query)
+            order = await self.orders.find_one(query)
             if not order:
                 return {"success": False, "message": f"Order with number/tracking '{order_number}' not found"}
             
@@ -662,7 +889,7 @@ class EcommerceService:
             print(f"[debug] Attempting to cancel order: {order_id}")
             
             # Check if order exists and is eligible for cancellation
-            order = self.orders.find_one({"_id": ObjectId(order_id)})
+            order = await self.orders.find_one({"_id": ObjectId(order_id)})
             if not order:
                 return {"success": False, "message": "Order not found"}
             
@@ -670,7 +897,7 @@ class EcommerceService:
                 return {"success": False, "message": "Cannot cancel shipped or delivered orders"}
             
             # Update order status to cancelled
-            result = self.orders.update_one(
+            result = await self.orders.update_one(
                 {"_id": ObjectId(order_id)},
                 {"$set": {"orderStatus": "cancelled", "updatedAt": datetime.utcnow()}}
             )
@@ -693,11 +920,12 @@ class EcommerceService:
             print(f"[debug] Shipping address provided: {shipping_address}")
             
             # Get cart and cart items
-            cart = self.carts.find_one({"user": user_id})
+            cart = await self.carts.find_one({"user": user_id})
             if not cart:
                 return {"success": False, "message": "Cart not found"}
             
-            cart_items = await self.get_cart_items(user_id)
+            # Reuse the cart document instead of reading it a second time
+            cart_items = await self._build_cart_items(cart)
             if not cart_items:
                 return {"success": False, "message": "Cart is empty"}
             
@@ -780,7 +1008,7 @@ class EcommerceService:
                     
                     # Increment coupon usage count (backend uses timesUsed)
                     if coupon.get("_id"):
-                        self.coupons.update_one(
+                        await self.coupons.update_one(
                             {"_id": ObjectId(coupon["_id"])},
                             {"$inc": {"timesUsed": 1}}
                         )
@@ -790,7 +1018,7 @@ class EcommerceService:
                     order_data["couponUsed"] = 0
             
             # Create the order
-            result = self.orders.insert_one(order_data)
+            result = await self.orders.insert_one(order_data)
             
             if result.inserted_id:
                 # Clear the cart (empty items, don't delete cart)
@@ -814,11 +1042,12 @@ class EcommerceService:
     async def empty_user_cart(self, user_id: str) -> Dict:
         """Remove all items from user's cart"""
         try:
+            _invalidate_cart_memo()
             # Cart uses "user" field as string, not ObjectId
-            cart = self.carts.find_one({"user": user_id})
+            cart = await self.carts.find_one({"user": user_id})
             if cart:
                 # Remove all items from the cart
-                result = self.carts.update_one(
+                result = await self.carts.update_one(
                     {"_id": cart["_id"]},
                     {"$set": {"items": [], "updatedAt": datetime.utcnow()}}
                 )
@@ -837,7 +1066,7 @@ class EcommerceService:
         try:
             print(f"[debug] Getting shipping addresses for user: {user_id}")
             # Backend uses 'user' field as string, not ObjectId
-            addresses = list(self.shippings.find({"user": user_id}).sort("createdAt", -1))
+            addresses = await self.shippings.find({"user": user_id}).sort("createdAt", -1).to_list(length=None)
             print(f"[debug] Found {len(addresses)} shipping addresses")
             
             serialized_addresses = [self._serialize_doc(address) for address in addresses]
@@ -879,8 +1108,8 @@ class EcommerceService:
                 "updatedAt": datetime.utcnow()
             }
             
-            result = self.shippings.insert_one(shipping_doc)
-            created_address = self.shippings.find_one({"_id": result.inserted_id})
+            result = await self.shippings.insert_one(shipping_doc)
+            created_address = await self.shippings.find_one({"_id": result.inserted_id})
             
             return {
                 "success": True,
@@ -898,7 +1127,7 @@ class EcommerceService:
             print(f"[debug] Updating shipping address: {address_id} for user: {user_id}")
             
             # Check if address belongs to user (backend uses string user field)
-            address = self.shippings.find_one({
+            address = await self.shippings.find_one({
                 "_id": ObjectId(address_id),
                 "user": user_id
             })
@@ -914,13 +1143,13 @@ class EcommerceService:
                 if field in address_data:
                     update_data[field] = address_data[field]
             
-            result = self.shippings.update_one(
+            result = await self.shippings.update_one(
                 {"_id": ObjectId(address_id)},
                 {"$set": update_data}
             )
             
             if result.modified_count > 0:
-                updated_address = self.shippings.find_one({"_id": ObjectId(address_id)})
+                updated_address = await self.shippings.find_one({"_id": ObjectId(address_id)})
                 return {
                     "success": True,
                     "message": "Shipping address updated successfully",
@@ -942,7 +1171,7 @@ class EcommerceService:
         try:
             print(f"[debug] Validating coupon: {coupon_code} for cart total: ${cart_total}, user: {user_id}")
             
-            coupon = self.coupons.find_one({"code": coupon_code.upper()})
+            coupon = await self.coupons.find_one({"code": coupon_code.upper()})
             if not coupon:
                 return {"success": True, "valid": False, "message": "Invalid coupon code."}
             
@@ -1002,13 +1231,13 @@ class EcommerceService:
             print(f"[debug] Current time: {current_time}")
             
             # Backend schema: check validUntil and maxUses/timesUsed
-            all_coupons = list(self.coupons.find({}))
+            all_coupons = await self.coupons.find({}).to_list(length=None)
             print(f"[debug] Total coupons in database: {len(all_coupons)}")
             
             # Check which coupons are valid
-            coupons = list(self.coupons.find({
+            coupons = await self.coupons.find({
                 "validUntil": {"$gte": current_time}
-            }))
+            }).to_list(length=None)
             print(f"[debug] Non-expired coupons: {len(coupons)}")
             
             # Filter out coupons that have reached usage limit
@@ -1065,8 +1294,8 @@ class EcommerceService:
                 "updatedAt": datetime.utcnow()
             }
             
-            result = custom_pcs.insert_one(pc_build_doc)
-            created_build = custom_pcs.find_one({"_id": result.inserted_id})
+            result = await custom_pcs.insert_one(pc_build_doc)
+            created_build = await custom_pcs.find_one({"_id": result.inserted_id})
             
             return {
                 "success": True,
@@ -1087,18 +1316,21 @@ class EcommerceService:
             print(f"[debug] Getting PC build: {build_id}")
             custom_pcs = self.db.custompcs
             
-            build = custom_pcs.find_one({"_id": ObjectId(build_id)})
+            build = await custom_pcs.find_one({"_id": ObjectId(build_id)})
             if not build:
                 return {"success": False, "message": "PC build not found"}
             
-            # Populate component products if they exist
+            # Populate component products if they exist (one query for all components)
             if "components" in build:
-                for comp_type in ["ram", "ssd", "cpu"]:
-                    if comp_type in build["components"] and "product" in build["components"][comp_type]:
-                        product_id = build["components"][comp_type]["product"]
-                        product = await self.get_product_by_id(str(product_id))
-                        if product:
-                            build["components"][comp_type]["productDetails"] = product
+                selected = {
+                    comp_type: str(build["components"][comp_type]["product"])
+                    for comp_type in ["ram", "ssd", "cpu"]
+                    if comp_type in build["components"] and "product" in build["components"][comp_type]
+                }
+                products = await self.get_products_by_ids(list(selected.values()))
+                for comp_type, product_id in selected.items():
+                    if product_id in products:
+                        build["components"][comp_type]["productDetails"] = products[product_id]
             
             return {"success": True, "pcBuild": self._serialize_doc(build)}
         except InvalidId:
@@ -1115,7 +1347,7 @@ class EcommerceService:
             print(f"[debug] Getting PC builds for user: {user_id}")
             custom_pcs = self.db.custompcs
             
-            builds = list(custom_pcs.find({"user": user_id}).sort("createdAt", -1))
+            builds = await custom_pcs.find({"user": user_id}).sort("createdAt", -1).to_list(length=None)
             serialized_builds = [self._serialize_doc(build) for build in builds]
             
             return {"success": True, "builds": serialized_builds}
@@ -1133,7 +1365,7 @@ class EcommerceService:
                 return {"success": False, "message": f"Invalid component type. Must be one of: {', '.join(valid_types)}"}
             
             custom_pcs = self.db.custompcs
-            build = custom_pcs.find_one({"_id": ObjectId(build_id)})
+            build = await custom_pcs.find_one({"_id": ObjectId(build_id)})
             
             if not build:
                 return {"success": False, "message": "PC build not found"}
@@ -1193,12 +1425,12 @@ class EcommerceService:
                 update_data["status"] = "completed"
                 next_message = "Perfect! Your PC build is complete!"
             
-            custom_pcs.update_one(
+            await custom_pcs.update_one(
                 {"_id": ObjectId(build_id)},
                 {"$set": update_data}
             )
             
-            updated_build = custom_pcs.find_one({"_id": ObjectId(build_id)})
+            updated_build = await custom_pcs.find_one({"_id": ObjectId(build_id)})
             
             return {
                 "success": True,
@@ -1214,14 +1446,71 @@ class EcommerceService:
             import traceback
             traceback.print_exc()
             return {"success": False, "message": "Failed to add component"}
-    
+
+    async def save_pc_build(self, user_id: str, session_id: str, components: Dict) -> Dict:
+        """
+        Save a finished PC build in one write
+
+        Args:
+            user_id: Owner of the build
+            session_id: Chat session the build was made in
+            components: Component type -> {"product": product ID, ...} as selected in the chat
+
+        Returns:
+            Result with the build ID and the saved build; names and prices are
+            taken from the catalog at save time
+        """
+        try:
+            print(f"[debug] Saving PC build for user: {user_id}, session: {session_id}")
+
+            products = await self.get_products_by_ids([str(comp["product"]) for comp in components.values()])
+            saved_components = {}
+            for comp_type, comp in components.items():
+                product = products.get(str(comp["product"]))
+                if not product:
+                    print(f"[debug] Dropping {comp_type} from build: product {comp['product']} not found")
+                    continue
+                saved_components[comp_type] = {
+                    "product": ObjectId(product["_id"]),
+                    "name": product["name"],
+                    "price": product["price"],
+                    "specifications": product.get("specifications", {})
+                }
+            if not saved_components:
+                return {"success": False, "message": "None of the selected components are available anymore"}
+
+            now = datetime.utcnow()
+            pc_build_doc = {
+                "user": user_id,
+                "sessionId": session_id,
+                "currentStep": "complete",
+                "status": "completed",
+                "components": saved_components,
+                "totalPrice": sum(comp["price"] for comp in saved_components.values()),
+                "createdAt": now,
+                "updatedAt": now
+            }
+            result = await self.db.custompcs.insert_one(pc_build_doc)
+
+            return {
+                "success": True,
+                "message": "Perfect! Your PC build is complete!",
+                "pcBuild": self._serialize_doc(pc_build_doc),
+                "build_id": str(result.inserted_id)
+            }
+        except Exception as e:
+            print(f"Error saving PC build: {e}")
+            import traceback
+            traceback.print_exc()
+            return {"success": False, "message": "Failed to save PC build"}
+
     async def cancel_pc_build(self, build_id: str) -> Dict:
         """Cancel a PC build"""
         try:
             print(f"[debug] Cancelling PC build: {build_id}")
             custom_pcs = self.db.custompcs
             
-            result = custom_pcs.update_one(
+            result = await custom_pcs.update_one(
                 {"_id": ObjectId(build_id)},
                 {"$set": {"status": "cancelled", "updatedAt": datetime.utcnow()}}
             )
@@ -1242,7 +1531,7 @@ class EcommerceService:
             print(f"[debug] Saving PC build to cart: {build_id}")
             custom_pcs = self.db.custompcs
             
-            build = custom_pcs.find_one({"_id": ObjectId(build_id)})
+            build = await custom_pcs.find_one({"_id": ObjectId(build_id)})
             if not build:
                 return {"success": False, "message": "PC build not found"}
             
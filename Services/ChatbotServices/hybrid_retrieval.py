@@ -0,0 +1,427 @@
+"""
+Hybrid Retrieval
+TF-IDF, BM25 and (optionally) dense sentence embeddings, fused with reciprocal-rank fusion
+
+Each signal ranks candidates independently and the rankings are combined with
+RRF (score = sum of 1 / (RRF_K + rank)), so the differently scaled scores never
+have to be calibrated against each other:
+
+- TF-IDF cosine (the capped-vocabulary SparseRetriever this class extends)
+- BM25 over an uncapped unigram vocabulary, precomputed into a CSR weight
+  matrix so a query is one sparse matrix-vector product
+- Dense embeddings from a local sentence-transformers model, only when
+  RAG_EMBEDDING_MODEL_PATH points at model files on disk. The model is loaded
+  with local_files_only, so nothing is downloaded at runtime. Corpora of
+  RAG_ANN_MIN_DOCUMENTS or more are searched through a FAISS HNSW index when
+  faiss is installed; smaller ones (or installs without faiss) use an exact
+  matrix product.
+
+BM25 arrays, embeddings and the HNSW graph are stored in the same versioned
+bundle as the TF-IDF matrix, and the embedding model is part of the content
+hash, so switching models rebuilds the bundle.
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+from .retrieval_engine import MATRIX_ARRAYS, MMAP_ENABLED, SparseRetriever, top_k_indices
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+# Local directory of a sentence-transformers model; dense retrieval is off when unset
+EMBEDDING_MODEL_PATH = os.getenv("RAG_EMBEDDING_MODEL_PATH", "")
+EMBEDDING_BATCH_SIZE = int(os.getenv("RAG_EMBEDDING_BATCH_SIZE", "64"))
+
+# Batches encoded per chunk at build time, bounding the model's working memory
+EMBEDDING_CHUNK_BATCHES = 16
+
+# Dense hits below this cosine similarity are treated as unrelated
+DENSE_MIN_SCORE = float(os.getenv("RAG_DENSE_MIN_SCORE", "0.35"))
+
+# Corpus size from which dense search goes through the HNSW index
+ANN_MIN_DOCUMENTS = int(os.getenv("RAG_ANN_MIN_DOCUMENTS", "2000"))
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = int(os.getenv("RAG_HNSW_EF_SEARCH", "64"))
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Standard RRF damping constant
+RRF_K = 60
+
+# Each signal contributes this many candidates per requested result
+CANDIDATE_MULTIPLIER = 4
+MIN_CANDIDATES = 20
+
+# Scores at or below this count as "no match" for a signal
+MIN_SIGNAL = 1e-6
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[int]], k: int = RRF_K) -> List[int]:
+    """Merge ranked lists of document indices, best fused score first"""
+    fused: Dict[int, float] = {}
+    for ranking in rankings:
+        for rank, index in enumerate(ranking, start=1):
+            fused[index] = fused.get(index, 0.0) + 1.0 / (k + rank)
+    return sorted(fused, key=fused.get, reverse=True)
+
+
+class SentenceEmbedder:
+    """Normalized sentence embeddings from a local model, computed on CPU in batches"""
+
+    def __init__(self, model_path: str, batch_size: int = EMBEDDING_BATCH_SIZE):
+        # Never reach out to the Hugging Face hub; the model must already be on disk
+        self.model = SentenceTransformer(model_path, device="cpu", local_files_only=True)
+        self.name = os.path.basename(os.path.normpath(model_path))
+        self.batch_size = batch_size
+        self.dimension = int(self.model.get_sentence_embedding_dimension())
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts into a (len(texts), dimension) float32 array of unit vectors"""
+        texts = list(texts)
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        chunk = self.batch_size * EMBEDDING_CHUNK_BATCHES
+        for start in range(0, len(texts), chunk):
+            embeddings[start:start + chunk] = self.model.encode(
+                texts[start:start + chunk],
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+        return embeddings
+
+
+_embedder: Optional[SentenceEmbedder] = None
+_embedder_resolved = False
+_embedder_lock = threading.Lock()
+
+
+def get_embedder() -> Optional[SentenceEmbedder]:
+    """Shared embedder, or None when no local model is configured or it can't be loaded"""
+    global _embedder, _embedder_resolved
+    with _embedder_lock:
+        if _embedder_resolved:
+            return _embedder
+        _embedder_resolved = True
+        if not EMBEDDING_MODEL_PATH:
+            return None
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            logging.warning("RAG_EMBEDDING_MODEL_PATH is set but sentence-transformers is not installed; "
+                            "dense retrieval disabled")
+            return None
+        if not os.path.isdir(EMBEDDING_MODEL_PATH):
+            logging.warning(f"Embedding model directory {EMBEDDING_MODEL_PATH} not found; dense retrieval disabled")
+            return None
+        try:
+            _embedder = SentenceEmbedder(EMBEDDING_MODEL_PATH)
+            logging.info(f"Loaded embedding model {_embedder.name} ({_embedder.dimension} dimensions)")
+        except Exception as e:
+            logging.error(f"Error loading embedding model: {e}")
+        return _embedder
+
+
+class BM25Index:
+    """
+    Okapi BM25 as a precomputed sparse weight matrix
+
+    Each stored value is the full BM25 term weight of a (document, term) pair,
+    so scoring a query is a sum over the query's columns. Scores are divided by
+    the query's ceiling (the sum of its term idfs times k1 + 1), which puts
+    them in [0, 1) and makes them comparable to a similarity threshold.
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self.vectorizer: Optional[CountVectorizer] = None
+        self.idf: Optional[np.ndarray] = None
+        self.average_length = 1.0
+        self.matrix: Optional[sparse.csr_matrix] = None
+        self.delta: Optional[sparse.csr_matrix] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.vectorizer is not None and self.matrix is not None
+
+    def fit(self, documents: Sequence[str]):
+        self.vectorizer = CountVectorizer(stop_words='english', lowercase=True, dtype=np.float32)
+        counts = sparse.csr_matrix(self.vectorizer.fit_transform(documents), dtype=np.float32)
+        document_frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+        self.idf = np.log1p((counts.shape[0] - document_frequency + 0.5) / (document_frequency + 0.5)).astype(np.float32)
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        self.average_length = float(lengths.mean()) if lengths.size and lengths.mean() > 0 else 1.0
+        self.matrix = self._weigh(counts, lengths)
+        self.delta = None
+
+    def _weigh(self, counts: sparse.csr_matrix, lengths: np.ndarray) -> sparse.csr_matrix:
+        """Turn raw term counts into BM25 term weights in place"""
+        row_lengths = np.repeat(lengths, np.diff(counts.indptr))
+        tf = counts.data
+        norm = self.k1 * (1 - self.b + self.b * row_lengths / self.average_length)
+        counts.data = (self.idf[counts.indices] * tf * (self.k1 + 1) / (tf + norm)).astype(np.float32)
+        return counts
+
+    def with_documents(self, documents: Sequence[str]) -> "BM25Index":
+        """Copy with new documents weighted by the fitted idf and average length"""
+        counts = sparse.csr_matrix(self.vectorizer.transform(documents), dtype=np.float32)
+        rows = self._weigh(counts, np.asarray(counts.sum(axis=1)).ravel())
+        extended = copy.copy(self)
+        extended.delta = rows if self.delta is None else sparse.vstack([self.delta, rows], format="csr")
+        return extended
+
+    def scores(self, query: str) -> Optional[np.ndarray]:
+        """Normalized BM25 score of every document, or None if no query term is indexed"""
+        columns = np.unique(self.vectorizer.transform([query]).indices)
+        if columns.size == 0:
+            return None
+        query_vector = sparse.csr_matrix(
+            (np.ones(columns.size, dtype=np.float32), columns, [0, columns.size]),
+            shape=(1, self.matrix.shape[1])
+        )
+        scores = (self.matrix @ query_vector.T).toarray().ravel()
+        if self.delta is not None:
+            scores = np.concatenate([scores, (self.delta @ query_vector.T).toarray().ravel()])
+        return scores / (float(self.idf[columns].sum()) * (self.k1 + 1))
+
+    def save(self, directory: str) -> Dict:
+        vocabulary = [None] * len(self.vectorizer.vocabulary_)
+        for term, column in self.vectorizer.vocabulary_.items():
+            vocabulary[column] = term
+        with open(os.path.join(directory, "bm25_vocabulary.json"), 'w', encoding='utf-8') as f:
+            json.dump(vocabulary, f)
+        np.save(os.path.join(directory, "bm25_idf.npy"), self.idf)
+        for name in MATRIX_ARRAYS:
+            np.save(os.path.join(directory, f"bm25_{name}.npy"), getattr(self.matrix, name))
+        return {"k1": self.k1, "b": self.b, "average_length": self.average_length, "shape": list(self.matrix.shape)}
+
+    def load(self, directory: str, manifest: Dict):
+        with open(os.path.join(directory, "bm25_vocabulary.json"), 'r', encoding='utf-8') as f:
+            vocabulary = json.load(f)
+        mmap_mode = 'r' if MMAP_ENABLED else None
+        data, indices, indptr = (
+            np.load(os.path.join(directory, f"bm25_{name}.npy"), mmap_mode=mmap_mode) for name in MATRIX_ARRAYS
+        )
+        self.vectorizer = CountVectorizer(
+            stop_words='english', lowercase=True, dtype=np.float32,
+            vocabulary={term: column for column, term in enumerate(vocabulary)}
+        )
+        self.idf = np.load(os.path.join(directory, "bm25_idf.npy"))
+        self.average_length = manifest["average_length"]
+        self.matrix = sparse.csr_matrix((data, indices, indptr), shape=tuple(manifest["shape"]), copy=False)
+        self.delta = None
+
+
+class DenseIndex:
+    """Embedding matrix with an optional FAISS HNSW graph over it (inner product = cosine)"""
+
+    def __init__(self, embedder: SentenceEmbedder):
+        self.embedder = embedder
+        self.embeddings: Optional[np.ndarray] = None
+        self.delta: Optional[np.ndarray] = None
+        self.ann = None
+
+    def fit(self, documents: Sequence[str]):
+        self.embeddings = self.embedder.encode(documents)
+        self.delta = None
+        self.ann = self._build_ann(self.embeddings)
+
+    @staticmethod
+    def _build_ann(vectors: np.ndarray):
+        if not FAISS_AVAILABLE or len(vectors) < ANN_MIN_DOCUMENTS:
+            return None
+        index = faiss.IndexHNSWFlat(vectors.shape[1], HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.add(np.ascontiguousarray(vectors, dtype=np.float32))
+        logging.info(f"Built HNSW index over {index.ntotal} embeddings")
+        return index
+
+    def with_documents(self, documents: Sequence[str]) -> "DenseIndex":
+        """Copy with new documents embedded into the delta (and added to a copy of the HNSW graph)"""
+        vectors = self.embedder.encode(documents)
+        extended = copy.copy(self)
+        extended.delta = vectors if self.delta is None else np.vstack([self.delta, vectors])
+        if self.ann is not None:
+            # HNSW isn't safe to add to while other threads search it, so the graph
+            # is cloned; ids continue after the main rows
+            extended.ann = faiss.clone_index(self.ann)
+            extended.ann.add(vectors)
+        return extended
+
+    def search(self, query: str, top_k: int) -> List[Tuple[int, float]]:
+        """(document_index, cosine) pairs at or above DENSE_MIN_SCORE, best first"""
+        query_vector = self.embedder.encode([query])
+        if self.ann is not None:
+            # Per-call parameters: the shared index is never mutated by a search
+            params = faiss.SearchParametersHNSW(efSearch=max(HNSW_EF_SEARCH, top_k))
+            scores, indices = self.ann.search(query_vector, top_k, params=params)
+            return [
+                (int(index), float(score)) for index, score in zip(indices[0], scores[0])
+                if index >= 0 and score >= DENSE_MIN_SCORE
+            ]
+
+        scores = self.embeddings @ query_vector[0]
+        if self.delta is not None:
+            scores = np.concatenate([scores, self.delta @ query_vector[0]])
+        return top_k_indices(scores, top_k, DENSE_MIN_SCORE)
+
+    def save(self, directory: str) -> Dict:
+        np.save(os.path.join(directory, "embeddings.npy"), self.embeddings)
+        if self.ann is not None:
+            faiss.write_index(self.ann, os.path.join(directory, "hnsw.faiss"))
+        return {"model": self.embedder.name, "dimension": self.embedder.dimension, "ann": self.ann is not None}
+
+    def load(self, directory: str, manifest: Dict):
+        mmap_mode = 'r' if MMAP_ENABLED else None
+        self.embeddings = np.load(os.path.join(directory, "embeddings.npy"), mmap_mode=mmap_mode)
+        self.delta = None
+        ann_file = os.path.join(directory, "hnsw.faiss")
+        if FAISS_AVAILABLE and os.path.exists(ann_file):
+            self.ann = faiss.read_index(ann_file)
+        else:
+            # Bundle written without faiss, or faiss installed since
+            self.ann = self._build_ann(np.asarray(self.embeddings))
+
+
+class HybridRetriever(SparseRetriever):
+    """
+    SparseRetriever that re-ranks with BM25 and dense embeddings via RRF
+
+    Results are ordered by fused rank, but the score returned with each result
+    is its best similarity across the signals (TF-IDF cosine, normalized BM25,
+    embedding cosine), so callers' min_score thresholds and displayed relevance
+    keep their meaning.
+    """
+
+    def __init__(self, **vectorizer_params):
+        """
+        Args:
+            **vectorizer_params: TfidfVectorizer settings for the TF-IDF signal
+        """
+        super().__init__(**vectorizer_params)
+        self.bm25 = BM25Index()
+        self.embedder = get_embedder()
+        self.dense: Optional[DenseIndex] = DenseIndex(self.embedder) if self.embedder is not None else None
+
+    @property
+    def is_ready(self) -> bool:
+        return super().is_ready and self.bm25.is_ready
+
+    @property
+    def fingerprint(self) -> Dict:
+        return {
+            **self.vectorizer_params,
+            "bm25": {"k1": self.bm25.k1, "b": self.bm25.b},
+            # fit() drops the dense index when embedding fails, so a lexical-only bundle never claims a model
+            "embedding_model": self.embedder.name if self.dense is not None else None,
+        }
+
+    def fit(self, documents: Sequence[str]):
+        super().fit(documents)
+        self.bm25.fit(documents)
+        if self.dense is not None:
+            try:
+                self.dense.fit(documents)
+                logging.info(f"Embedded {len(documents)} documents with {self.embedder.name}")
+            except Exception as e:
+                # Lexical retrieval still works without the dense signal
+                logging.error(f"Error embedding documents, dense retrieval disabled: {e}")
+                self.embedder = None
+                self.dense = None
+
+    def _append(self, documents: Sequence[str]):
+        super()._append(documents)
+        self.bm25 = self.bm25.with_documents(documents)
+        if self.dense is not None:
+            self.dense = self.dense.with_documents(documents)
+
+    def _save_extra(self, staging: str) -> Dict:
+        return {
+            "bm25": self.bm25.save(staging),
+            "dense": self.dense.save(staging) if self.dense is not None else None,
+        }
+
+    def _load_extra(self, path: str, manifest: Dict) -> bool:
+        if "bm25" not in manifest:
+            return False
+        dense_manifest = manifest.get("dense")
+        if self.dense is not None and (not dense_manifest or dense_manifest.get("model") != self.embedder.name):
+            return False
+        self.bm25.load(path, manifest["bm25"])
+        if self.dense is not None:
+            self.dense.load(path, dense_manifest)
+        return True
+
+    def search(self, query: str, top_k: int, min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """
+        Find the documents most relevant to a query
+
+        Args:
+            query: Search query string
+            top_k: Number of results to return
+            min_score: Minimum best-signal similarity
+
+        Returns:
+            List of (document_index, similarity) tuples in fused rank order
+        """
+        if not self.is_ready or top_k <= 0:
+            return []
+
+        pool = max(top_k * CANDIDATE_MULTIPLIER, MIN_CANDIDATES)
+        similarity: Optional[np.ndarray] = None
+        rankings = []
+        for scores in (self.similarities(query), self.bm25.scores(query)):
+            if scores is None:
+                continue
+            similarity = scores.astype(np.float32) if similarity is None else np.maximum(similarity, scores)
+            rankings.append([index for index, _ in top_k_indices(scores, pool, MIN_SIGNAL)])
+
+        if self.dense is not None:
+            hits = self.dense.search(query, pool)
+            if hits:
+                if similarity is None:
+                    similarity = np.zeros(self.document_count, dtype=np.float32)
+                for index, score in hits:
+                    similarity[index] = max(similarity[index], score)
+                rankings.append([index for index, _ in hits])
+
+        if similarity is None:
+            return []
+        threshold = max(min_score, MIN_SIGNAL)
+        results = [
+            (index, float(similarity[index])) for index in reciprocal_rank_fusion(rankings)
+            if similarity[index] >= threshold
+        ]
+        return results[:top_k]
+
+    @property
+    def document_count(self) -> int:
+        return self.matrix.shape[0] + (0 if self.delta is None else self.delta.shape[0])
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        if not self.is_ready:
+            return stats
+        stats["bm25_terms"] = self.bm25.matrix.shape[1]
+        stats["embedding_model"] = self.embedder.name if self.embedder is not None else None
+        stats["ann"] = self.dense is not None and self.dense.ann is not None
+        return stats
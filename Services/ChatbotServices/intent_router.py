@@ -0,0 +1,374 @@
+"""
+Fast-Path Intent Router
+Answers deterministic requests ("show my cart", "my orders", "list categories") without the LLM
+
+Two stages, both local:
+
+1. Regex rules over the normalized message. They are anchored to the whole
+   message, so "show my cart and add a mouse" never matches "show my cart".
+2. An optional classifier (TF-IDF character n-grams + logistic regression)
+   that catches paraphrases of the slot-free intents in short messages. It is
+   only trusted above INTENT_CLASSIFIER_THRESHOLD.
+
+Anything else returns None and goes to the LLM as before. Only read-only tools
+are dispatched, so a misrouted message can't change a cart or an order.
+
+Train the classifier from the seed examples plus historical chat logs
+(an export of chatbot_db.conversations) with:
+
+    mongoexport --uri "$MONGO_URI" --db chatbot_db --collection conversations --jsonArray -o conversations.json
+    python intent_router.py conversations.json [intent_model.joblib]
+
+Historical user messages are labelled by the rules, so the classifier learns
+the phrasings users actually type around them.
+"""
+
+import json
+import logging
+import os
+import re
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+
+INTENT_ROUTER_ENABLED = os.getenv("INTENT_ROUTER_ENABLED", "true").lower() == "true"
+INTENT_MODEL_FILE = "intent_model.joblib"
+INTENT_MODEL_PATH = os.getenv(
+    "INTENT_MODEL_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), INTENT_MODEL_FILE)
+)
+INTENT_CLASSIFIER_THRESHOLD = float(os.getenv("INTENT_CLASSIFIER_THRESHOLD", "0.85"))
+
+# Longer messages usually carry more than one request; leave them to the LLM
+MAX_CLASSIFIER_WORDS = 8
+
+VIEW_CART = "view_cart"
+MY_ORDERS = "my_orders"
+TRACK_ORDER = "track_order"
+LIST_CATEGORIES = "list_categories"
+PRICE_RANGE = "price_range"
+COUPONS = "coupons"
+OTHER = "other"
+
+# Intent -> tool it is dispatched to
+INTENT_TOOLS = {
+    VIEW_CART: "get_cart_summary_tool",
+    MY_ORDERS: "get_orders_tool",
+    TRACK_ORDER: "track_order_tool",
+    LIST_CATEGORIES: "get_product_categories_tool",
+    PRICE_RANGE: "get_price_range_tool",
+    COUPONS: "get_available_coupons_tool",
+}
+
+# Intents with a slot (an order number) come from the rules only
+CLASSIFIER_INTENTS = {VIEW_CART, MY_ORDERS, LIST_CATEGORIES, PRICE_RANGE, COUPONS}
+
+POLITE_PREFIX = re.compile(r"^(?:(?:please|pls|hey|hi|ok|okay|so|now|and)\s+)*(?:(?:can|could|would) you\s+)?(?:please\s+)?")
+POLITE_SUFFIX = re.compile(r"(?:\s+(?:please|pls|thanks|thank you))+$")
+# Order and tracking numbers always contain a digit ("track my order" has no number to track)
+ORDER_NUMBER = r"#?(?P<number>(?=[a-z-]*\d)(?:th-)?[a-z0-9]{3,20})"
+
+RULES: List[Tuple[str, re.Pattern]] = [
+    (VIEW_CART, re.compile(
+        r"^(?:(?:show|view|see|check|open|display|get)(?: me)? )?(?:my |the )?(?:shopping )?cart"
+        r"(?: (?:summary|contents|items|total))?$"
+    )),
+    (VIEW_CART, re.compile(r"^(?:what s|whats|what is|what do i have) in (?:my|the) cart$")),
+    (MY_ORDERS, re.compile(
+        r"^(?:(?:show|view|see|list|check|get)(?: me)? )?(?:all )?my (?:past |recent |previous )?orders$"
+    )),
+    (MY_ORDERS, re.compile(r"^(?:my )?(?:order|purchase) history$")),
+    (TRACK_ORDER, re.compile(r"^(?:track|trace)(?: my)?(?: order)? " + ORDER_NUMBER + r"$")),
+    (TRACK_ORDER, re.compile(
+        r"^(?:where is|wheres|status of|order status(?: for| of)?)(?: my)?(?: order)? " + ORDER_NUMBER + r"$"
+    )),
+    (LIST_CATEGORIES, re.compile(
+        r"^(?:(?:show|list|view|see|get)(?: me)? )?(?:all )?(?:the )?(?:product |shop )?categories$"
+    )),
+    (LIST_CATEGORIES, re.compile(r"^(?:what|which) (?:product )?categories (?:do you have|are there|do you sell)$")),
+    (PRICE_RANGE, re.compile(r"^(?:(?:what s|whats|what is|show)(?: me)? )?(?:the |your )?price range$")),
+    (COUPONS, re.compile(
+        r"^(?:(?:show|list|view|get)(?: me)? |any |(?:what|which) )?(?:the |all )?(?:available |active )?"
+        r"(?:coupons?|coupon codes|discount codes|promo codes)(?: (?:available|are available|do you have))?$"
+    )),
+]
+
+# Seed phrasings for the classifier; historical messages labelled by RULES are added at training time
+SEED_EXAMPLES: Dict[str, List[str]] = {
+    VIEW_CART: [
+        "show my cart", "what's in my cart", "view cart", "cart", "my cart", "show cart contents",
+        "what did i put in my cart", "open my basket", "show me my basket", "check my cart please",
+        "what items are in my cart", "cart summary", "how much is in my cart", "what's my cart total",
+    ],
+    MY_ORDERS: [
+        "my orders", "show my orders", "order history", "list my orders", "what have i ordered",
+        "show me my past orders", "my purchase history", "what did i buy before", "previous orders",
+        "see all my orders", "show my recent purchases",
+    ],
+    LIST_CATEGORIES: [
+        "list categories", "what categories do you have", "show categories", "product categories",
+        "what kind of products do you sell", "what do you sell", "which categories are there",
+        "what sections does the store have", "show me all categories", "browse categories",
+    ],
+    PRICE_RANGE: [
+        "price range", "what is the price range", "how expensive are your products", "what are your prices like",
+        "cheapest and most expensive products", "what's your price range", "how much do products cost in general",
+        "min and max prices",
+    ],
+    COUPONS: [
+        "coupons", "any coupons", "show coupons", "available coupon codes", "do you have any discount codes",
+        "are there any promo codes", "discount codes", "what coupons can i use", "any deals or coupons",
+        "list active coupons",
+    ],
+    OTHER: [
+        "add the rtx 4070 to my cart", "remove the mouse from my cart", "empty my cart", "checkout",
+        "proceed to checkout", "place order", "apply coupon SAVE10", "build a pc", "i want to build a pc",
+        "show me gaming laptops", "laptops under 1000", "do you have 32gb ram", "best gpu for gaming",
+        "what is your return policy", "how long does shipping take", "do you ship internationally",
+        "compare ryzen 7 and i7", "is the samsung ssd in stock", "cancel my order", "i need help with my order",
+        "recommend a monitor", "what's the warranty on keyboards", "hello how are you", "who are you",
+        "track my order", "where is my order", "confirm address 1", "no coupon", "continue to final review",
+        "change quantity to 2", "what is the price of the logitech mouse", "cheapest ssd",
+    ],
+}
+
+
+def normalize(message: str) -> str:
+    """Lowercase, drop punctuation (keeping order-number dashes) and politeness padding"""
+    text = message.lower().replace("'", " ").replace("’", " ")
+    text = re.sub(r"[^a-z0-9#\- ]+", " ", text)
+    text = " ".join(text.split())
+    text = POLITE_PREFIX.sub("", text)
+    return POLITE_SUFFIX.sub("", text).strip()
+
+
+def match_rules(message: str) -> Optional[Tuple[str, Dict]]:
+    """(intent, slots) for a message a rule matches, or None"""
+    text = normalize(message)
+    for intent, pattern in RULES:
+        match = pattern.match(text)
+        if match:
+            return intent, {key: value for key, value in match.groupdict().items() if value}
+    return None
+
+
+# =============== RENDERING ===============
+
+def _render_cart(output: Dict) -> Optional[str]:
+    items = output.get("items")
+    if items is None:
+        return None
+    if not items:
+        return "🛒 Your cart is empty. What are you looking for?"
+    lines = [f"🛒 **Your Cart** ({output.get('total_items', len(items))} items)\n"]
+    for item in items:
+        product = item.get("product") or {}
+        lines.append(f"• {product.get('name', 'Unknown')} x{item.get('quantity', 1)} - "
+                     f"${product.get('price', 0) * item.get('quantity', 1):.2f}")
+    lines.append(f"\n**Total:** ${output.get('total_price', 0):.2f}")
+    return "\n".join(lines)
+
+
+def _render_orders(output: Dict) -> Optional[str]:
+    if not output.get("success"):
+        return None
+    orders = output.get("orders") or []
+    if not orders:
+        return "You haven't placed any orders yet."
+    lines = [f"📦 **Your Orders** ({len(orders)})\n"]
+    for order in orders[:10]:
+        lines.append(f"• #{order.get('orderNumber', 'N/A')} - {order.get('status', 'Unknown')} - "
+                     f"${order.get('totalAmount', 0):.2f}")
+    if len(orders) > 10:
+        lines.append(f"\n...and {len(orders) - 10} more.")
+    lines.append("\nSend an order number to track it.")
+    return "\n".join(lines)
+
+
+def _render_categories(output: Dict) -> Optional[str]:
+    categories = output.get("categories")
+    if not categories:
+        return None
+    return "🗂️ **Product Categories:**\n" + "\n".join(f"• {category}" for category in categories)
+
+
+def _render_price_range(output: Dict) -> Optional[str]:
+    if not output.get("max_price"):
+        return None
+    return (f"💰 Our products range from **${output.get('min_price', 0):.2f}** to "
+            f"**${output['max_price']:.2f}**, averaging ${output.get('avg_price', 0):.2f}.")
+
+
+def _render_coupons(output: Dict) -> Optional[str]:
+    if not output.get("success"):
+        return None
+    coupons = output.get("coupons") or []
+    if not coupons:
+        return "No coupon codes are available at the moment."
+    lines = ["🎫 **Available Coupons:**"]
+    for coupon in coupons:
+        coupon_type = coupon.get("type", "UNKNOWN")
+        value = coupon.get("value", 0)
+        if coupon_type == "PERCENTAGE":
+            discount_text = f"{value}% off"
+        elif coupon_type == "FIXED_AMOUNT":
+            discount_text = f"${value} off"
+        else:
+            discount_text = coupon_type
+        lines.append(f"• **{coupon.get('code')}** - {discount_text}")
+    lines.append("\nYou can apply one during checkout.")
+    return "\n".join(lines)
+
+
+RENDERERS = {
+    VIEW_CART: _render_cart,
+    MY_ORDERS: _render_orders,
+    LIST_CATEGORIES: _render_categories,
+    PRICE_RANGE: _render_price_range,
+    COUPONS: _render_coupons,
+}
+
+
+def render(intent: str, output) -> Optional[str]:
+    """
+    Reply text for a dispatched tool's output
+
+    The tool's own `message` field wins (login prompts, order tracking);
+    otherwise the intent's renderer formats the data. None means the output
+    can't be shown as-is and the LLM should handle the turn.
+    """
+    if not isinstance(output, dict):
+        return None
+    if isinstance(output.get("message"), str) and output["message"]:
+        return output["message"]
+    if output.get("error"):
+        return None
+    renderer = RENDERERS.get(intent)
+    return renderer(output) if renderer is not None else None
+
+
+# =============== TRAINING ===============
+
+def build_training_set(history: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Seed examples plus historical user messages labelled by the rules"""
+    texts, labels = [], []
+    for intent, examples in SEED_EXAMPLES.items():
+        texts.extend(normalize(example) for example in examples)
+        labels.extend([intent] * len(examples))
+    for message in history:
+        matched = match_rules(message)
+        if matched and matched[0] in CLASSIFIER_INTENTS:
+            texts.append(normalize(message))
+            labels.append(matched[0])
+    return texts, labels
+
+
+def train_classifier(texts: List[str], labels: List[str]) -> Pipeline:
+    model = Pipeline([
+        ("tfidf", TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), sublinear_tf=True)),
+        ("classifier", LogisticRegression(max_iter=1000, C=10.0, class_weight="balanced")),
+    ])
+    model.fit(texts, labels)
+    return model
+
+
+def history_from_export(path: str) -> List[str]:
+    """User messages from a JSON array export of the conversations collection"""
+    with open(path, 'r', encoding='utf-8') as f:
+        docs = json.load(f)
+    return [
+        message["content"]
+        for doc in docs
+        for message in doc.get("messages", [])
+        if message.get("role") == "user" and isinstance(message.get("content"), str)
+    ]
+
+
+# =============== ROUTER ===============
+
+class IntentRouter:
+    """
+    Maps a user message to a read-only tool call, or None for the LLM
+
+    Rules are tried first; the classifier (loaded from INTENT_MODEL_PATH when
+    the file exists) only handles short messages the rules miss.
+    """
+
+    def __init__(self, model_path: str = INTENT_MODEL_PATH, threshold: float = INTENT_CLASSIFIER_THRESHOLD):
+        self.threshold = threshold
+        self.model = None
+        if os.path.exists(model_path):
+            try:
+                self.model = joblib.load(model_path)
+                print(f"[debug] Intent classifier loaded from {model_path}")
+            except Exception as e:
+                print(f"[debug] Intent classifier not loaded ({e}), using rules only")
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+
+    def route(self, message: str, user_id: str = "") -> Optional[Dict]:
+        """
+        Tool call for a message the fast path can answer
+
+        Returns:
+            {intent, tool, args, confidence, source} or None
+        """
+        if not message:
+            return None
+        matched = match_rules(message)
+        if matched:
+            intent, slots = matched
+            confidence, source = 1.0, "rule"
+        else:
+            intent, confidence = self._classify(message)
+            if intent is None:
+                return None
+            slots, source = {}, "classifier"
+
+        if intent in (VIEW_CART, MY_ORDERS):
+            args = {"user_id": user_id or ""}
+        elif intent == TRACK_ORDER:
+            args = {"order_number": slots["number"].upper(), "user_id": user_id or ""}
+        else:
+            args = {}
+
+        with self._lock:
+            self.counts[f"{intent}:{source}"] = self.counts.get(f"{intent}:{source}", 0) + 1
+        return {"intent": intent, "tool": INTENT_TOOLS[intent], "args": args,
+                "confidence": confidence, "source": source}
+
+    def _classify(self, message: str) -> Tuple[Optional[str], float]:
+        if self.model is None:
+            return None, 0.0
+        text = normalize(message)
+        if not text or len(text.split()) > MAX_CLASSIFIER_WORDS or any(ch.isdigit() for ch in text):
+            return None, 0.0
+        probabilities = self.model.predict_proba([text])[0]
+        best = probabilities.argmax()
+        intent = str(self.model.classes_[best])
+        if intent not in CLASSIFIER_INTENTS or probabilities[best] < self.threshold:
+            return None, float(probabilities[best])
+        return intent, float(probabilities[best])
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "enabled": INTENT_ROUTER_ENABLED,
+                "classifier": self.model is not None,
+                "threshold": self.threshold,
+                "routed": dict(self.counts),
+            }
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    history = history_from_export(sys.argv[1]) if len(sys.argv) > 1 else []
+    target = sys.argv[2] if len(sys.argv) > 2 else INTENT_MODEL_PATH
+    texts, labels = build_training_set(history)
+    joblib.dump(train_classifier(texts, labels), target)
+    logging.info(f"Trained intent classifier on {len(texts)} examples ({len(history)} historical messages), wrote {target}")
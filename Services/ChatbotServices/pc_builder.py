@@ -0,0 +1,172 @@
+"""
+PC Builder Steps
+The step table, candidate pool and message rendering behind the agent's PC builder flow
+
+Every step of the flow works the same way: show a few products of one
+category, then take a number (select), 0/skip, or a question about them. The
+agent runs all eight steps through one engine node driven by PC_BUILDER_STEPS.
+
+The build itself lives in the flow state (pc_builder_data["components"]),
+which is checkpointed with the turn, and is written to the custompcs
+collection once, when the last step is done. While the user is choosing, the
+candidates of the following step are fetched in the background, so the
+selection turn finds them in the pool instead of waiting on the catalog.
+"""
+
+import asyncio
+import copy
+from dataclasses import dataclass
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+PC_BUILDER_CANDIDATES = int(os.getenv("PC_BUILDER_CANDIDATES", "5"))
+PC_BUILDER_CANDIDATE_TTL_SECONDS = float(os.getenv("PC_BUILDER_CANDIDATE_TTL_SECONDS", "60"))
+
+# Product fields kept in the flow state for the list on screen and the question handler
+CANDIDATE_FIELDS = ("_id", "name", "price", "description", "specifications")
+
+
+@dataclass(frozen=True)
+class PCBuilderStep:
+    key: str  # pc_builder_step value and components key
+    category: str  # product category
+    label: str  # display name
+    icon: str
+    article: str  # "a" or "an", for "Choose a RAM option"
+
+
+PC_BUILDER_STEPS = [
+    PCBuilderStep("ram", "RAM", "RAM", "🖥️", "a"),
+    PCBuilderStep("ssd", "SSD", "SSD", "💾", "an"),
+    PCBuilderStep("cpu", "CPU", "CPU", "⚙️", "a"),
+    PCBuilderStep("gpu", "GPU", "GPU", "🎮", "a"),
+    PCBuilderStep("psu", "PSU", "PSU", "⚡", "a"),
+    PCBuilderStep("motherboard", "Motherboard", "Motherboard", "🔲", "a"),
+    PCBuilderStep("aircooler", "AirCooler", "Air Cooler", "❄️", "an"),
+    PCBuilderStep("case", "Case", "Case", "📦", "a"),
+]
+
+PC_BUILDER_STEP_INDEX = {step.key: index for index, step in enumerate(PC_BUILDER_STEPS)}
+
+
+def parse_selection(user_input: str) -> Optional[int]:
+    """0 for skip, the entered number for a selection, None when the input is neither"""
+    text = (user_input or "").lower().strip()
+    if "skip" in text:
+        return 0
+    if text.isdigit():
+        return int(text)
+    return None
+
+
+def component(product: Dict) -> Dict:
+    """Build entry for a selected product"""
+    return {
+        "product": product["_id"],
+        "name": product["name"],
+        "price": product["price"],
+        "specifications": product.get("specifications", {}),
+    }
+
+
+def render_step(step: PCBuilderStep, products: List[Dict]) -> str:
+    """Numbered product list for a step"""
+    number = PC_BUILDER_STEP_INDEX[step.key] + 1
+    response = f"{step.icon} **PC Builder - Step {number}: Select {step.label}**\n\n"
+    response += f"Choose {step.article} {step.label} option:\n\n"
+
+    for idx, product in enumerate(products, 1):
+        response += f"**{idx}. {product['name']}** - ${product['price']}\n"
+        if product.get('description'):
+            response += f"   {product['description'][:80]}...\n"
+        response += "\n"
+
+    response += "**0. Skip this step**\n\n"
+    response += "Enter the number of your choice (or 0 to skip):"
+    return response
+
+
+def render_summary(build: Dict) -> str:
+    """Completion message for a saved build"""
+    components = build.get("components", {})
+    summary = "🎉 **Your PC Build is Complete!**\n\n"
+    summary += "**Components:**\n"
+    for step in PC_BUILDER_STEPS:
+        if step.key in components:
+            summary += f"• {step.label}: {components[step.key]['name']} (${components[step.key]['price']})\n\n"
+    summary += f"\n**Total: ${build.get('totalPrice', 0)}**\n\n"
+    summary += "Would you like to add these components to your cart? (yes/no)"
+    return summary
+
+
+class CandidatePool:
+    """
+    Short-lived per-category product lists for the PC builder
+
+    Candidates don't depend on the user, so one pool serves every session.
+    prefetch() starts a background fetch; get() returns fresh entries at once
+    and otherwise joins the running fetch or starts one.
+    """
+
+    def __init__(self, ecommerce, limit: int = PC_BUILDER_CANDIDATES, ttl: float = PC_BUILDER_CANDIDATE_TTL_SECONDS):
+        self.ecommerce = ecommerce
+        self.limit = limit
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[List[Dict], float]] = {}
+        self._fetches: Dict[str, asyncio.Task] = {}
+
+        self.hits = 0
+        self.fetches = 0
+        self.prefetches = 0
+
+    async def get(self, category: str) -> List[Dict]:
+        """Candidates of a category (a copy the caller may keep in the flow state)"""
+        products = self._fresh(category)
+        if products is not None:
+            self.hits += 1
+            return copy.deepcopy(products)
+        task = self._fetches.get(category) or self._start(category)
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def prefetch(self, category: str):
+        """Start fetching a category in the background unless it is cached or already on its way"""
+        if self._fresh(category) is not None or category in self._fetches:
+            return
+        self.prefetches += 1
+        self._start(category)
+
+    def clear(self):
+        """Drop cached candidates (the catalog changed)"""
+        self._entries.clear()
+
+    def _fresh(self, category: str) -> Optional[List[Dict]]:
+        entry = self._entries.get(category)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    def _start(self, category: str) -> asyncio.Task:
+        task = asyncio.create_task(self._fetch(category))
+        self._fetches[category] = task
+        return task
+
+    async def _fetch(self, category: str) -> List[Dict]:
+        try:
+            self.fetches += 1
+            products = await self.ecommerce.get_products(limit=self.limit, category=category)
+            products = [{field: p[field] for field in CANDIDATE_FIELDS if field in p} for p in products]
+            # get_products returns [] on errors, so empty lists are not cached
+            if products:
+                self._entries[category] = (products, time.monotonic() + self.ttl)
+            return products
+        finally:
+            self._fetches.pop(category, None)
+
+    def stats(self) -> Dict:
+        return {
+            "cached_categories": len(self._entries),
+            "hits": self.hits,
+            "fetches": self.fetches,
+            "prefetches": self.prefetches,
+        }
@@ -0,0 +1,246 @@
+"""
+In-process Product Search Index
+Inverted index over the product catalog with BM25 ranking, prefix matching and typo tolerance
+"""
+
+import bisect
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# How much a hit in each field counts towards a term's frequency
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "brand": 2.0,
+    "category": 1.5,
+    "description": 1.0,
+}
+
+# Relative weight of inexact matches versus an exact term match
+PREFIX_MATCH_WEIGHT = 0.7
+FUZZY_MATCH_WEIGHT = 0.5
+
+# Only terms at least this long get typo-tolerant (edit distance 1) matching
+MIN_FUZZY_TERM_LENGTH = 4
+
+# Cap on vocabulary terms a single prefix can expand to
+MAX_PREFIX_EXPANSIONS = 50
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into alphanumeric tokens"""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def _deletions(term: str) -> Set[str]:
+    """All strings obtained by deleting one character from term"""
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True if a and b differ by at most one insertion, deletion, substitution or adjacent swap"""
+    if a == b:
+        return True
+    len_a, len_b = len(a), len(b)
+    if abs(len_a - len_b) > 1:
+        return False
+    if len_a == len_b:
+        diffs = [i for i in range(len_a) if a[i] != b[i]]
+        if len(diffs) == 1:
+            return True
+        return (len(diffs) == 2 and diffs[1] == diffs[0] + 1
+                and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]])
+    if len_a > len_b:
+        a, b = b, a
+    # b is one character longer than a
+    for i in range(len(a)):
+        if a[i] != b[i]:
+            return a[i:] == b[i + 1:]
+    return True
+
+
+class ProductSearchIndex:
+    """
+    BM25 inverted index over product name, brand, category and description
+
+    Query terms match vocabulary terms exactly, by prefix ("mac" -> "macbook")
+    or within one edit ("laptpo" -> "laptop"), with inexact matches weighted
+    down. Typo candidates come from a deletion neighbourhood index (each term is
+    stored under all its one-character deletions), so lookups cost a few dict
+    probes regardless of catalog size. Products are added, updated and removed
+    individually, which lets the index follow catalog changes without a rebuild.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.doc_terms: Dict[str, Dict[str, float]] = {}
+        self.doc_lengths: Dict[str, float] = {}
+        self.total_length = 0.0
+        self.deletion_index: Dict[str, Set[str]] = defaultdict(set)
+        self._sorted_vocabulary: Optional[List[str]] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.doc_terms)
+
+    # =============== INDEXING ===============
+
+    def build(self, products: Iterable[Dict]):
+        """Replace the index contents with the given product documents"""
+        with self._lock:
+            self.postings = defaultdict(dict)
+            self.doc_terms = {}
+            self.doc_lengths = {}
+            self.total_length = 0.0
+            self.deletion_index = defaultdict(set)
+            self._sorted_vocabulary = None
+            for product in products:
+                self._add(product)
+
+    def upsert(self, product: Dict):
+        """Add a product, or re-index it if it is already present"""
+        with self._lock:
+            self._remove(str(product.get("_id")))
+            self._add(product)
+
+    def remove(self, product_id: str):
+        """Drop a product from the index"""
+        with self._lock:
+            self._remove(str(product_id))
+
+    def _add(self, product: Dict):
+        product_id = str(product.get("_id"))
+        term_weights: Dict[str, float] = defaultdict(float)
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(product.get(field)):
+                term_weights[token] += weight
+        if not term_weights:
+            return
+
+        length = sum(term_weights.values())
+        self.doc_terms[product_id] = dict(term_weights)
+        self.doc_lengths[product_id] = length
+        self.total_length += length
+        for term, weight in term_weights.items():
+            if term not in self.postings:
+                self._add_term(term)
+            self.postings[term][product_id] = weight
+
+    def _remove(self, product_id: str):
+        term_weights = self.doc_terms.pop(product_id, None)
+        if term_weights is None:
+            return
+        self.total_length -= self.doc_lengths.pop(product_id, 0.0)
+        for term in term_weights:
+            docs = self.postings.get(term)
+            if docs is None:
+                continue
+            docs.pop(product_id, None)
+            if not docs:
+                del self.postings[term]
+                self._remove_term(term)
+
+    def _add_term(self, term: str):
+        self._sorted_vocabulary = None
+        if len(term) >= MIN_FUZZY_TERM_LENGTH:
+            for variant in _deletions(term):
+                self.deletion_index[variant].add(term)
+
+    def _remove_term(self, term: str):
+        self._sorted_vocabulary = None
+        if len(term) >= MIN_FUZZY_TERM_LENGTH:
+            for variant in _deletions(term):
+                terms = self.deletion_index.get(variant)
+                if terms is not None:
+                    terms.discard(term)
+                    if not terms:
+                        del self.deletion_index[variant]
+
+    # =============== QUERYING ===============
+
+    def _vocabulary(self) -> List[str]:
+        if self._sorted_vocabulary is None:
+            self._sorted_vocabulary = sorted(self.postings)
+        return self._sorted_vocabulary
+
+    def _expand(self, token: str) -> Dict[str, float]:
+        """Map a query token to matching vocabulary terms and their match weights"""
+        matches: Dict[str, float] = {}
+        if token in self.postings:
+            matches[token] = 1.0
+
+        # Prefix matches via binary search over the sorted vocabulary
+        vocabulary = self._vocabulary()
+        start = bisect.bisect_left(vocabulary, token)
+        for term in vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(token):
+                break
+            matches.setdefault(term, PREFIX_MATCH_WEIGHT)
+
+        # Typo tolerance: candidates share a one-deletion variant with the token
+        if len(token) >= MIN_FUZZY_TERM_LENGTH and token not in self.postings:
+            candidates = set(self.deletion_index.get(token, ()))
+            for variant in _deletions(token):
+                if variant in self.postings:
+                    candidates.add(variant)
+                candidates.update(self.deletion_index.get(variant, ()))
+            for term in candidates:
+                if _within_one_edit(token, term):
+                    matches.setdefault(term, FUZZY_MATCH_WEIGHT)
+
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Rank products for a free-text query
+
+        Args:
+            query: Search text
+            limit: Maximum number of results
+
+        Returns:
+            List of (product_id, score) tuples, best match first
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        with self._lock:
+            doc_count = len(self.doc_terms)
+            if doc_count == 0:
+                return []
+            average_length = self.total_length / doc_count
+
+            scores: Dict[str, float] = defaultdict(float)
+            matched_tokens: Dict[str, int] = defaultdict(int)
+            for token in tokens:
+                # Best-matching expansion per product, so "mac" doesn't score
+                # a product once for every term it prefixes
+                token_scores: Dict[str, float] = {}
+                for term, match_weight in self._expand(token).items():
+                    docs = self.postings[term]
+                    idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                    for product_id, tf in docs.items():
+                        norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[product_id] / average_length)
+                        score = match_weight * idf * tf * (self.k1 + 1) / (tf + norm)
+                        if score > token_scores.get(product_id, 0.0):
+                            token_scores[product_id] = score
+                for product_id, score in token_scores.items():
+                    scores[product_id] += score
+                    matched_tokens[product_id] += 1
+
+        # Favour products that match every query word
+        ranked = [
+            (product_id, score * matched_tokens[product_id] / len(tokens))
+            for product_id, score in scores.items()
+        ]
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
@@ -0,0 +1,255 @@
+"""
+Product Q&A Lookup Index
+Precomputed product-name and category indexes behind ProductQnARAG.get_questions_for_product
+
+The index holds positions only; question and answer text is read back from
+the Q&A store for the positions a lookup selects.
+"""
+
+import heapq
+import os
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Set
+
+# Words ignored when comparing product names
+NAME_STOPWORDS = {'the', 'for', 'and', 'with'}
+
+# Keywords shorter than this are ignored, so shorter name fragments are never looked up
+MIN_KEYWORD_LENGTH = 3
+
+# Minimum Q&A matches for a product before falling back to category questions
+MIN_PRODUCT_MATCHES = 3
+
+# Cached (product name, category, limit) lookups
+LOOKUP_CACHE_SIZE = int(os.getenv("QNA_LOOKUP_CACHE_SIZE", "1024"))
+
+
+def name_keywords(name: str) -> List[str]:
+    """Meaningful words of a lowercased product name"""
+    return [w for w in name.split() if len(w) >= MIN_KEYWORD_LENGTH and w not in NAME_STOPWORDS]
+
+
+def _fragments(token: str) -> Set[str]:
+    """All substrings of token at least MIN_KEYWORD_LENGTH long"""
+    return {
+        token[start:end]
+        for start in range(len(token))
+        for end in range(start + MIN_KEYWORD_LENGTH, len(token) + 1)
+    }
+
+
+class QnALookupIndex:
+    """
+    Product-name and category indexes over the Q&A pairs
+
+    Matching follows the original linear scan exactly, but over the distinct
+    product names instead of every pair:
+
+    - a product keyword "appears in" a Q&A product name when it is a substring
+      of it; since keywords contain no whitespace that means a substring of one
+      of the name's words, so every such substring is indexed up front
+      (fragment -> names) and keyword matches become dict lookups
+    - "product name contains Q&A name" candidates come from the names' first
+      three characters, probed at each offset of the product name
+
+    The pairs of each matched name are merged back into corpus order, so the
+    results are identical to the scan. Whole results are kept in an LRU keyed
+    by (product name, category, limit), cleared whenever pairs are added.
+    """
+
+    def __init__(self, fetch: Callable[[List[int]], Dict[int, Dict]], cache_size: int = LOOKUP_CACHE_SIZE):
+        """
+        Args:
+            fetch: Reads the pairs at the given positions, keyed by position
+            cache_size: Lookups kept in the LRU
+        """
+        self.fetch = fetch
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self.count = 0  # Pairs indexed
+        self.names: List[str] = []  # Distinct lowercased product names
+        self.name_ids: Dict[str, int] = {}
+        self.name_positions: List[List[int]] = []  # Non-generic pair positions per name
+        self.fragments: Dict[str, Set[int]] = defaultdict(set)
+        self.leading: Dict[str, Set[int]] = defaultdict(set)  # First three characters -> names
+        self.short_names: Set[int] = set()  # Names too short for the leading index
+        self.category_positions: Dict[str, List[int]] = defaultdict(list)
+        self.category_generic_positions: Dict[str, List[int]] = defaultdict(list)
+        self.generic_positions: List[int] = []  # product_id starts with "generic"
+
+    # =============== INDEXING ===============
+
+    def build(self, pairs: Iterable[Dict]):
+        """Replace the index contents with the given Q&A pairs"""
+        with self._lock:
+            self._reset()
+            for qna in pairs:
+                self._add(qna)
+            self._cache.clear()
+
+    def extend(self, pairs: Iterable[Dict]):
+        """Index Q&A pairs appended to the corpus"""
+        with self._lock:
+            for qna in pairs:
+                self._add(qna)
+            self._cache.clear()
+
+    def _add(self, qna: Dict):
+        position = self.count
+        self.count += 1
+        product_id = str(qna.get('product_id', ''))
+        is_generic = 'generic' in product_id.lower()
+        if product_id.startswith('generic'):
+            self.generic_positions.append(position)
+
+        category = str(qna.get('category', '')).lower()
+        self.category_positions[category].append(position)
+        if is_generic:
+            self.category_generic_positions[category].append(position)
+            return
+
+        name = str(qna.get('product_name', '')).lower()
+        name_id = self.name_ids.get(name)
+        if name_id is None:
+            name_id = self._add_name(name)
+        self.name_positions[name_id].append(position)
+
+    def _add_name(self, name: str) -> int:
+        name_id = len(self.names)
+        self.names.append(name)
+        self.name_ids[name] = name_id
+        self.name_positions.append([])
+        for token in name.split():
+            for fragment in _fragments(token):
+                self.fragments[fragment].add(name_id)
+        if len(name) >= MIN_KEYWORD_LENGTH:
+            self.leading[name[:MIN_KEYWORD_LENGTH]].add(name_id)
+        else:
+            self.short_names.add(name_id)
+        return name_id
+
+    # =============== LOOKUPS ===============
+
+    def questions_for_product(self, product_name: str, category: str, limit: int) -> List[Dict]:
+        """
+        Questions for a product, falling back to generic questions for its category
+
+        Returns:
+            List of {id, question, answer} dictionaries
+        """
+        key = (product_name.lower(), category.lower(), limit)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return [dict(question) for question in cached]
+
+            questions = self._lookup(*key)
+            self._cache[key] = questions
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return [dict(question) for question in questions]
+
+    def _lookup(self, product_name: str, category: str, limit: int) -> List[Dict]:
+        # Specific product matches first
+        name_ids = self._matching_names(product_name)
+        questions = self._collect(heapq.merge(*(self.name_positions[i] for i in sorted(name_ids))), limit)
+        if len(questions) >= limit or len(questions) >= MIN_PRODUCT_MATCHES:
+            return questions[:limit]
+
+        # Otherwise generic questions for the category
+        categories = self._matching_categories(category)
+        questions = self._collect(heapq.merge(*(self.category_generic_positions[c] for c in categories)), limit)
+        if questions:
+            return questions
+        return self.fallback_questions(category, limit, categories)
+
+    def fallback_questions(self, category: str, limit: int, categories: List[str] = None) -> List[Dict]:
+        """Any questions for the category, or generic ones when the category has none"""
+        with self._lock:
+            if categories is None:
+                categories = self._matching_categories(category.lower())
+            positions = list(heapq.merge(*(self.category_positions[c] for c in categories)))
+            if not positions:
+                positions = self.generic_positions
+            pairs = self.fetch(positions[:limit])
+            return [
+                {'id': index + 1, 'question': pairs[position]['question'], 'answer': pairs[position]['answer']}
+                for index, position in enumerate(p for p in positions[:limit] if p in pairs)
+            ]
+
+    def _collect(self, positions: Iterable[int], limit: int) -> List[Dict]:
+        """First `limit` distinct questions at the given positions"""
+        questions = []
+        seen_questions = set()
+        positions = iter(positions)
+        while len(questions) < limit:
+            # Read a few more pairs than still needed, since repeated questions are skipped
+            batch = list(islice(positions, 2 * (limit - len(questions))))
+            if not batch:
+                break
+            pairs = self.fetch(batch)
+            for position in batch:
+                qna = pairs.get(position)
+                if qna is None or qna['question'] in seen_questions:
+                    continue
+                questions.append({'id': len(questions) + 1, 'question': qna['question'], 'answer': qna['answer']})
+                seen_questions.add(qna['question'])
+                if len(questions) >= limit:
+                    break
+        return questions
+
+    def _matching_names(self, product_name: str) -> Set[int]:
+        """Names that strongly match: two keywords, one distinctive keyword, or containment either way"""
+        keywords = name_keywords(product_name)
+        keyword_hits = Counter()
+        for keyword in keywords:
+            keyword_hits.update(self.fragments.get(keyword, ()))
+        matches = {name_id for name_id, hits in keyword_hits.items() if hits >= 2}
+
+        if len(keywords) == 1 and len(keywords[0]) > 4:
+            matches |= self.fragments.get(keywords[0], set())
+
+        matches |= self._names_containing(product_name)
+        matches |= self._names_within(product_name)
+        return matches
+
+    def _names_containing(self, product_name: str) -> Set[int]:
+        """Names that have product_name as a substring"""
+        # Each word of product_name lies inside one word of a containing name
+        candidates = None
+        for token in product_name.split():
+            if len(token) >= MIN_KEYWORD_LENGTH:
+                ids = self.fragments.get(token, set())
+                candidates = set(ids) if candidates is None else candidates & ids
+                if not candidates:
+                    return set()
+        if candidates is None:
+            candidates = range(len(self.names))
+        return {name_id for name_id in candidates if product_name in self.names[name_id]}
+
+    def _names_within(self, product_name: str) -> Set[int]:
+        """Names that are substrings of product_name"""
+        candidates = set(self.short_names)
+        for start in range(len(product_name) - MIN_KEYWORD_LENGTH + 1):
+            candidates.update(self.leading.get(product_name[start:start + MIN_KEYWORD_LENGTH], ()))
+        return {name_id for name_id in candidates if self.names[name_id] in product_name}
+
+    def _matching_categories(self, category: str) -> List[str]:
+        """Indexed categories containing, or contained in, the given one"""
+        return [c for c in self.category_positions if category in c or c in category]
+
+    def stats(self) -> Dict:
+        return {
+            "pairs": self.count,
+            "product_names": len(self.names),
+            "categories": len(self.category_positions),
+            "fragments": len(self.fragments),
+            "cached_lookups": len(self._cache),
+        }
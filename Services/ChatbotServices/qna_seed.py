@@ -0,0 +1,71 @@
+"""
+Product Q&A Seed Data
+The default Q&A pairs, stored as a SQLite file instead of a Python literal
+
+On first start the seed file is copied as-is into the runtime Q&A store
+(qna_store.py); it is never expanded into JSON. Rebuild it from a JSON
+export with:
+
+    python qna_seed.py export.json [product_qna_seed.sqlite]
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import sys
+from typing import Dict, List
+
+SEED_FILE = "product_qna_seed.sqlite"
+
+SEED_COLUMNS = ("product_id", "product_name", "category", "question", "answer")
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    # Read-only URI so a missing seed is an error rather than a new empty database
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def write_seed(pairs: List[Dict], path: str):
+    """Write Q&A pairs to a fresh seed file, preserving their order"""
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.execute(
+            "CREATE TABLE qna (position INTEGER PRIMARY KEY, product_id TEXT NOT NULL, "
+            "product_name TEXT NOT NULL, category TEXT NOT NULL, question TEXT NOT NULL, answer TEXT NOT NULL)"
+        )
+        connection.executemany(
+            "INSERT INTO qna VALUES (?, ?, ?, ?, ?, ?)",
+            ((position, *(pair[column] for column in SEED_COLUMNS)) for position, pair in enumerate(pairs))
+        )
+        connection.commit()
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+
+
+def load_seed(path: str) -> List[Dict]:
+    """All seed Q&A pairs in their original order"""
+    connection = _connect(path)
+    try:
+        rows = connection.execute(f"SELECT {', '.join(SEED_COLUMNS)} FROM qna ORDER BY position").fetchall()
+    finally:
+        connection.close()
+    return [dict(zip(SEED_COLUMNS, row)) for row in rows]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    logging.basicConfig(level=logging.INFO)
+    source = sys.argv[1]
+    target = sys.argv[2] if len(sys.argv) > 2 else os.path.join(os.path.dirname(os.path.abspath(__file__)), SEED_FILE)
+    with open(source, 'r', encoding='utf-8') as f:
+        seed_pairs = json.load(f)
+    write_seed(seed_pairs, target)
+    logging.info(f"Wrote {len(seed_pairs)} Q&A pairs to {target}")
@@ -0,0 +1,218 @@
+"""
+Product Q&A Store
+The runtime product Q&A pairs in SQLite, so the corpus stays on disk instead of in the process
+
+On first start the store is a copy of the bundled seed (product_qna_seed.sqlite),
+or an import of a product_qna_knowledge.json and journal left by older
+versions. Pairs are keyed by their position in the corpus, which is also
+their row in the search index. Pages, search hits and lookup results are
+read back by position; only the indexes over the pairs live in memory.
+
+indexed_count records how many leading pairs the saved index bundle covers,
+so pairs added after the last compaction are re-indexed into the delta
+segment on start.
+
+Every gunicorn worker writes to the same database, so append() picks the
+next position inside its write transaction rather than trusting the
+caller's count.
+"""
+
+import json
+import logging
+import os
+import shutil
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .qna_seed import SEED_COLUMNS
+from .retrieval_engine import DocumentJournal
+
+STORE_FILE = "product_qna.sqlite"
+
+STORE_COLUMNS = SEED_COLUMNS + ("created_at",)
+
+# Positions per "IN (...)" query, below SQLite's bound-parameter limit
+FETCH_CHUNK = 500
+
+
+def _pair(row: Tuple) -> Dict:
+    """Q&A dictionary for a row of STORE_COLUMNS (created_at only when set)"""
+    qna = dict(zip(STORE_COLUMNS, row))
+    if qna["created_at"] is None:
+        del qna["created_at"]
+    return qna
+
+
+class QnAStore:
+    """Position-keyed Q&A pairs in a SQLite file; each call uses its own short-lived connection"""
+
+    def __init__(self, path: str, seed_file: str, legacy_json: Optional[str] = None,
+                 legacy_journal: Optional[str] = None):
+        """
+        Args:
+            path: Runtime database, created on first open
+            seed_file: Bundled seed copied into a new database
+            legacy_json: product_qna_knowledge.json of older versions, imported instead of the seed
+            legacy_journal: Journal of pairs added after legacy_json was last compacted
+        """
+        self.path = path
+        self.seed_file = seed_file
+        self.legacy_json = legacy_json
+        self.legacy_journal = legacy_journal
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Connection that commits on success and is always closed"""
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # =============== SETUP ===============
+
+    def open(self):
+        """Create the database from the legacy JSON or the seed if it doesn't exist yet"""
+        if not os.path.exists(self.path):
+            tmp_path = f"{self.path}.tmp"
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if self.legacy_json and os.path.exists(self.legacy_json):
+                self._import_legacy(tmp_path)
+            elif os.path.exists(self.seed_file):
+                shutil.copyfile(self.seed_file, tmp_path)
+                logging.info(f"Created product Q&A store from seed {self.seed_file}")
+            else:
+                logging.error(f"Product Q&A seed {self.seed_file} not found, starting with an empty store")
+            self._ensure_schema(tmp_path)
+            os.replace(tmp_path, self.path)
+        else:
+            self._ensure_schema(self.path)
+
+    def _import_legacy(self, path: str):
+        with open(self.legacy_json, 'r', encoding='utf-8') as f:
+            pairs = json.load(f)
+        if self.legacy_journal:
+            pairs.extend(DocumentJournal(self.legacy_journal).read(len(pairs)))
+        self._ensure_schema(path)
+        self._insert(path, pairs, 0)
+        logging.info(f"Imported {len(pairs)} Q&A pairs from {self.legacy_json}")
+
+    @staticmethod
+    def _ensure_schema(path: str):
+        connection = sqlite3.connect(path)
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS qna (position INTEGER PRIMARY KEY, product_id TEXT NOT NULL, "
+                "product_name TEXT NOT NULL, category TEXT NOT NULL, question TEXT NOT NULL, answer TEXT NOT NULL)"
+            )
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(qna)")}
+            if "created_at" not in columns:
+                # The seed has no created_at; only pairs added at runtime carry one
+                connection.execute("ALTER TABLE qna ADD COLUMN created_at TEXT")
+            connection.execute("CREATE INDEX IF NOT EXISTS qna_product ON qna (product_id, position)")
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            connection.commit()
+        finally:
+            connection.close()
+
+    # =============== READS ===============
+
+    def count(self) -> int:
+        with self._connection() as connection:
+            return connection.execute("SELECT COUNT(*) FROM qna").fetchone()[0]
+
+    def next_position(self) -> int:
+        """Position the next appended pair gets (a primary-key lookup, cheap enough to poll)"""
+        with self._connection() as connection:
+            return connection.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM qna").fetchone()[0]
+
+    def iter_pairs(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict]:
+        """Pairs at positions [start, stop) in position order"""
+        with self._connection() as connection:
+            cursor = connection.execute(
+                f"SELECT {', '.join(STORE_COLUMNS)} FROM qna WHERE position >= ? AND position < ? ORDER BY position",
+                (start, stop if stop is not None else 2 ** 62)
+            )
+            for row in cursor:
+                yield _pair(row)
+
+    def get_many(self, positions: Iterable[int]) -> Dict[int, Dict]:
+        """Pairs keyed by position (missing positions are left out)"""
+        positions = list(positions)
+        pairs = {}
+        with self._connection() as connection:
+            for start in range(0, len(positions), FETCH_CHUNK):
+                chunk = positions[start:start + FETCH_CHUNK]
+                rows = connection.execute(
+                    f"SELECT position, {', '.join(STORE_COLUMNS)} FROM qna "
+                    f"WHERE position IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                )
+                for position, *row in rows:
+                    pairs[position] = _pair(row)
+        return pairs
+
+    def product_page(self, product_id: str, offset: int, limit: int) -> Tuple[List[Dict], int]:
+        """A page of one product's Q&A pairs in corpus order, and the product's total"""
+        with self._connection() as connection:
+            total = connection.execute("SELECT COUNT(*) FROM qna WHERE product_id = ?", (product_id,)).fetchone()[0]
+            rows = connection.execute(
+                f"SELECT {', '.join(STORE_COLUMNS)} FROM qna WHERE product_id = ? ORDER BY position LIMIT ? OFFSET ?",
+                (product_id, limit, offset)
+            ).fetchall()
+        return [_pair(row) for row in rows], total
+
+    @property
+    def indexed_count(self) -> Optional[int]:
+        """Pairs covered by the saved index bundle, None before the first build"""
+        with self._connection() as connection:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'indexed_count'").fetchone()
+        return int(row[0]) if row else None
+
+    # =============== WRITES ===============
+
+    def append(self, pairs: List[Dict]) -> int:
+        """
+        Insert pairs at the end of the corpus in one transaction
+
+        Returns:
+            Position of the first inserted pair
+        """
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            # IMMEDIATE takes the write lock up front, so no other worker can claim the same positions
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                first_position = connection.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM qna").fetchone()[0]
+                self._insert_rows(connection, pairs, first_position)
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        finally:
+            connection.close()
+        return first_position
+
+    @classmethod
+    def _insert(cls, path: str, pairs: List[Dict], first_position: int):
+        connection = sqlite3.connect(path, timeout=30)
+        try:
+            with connection:
+                cls._insert_rows(connection, pairs, first_position)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _insert_rows(connection: sqlite3.Connection, pairs: List[Dict], first_position: int):
+        connection.executemany(
+            f"INSERT INTO qna (position, {', '.join(STORE_COLUMNS)}) VALUES ({', '.join('?' * (len(STORE_COLUMNS) + 1))})",
+            ((first_position + offset, *(pair.get(column) for column in STORE_COLUMNS))
+             for offset, pair in enumerate(pairs))
+        )
+
+    def set_indexed_count(self, count: int):
+        with self._connection() as connection:
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('indexed_count', ?)", (str(count),))
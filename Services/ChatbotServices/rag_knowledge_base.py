@@ -1,72 +1,94 @@
 
 """
 RAG Knowledge Base for E-commerce AI Assistant
-Uses FAISS for vector similarity search with sklearn fallback and scikit-learn for TF-IDF embeddings
+Uses hybrid TF-IDF / BM25 / embedding retrieval (see hybrid_retrieval.py) for document similarity search
+
+The JSON file, journal and index bundles are shared by every gunicorn worker.
+Appends and compactions hold a file lock on knowledge_base.json.lock and first
+catch up with what other workers wrote, so journal positions never collide
+and a compaction folds in everyone's documents; searches pick up other
+workers' documents as soon as the files change.
 """
 
 import json
-import numpy as np
-try:
-    import faiss
-    FAISS_AVAILABLE = True
-except ImportError:
-    FAISS_AVAILABLE = False
-    faiss = None
-
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import pickle
 import os
+import threading
 from typing import List, Dict, Optional, Tuple
 import logging
+from .retrieval_engine import (
+    COMPACTION_THRESHOLD,
+    DocumentJournal,
+    content_hash,
+    file_lock,
+    file_signature,
+    write_json_atomic
+)
+from .hybrid_retrieval import HybridRetriever
 
 class RAGKnowledgeBase:
-    def __init__(self, knowledge_file: str = "knowledge_base.json", index_file: str = "faiss_index.bin", vectorizer_file: str = "vectorizer.pkl"):
+    def __init__(self, knowledge_file: str = "knowledge_base.json", index_dir: str = "rag_index/knowledge_base",
+                 journal_file: str = "knowledge_base.journal.jsonl"):
         """
-        Initialize RAG Knowledge Base with FAISS vector search and sklearn fallback
+        Initialize RAG Knowledge Base with hybrid sparse / dense search
         
         Args:
             knowledge_file: JSON file containing knowledge base documents
-            index_file: FAISS index file for vector search
-            vectorizer_file: Pickled TF-IDF vectorizer
+            index_dir: Directory holding the versioned index bundles
+            journal_file: Append-only log of documents added since the last compaction
         """
         # Get the directory where this file is located (ChatbotServices)
         base_dir = os.path.dirname(os.path.abspath(__file__))
         
         # Use absolute paths relative to ChatbotServices directory
         self.knowledge_file = os.path.join(base_dir, knowledge_file)
-        self.index_file = os.path.join(base_dir, index_file)
-        self.vectorizer_file = os.path.join(base_dir, vectorizer_file)
+        self.index_dir = os.path.join(base_dir, index_dir)
+        self.journal = DocumentJournal(os.path.join(base_dir, journal_file))
+        self.lock_file = f"{self.knowledge_file}.lock"
         
         # Initialize components
         self.documents = []
         self.document_metadata = []
-        self.vectorizer = None
-        self.faiss_index = None
-        self.document_vectors = None
-        self.use_faiss = FAISS_AVAILABLE
+        self._lock = threading.Lock()  # Guards the document lists, delta segment and journal together
+        self._compaction_lock = threading.Lock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._pending = 0  # Documents in the journal / delta segment
+        self._json_count = 0  # Documents in the JSON file as last read or written
+        self._signature = None  # file_signature of the JSON and journal as last seen
+        self.retriever = HybridRetriever(
+            max_features=1000,
+            stop_words='english',
+            lowercase=True,
+            ngram_range=(1, 2)  # Include bigrams
+        )
         
         # Load or create knowledge base
         self.load_or_create_knowledge_base()
         
         logging.info(f"RAG Knowledge Base initialized with {len(self.documents)} documents")
-        if not self.use_faiss:
-            logging.warning("Using sklearn fallback for vector search (FAISS not available or failed)")
-        else:
-            logging.info("Using FAISS for optimized vector search")
     
     def load_or_create_knowledge_base(self):
         """Load existing knowledge base or create a new one"""
-        if os.path.exists(self.knowledge_file):
-            self.load_knowledge_base()
-        else:
-            self.create_default_knowledge_base()
-        
-        # Load or create vector index
-        if os.path.exists(self.index_file) and os.path.exists(self.vectorizer_file):
+        with file_lock(self.lock_file):
+            if os.path.exists(self.knowledge_file):
+                self.load_knowledge_base()
+            else:
+                self.create_default_knowledge_base()
+            self._json_count = len(self.document_metadata)
+            
+            # Load the index bundle matching the JSON, rebuilding it if the JSON changed
             self.load_vector_index()
-        else:
-            self.create_vector_index()
+            
+            # Re-apply documents added since the last compaction
+            records = self.journal.read(len(self.document_metadata))
+            self._extend(records)
+            self._signature = self._disk_signature()
+        
+        if records:
+            logging.info(f"Replayed {len(records)} journaled documents")
+            if not self.retriever.is_ready:
+                self.compact()
+            elif self._pending >= COMPACTION_THRESHOLD:
+                self._schedule_compaction()
     
     def create_default_knowledge_base(self):
         """Create default knowledge base with e-commerce information"""
@@ -153,107 +175,42 @@ class RAGKnowledgeBase:
             self.create_default_knowledge_base()
     
     def create_vector_index(self):
-        """Create TF-IDF vectors and FAISS index for similarity search with fallback"""
+        """Fit the TF-IDF and BM25 indexes (and embeddings, when enabled) over the documents"""
         if not self.documents:
             logging.error("No documents to index")
             return
         
         try:
-            # Create TF-IDF vectors
-            self.vectorizer = TfidfVectorizer(
-                max_features=1000,
-                stop_words='english',
-                lowercase=True,
-                ngram_range=(1, 2)  # Include bigrams
-            )
-            
-            self.document_vectors = self.vectorizer.fit_transform(self.documents).toarray()
-            
-            # Try to create FAISS index if available
-            if self.use_faiss and FAISS_AVAILABLE:
-                try:
-                    dimension = self.document_vectors.shape[1]
-                    self.faiss_index = faiss.IndexFlatIP(dimension)  # Inner product for cosine similarity
-                    
-                    # Normalize vectors for cosine similarity
-                    # Convert to float32 and ensure proper array format
-                    vectors_float32 = self.document_vectors.astype(np.float32)
-                    vectors_normalized = vectors_float32.copy()
-                    faiss.normalize_L2(vectors_normalized)
-                    
-                    self.faiss_index.add(vectors_normalized)
-                    
-                    # Save index and vectorizer
-                    faiss.write_index(self.faiss_index, self.index_file)
-                    with open(self.vectorizer_file, 'wb') as f:
-                        pickle.dump(self.vectorizer, f)
-                    
-                    logging.info(f"Created FAISS vector index with {len(self.documents)} documents, dimension: {dimension}")
-                    
-                except Exception as faiss_error:
-                    logging.error(f"FAISS initialization failed: {faiss_error}")
-                    logging.info("Falling back to sklearn-based similarity search")
-                    self.use_faiss = False
-                    self.faiss_index = None
-                    
-                    # Save vectorizer for sklearn fallback
-                    with open(self.vectorizer_file, 'wb') as f:
-                        pickle.dump(self.vectorizer, f)
-            else:
-                # Save vectorizer for sklearn fallback
-                with open(self.vectorizer_file, 'wb') as f:
-                    pickle.dump(self.vectorizer, f)
-                logging.info(f"Created TF-IDF vectors with {len(self.documents)} documents (sklearn fallback)")
-                
+            self.retriever.fit(self.documents)
         except Exception as e:
             logging.error(f"Error creating vector index: {e}")
-            self.vectorizer = None
-            self.document_vectors = None
+            self.retriever.vectorizer = None
+            self.retriever.matrix = None
+            return
+        
+        try:
+            self.retriever.save_bundle(self.index_dir, self._content_hash(), {"source": os.path.basename(self.knowledge_file)})
+            logging.info(f"Created hybrid index with {len(self.documents)} documents")
+        except Exception as e:
+            # The in-memory index still works; it is rebuilt on the next start
+            logging.error(f"Error saving index bundle: {e}")
     
     def load_vector_index(self):
-        """Load existing vector index and vectorizer with fallback handling"""
+        """Load the index bundle for the current JSON without re-vectorizing, or rebuild it"""
         try:
-            # Try to load FAISS index first
-            if self.use_faiss and FAISS_AVAILABLE and os.path.exists(self.index_file):
-                try:
-                    self.faiss_index = faiss.read_index(self.index_file)
-                    with open(self.vectorizer_file, 'rb') as f:
-                        self.vectorizer = pickle.load(f)
-                    
-                    # Recreate document vectors if needed
-                    if self.documents and self.vectorizer:
-                        self.document_vectors = self.vectorizer.transform(self.documents).toarray()
-                    
-                    logging.info("Loaded existing FAISS vector index and vectorizer")
-                    return
-                    
-                except Exception as faiss_error:
-                    logging.error(f"Error loading FAISS index: {faiss_error}")
-                    logging.info("Falling back to sklearn-based search")
-                    self.use_faiss = False
-                    self.faiss_index = None
-            
-            # Load vectorizer for sklearn fallback
-            if os.path.exists(self.vectorizer_file):
-                with open(self.vectorizer_file, 'rb') as f:
-                    self.vectorizer = pickle.load(f)
-                
-                # Recreate document vectors if needed
-                if self.documents and self.vectorizer:
-                    self.document_vectors = self.vectorizer.transform(self.documents).toarray()
-                
-                logging.info("Loaded existing vectorizer for sklearn-based search")
-            else:
-                logging.info("No existing index found, creating new vector index")
-                self.create_vector_index()
-                
+            if self.retriever.load_bundle(self.index_dir, self._content_hash()):
+                return
+            logging.info("No index bundle matches the current documents, rebuilding")
         except Exception as e:
             logging.error(f"Error loading vector index: {e}")
-            self.create_vector_index()
+        self.create_vector_index()
+    
+    def _content_hash(self, retriever=None) -> str:
+        return content_hash(self.knowledge_file, (retriever or self.retriever).fingerprint)
     
     def search(self, query: str, top_k: int = 3, min_score: float = 0.1) -> List[Dict]:
         """
-        Search for relevant documents using vector similarity (FAISS or sklearn fallback)
+        Search for relevant documents using hybrid TF-IDF, BM25 and embedding ranking
         
         Args:
             query: Search query string
@@ -263,51 +220,23 @@ class RAGKnowledgeBase:
         Returns:
             List of relevant documents with metadata and scores
         """
-        if not self.vectorizer:
+        self._refresh()
+        # Appends and compaction replace the retriever instead of changing it,
+        # so this snapshot stays consistent while the search runs off the loop
+        retriever = self.retriever
+        if not retriever.is_ready:
             logging.error("Vector index not initialized")
             return []
 
         try:
-            # Vectorize query
-            query_vector = self.vectorizer.transform([query]).toarray()
-            
-            if self.use_faiss and self.faiss_index is not None:
-                # Use FAISS for search
-                query_normalized = query_vector.astype(np.float32)
-                faiss.normalize_L2(query_normalized)
-                
-                scores, indices = self.faiss_index.search(query_normalized, top_k)
-                
-                results = []
-                for score, idx in zip(scores[0], indices[0]):
-                    if score >= min_score and idx < len(self.document_metadata):
-                        result = self.document_metadata[idx].copy()
-                        result['relevance_score'] = float(score)
-                        results.append(result)
-                        
-                logging.info(f"FAISS search for '{query}' returned {len(results)} results")
-                
-            else:
-                # Use sklearn cosine similarity fallback
-                if self.document_vectors is None:
-                    self.document_vectors = self.vectorizer.transform(self.documents).toarray()
-                
-                # Calculate cosine similarity
-                similarities = cosine_similarity(query_vector, self.document_vectors)[0]
-                
-                # Get top_k indices
-                top_indices = np.argsort(similarities)[::-1][:top_k]
-                
-                results = []
-                for idx in top_indices:
-                    score = similarities[idx]
-                    if score >= min_score and idx < len(self.document_metadata):
-                        result = self.document_metadata[idx].copy()
-                        result['relevance_score'] = float(score)
-                        results.append(result)
-                
-                logging.info(f"Sklearn search for '{query}' returned {len(results)} results")
+            results = []
+            for idx, score in retriever.search(query, top_k, min_score):
+                if idx < len(self.document_metadata):
+                    result = self.document_metadata[idx].copy()
+                    result['relevance_score'] = score
+                    results.append(result)
             
+            logging.info(f"Search for '{query}' returned {len(results)} results")
             return results
             
         except Exception as e:
@@ -342,23 +271,15 @@ class RAGKnowledgeBase:
     def add_document(self, title: str, content: str, category: str, keywords: List[str]) -> bool:
         """Add a new document to the knowledge base"""
         try:
+            # The id is assigned under the store lock, from the document's position
             new_doc = {
-                "id": f"{category}_{len(self.document_metadata)}",
                 "title": title,
                 "content": content,
                 "category": category,
                 "keywords": keywords
             }
             
-            self.document_metadata.append(new_doc)
-            self.documents.append(content)
-            
-            # Save updated knowledge base
-            with open(self.knowledge_file, 'w') as f:
-                json.dump(self.document_metadata, f, indent=2)
-            
-            # Recreate vector index
-            self.create_vector_index()
+            self._add_records([new_doc])
             
             logging.info(f"Added new document: {title}")
             return True
@@ -367,6 +288,140 @@ class RAGKnowledgeBase:
             logging.error(f"Error adding document: {e}")
             return False
     
+    def _add_records(self, records: List[Dict]):
+        """Journal new documents and index them in the delta segment, compacting at the threshold"""
+        with file_lock(self.lock_file):
+            with self._lock:
+                # Other workers may have added documents since this one last looked
+                self._sync()
+                position = len(self.document_metadata)
+                records = [
+                    record if "id" in record else {"id": f"{record['category']}_{position + offset}", **record}
+                    for offset, record in enumerate(records)
+                ]
+                self.journal.append(records, position)
+                self._extend(records)
+                self._signature = self._disk_signature()
+                # Nothing to append to yet: build the index synchronously
+                rebuild = not self.retriever.is_ready
+                needs_compaction = self._pending >= COMPACTION_THRESHOLD
+        
+        if rebuild:
+            self.compact()
+        elif needs_compaction:
+            self._schedule_compaction()
+    
+    def _extend(self, records: List[Dict]):
+        """Add records to the corpus and the delta segment (caller holds _lock or is still loading)"""
+        if not records:
+            return
+        if self.retriever.is_ready:
+            self.retriever = self.retriever.with_documents([doc['content'] for doc in records])
+        self.document_metadata.extend(records)
+        self.documents.extend(doc['content'] for doc in records)
+        self._pending += len(records)
+    
+    def _disk_signature(self) -> Tuple:
+        return file_signature(self.knowledge_file), file_signature(self.journal.path)
+    
+    def _refresh(self):
+        """Pick up documents other workers added or compacted, if the files changed since the last look"""
+        if self._disk_signature() == self._signature:
+            return
+        with file_lock(self.lock_file, shared=True):
+            with self._lock:
+                self._sync()
+    
+    def _sync(self):
+        """
+        Catch up with the JSON and journal as other workers left them (file lock and _lock held)
+        
+        The corpus on disk is the JSON followed by the journal entries past it,
+        and this worker's documents are always a prefix of it. After another
+        worker's compaction the bundle it saved for the new JSON is loaded
+        instead of growing this worker's delta segment.
+        """
+        signature = self._disk_signature()
+        if signature == self._signature:
+            return
+        if self._signature is None or signature[0] != self._signature[0]:
+            with open(self.knowledge_file, 'r') as f:
+                knowledge_data = json.load(f)
+            corpus = knowledge_data + self.journal.read(len(knowledge_data))
+            self._json_count = len(knowledge_data)
+            retriever = self.retriever.spawn()
+            if retriever.load_bundle(self.index_dir, self._content_hash(retriever)):
+                newer = corpus[len(knowledge_data):]
+                self.retriever = retriever.with_documents([doc['content'] for doc in newer]) if newer else retriever
+                self.document_metadata = corpus
+                self.documents = [doc['content'] for doc in corpus]
+                self._pending = len(newer)
+                self._signature = signature
+                logging.info(f"Loaded knowledge base compacted by another worker ({len(corpus)} documents)")
+                return
+            records = corpus[len(self.document_metadata):]
+        else:
+            records = self.journal.read(len(self.document_metadata))
+        self._extend(records)
+        self._signature = signature
+    
+    def _schedule_compaction(self):
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(target=self.compact, name="kb-compaction", daemon=True)
+        self._compaction_thread.start()
+    
+    def wait_for_compaction(self):
+        """Block until a background compaction has finished (the store is about to be forked)"""
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+    
+    def compact(self):
+        """Fold journaled documents into the JSON file and refit the index over the whole corpus"""
+        with self._compaction_lock:
+            with file_lock(self.lock_file):
+                with self._lock:
+                    self._sync()
+                    snapshot = list(self.document_metadata)
+            if self.retriever.is_ready and len(snapshot) <= self._json_count:
+                return
+            
+            # The refit runs without the file lock so other workers can keep appending
+            try:
+                retriever = self.retriever.spawn()
+                retriever.fit([doc['content'] for doc in snapshot])
+            except Exception as e:
+                logging.error(f"Knowledge base compaction failed: {e}")
+                return
+            
+            with file_lock(self.lock_file):
+                with self._lock:
+                    self._sync()
+                    if self._json_count >= len(snapshot):
+                        # Another worker compacted at least this far while the refit ran
+                        return
+                    try:
+                        write_json_atomic(self.knowledge_file, snapshot)
+                    except Exception as e:
+                        logging.error(f"Knowledge base compaction failed: {e}")
+                        return
+                    # Documents added while the refit ran stay in the delta segment
+                    newer = self.document_metadata[len(snapshot):]
+                    self.retriever = retriever.with_documents([doc['content'] for doc in newer]) if newer else retriever
+                    self.journal.rewrite(newer, len(snapshot))
+                    self._pending = len(newer)
+                    self._json_count = len(snapshot)
+                    self._signature = self._disk_signature()
+                
+                # Saved before the file lock is released, so other workers find it when they see the new JSON
+                try:
+                    retriever.save_bundle(self.index_dir, self._content_hash(retriever), {"source": os.path.basename(self.knowledge_file)})
+                except Exception as e:
+                    logging.error(f"Error saving index bundle: {e}")
+            
+            logging.info(f"Compacted knowledge base to {len(snapshot)} documents")
+    
     def get_context_for_query(self, query: str, max_context_length: int = 1000) -> str:
         """Get relevant context for a query, formatted for LLM prompt"""
         results = self.search(query, top_k=3)
@@ -392,14 +447,21 @@ class RAGKnowledgeBase:
         
         return "\n".join(context_parts)
 
-# Global instance
+# Global instance, built by the startup orchestrator on a pool thread while requests may already ask for it
 knowledge_base = None
+_knowledge_base_lock = threading.Lock()
 
 def get_knowledge_base() -> RAGKnowledgeBase:
     """Get or create global knowledge base instance"""
     global knowledge_base
     if knowledge_base is None:
-        knowledge_base = RAGKnowledgeBase()
+        with _knowledge_base_lock:
+            if knowledge_base is None:
+                knowledge_base = RAGKnowledgeBase()
+    return knowledge_base
+
+def peek_knowledge_base() -> Optional[RAGKnowledgeBase]:
+    """Return the knowledge base if it has been created, without creating it"""
     return knowledge_base
 
 def search_knowledge(query: str, top_k: int = 3) -> List[Dict]:
@@ -0,0 +1,295 @@
+"""
+Agent Response Cache
+Exact-match cache for LLM answers: an in-process LRU tier in front of an optional shared backend
+
+Backends (RESPONSE_CACHE_BACKEND):
+    memory  - per-process only (default)
+    sqlite  - a local SQLite file shared by every worker on the host, survives restarts
+    redis   - the Redis instance the Node backend already uses (REDIS_URL), shared across hosts
+
+The in-process tier is an OrderedDict LRU with monotonic expiry times and an
+entry count plus byte budget, so get and set are O(1). Shared backends keep
+wall-clock expiry (monotonic clocks are per process) and their own eviction:
+least recently used rows for SQLite, Redis's maxmemory policy for Redis.
+Hit and miss counters are kept in the shared backend too, so hit rates
+cover every worker and survive restarts.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory").lower()
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(4 * 1024 * 1024)))
+RESPONSE_CACHE_SHARED_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_SHARED_MAX_BYTES", str(64 * 1024 * 1024)))
+RESPONSE_CACHE_SQLITE_PATH = os.getenv(
+    "RESPONSE_CACHE_SQLITE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "response_cache.sqlite")
+)
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+# Redis calls happen on the request path, so give up quickly when it is down
+REDIS_TIMEOUT_SECONDS = 0.25
+REDIS_KEY_PREFIX = "techhive:agent:response:"
+REDIS_COUNTERS_KEY = "techhive:agent:response-counters"
+
+
+class MemoryTier:
+    """LRU of encoded entries bounded by count and total bytes, expiring on a monotonic clock"""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self.entries:
+                self._pop(key)
+            self.entries[key] = (value, time.monotonic() + ttl_seconds)
+            self.bytes += len(value)
+            # The least recently used entries are at the front
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._pop(next(iter(self.entries)))
+
+    def _pop(self, key: str):
+        value, _ = self.entries.pop(key)
+        self.bytes -= len(value)
+
+
+class SqliteBackend:
+    """Cache table in a local SQLite file (WAL mode, so workers read while another writes)"""
+    name = "sqlite"
+
+    def __init__(self, path: str = RESPONSE_CACHE_SQLITE_PATH, max_bytes: int = RESPONSE_CACHE_SHARED_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        connection.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        connection.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=1.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        connection = self._connection()
+        now = time.time()
+        row = connection.execute(
+            "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        if row is None:
+            return None
+        connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        connection.commit()
+        return row[0]
+
+    def set(self, key: str, value: bytes, ttl_seconds: float):
+        connection = self._connection()
+        now = time.time()
+        connection.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+            (key, value, len(value), now + ttl_seconds, now)
+        )
+        connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > self.max_bytes:
+            # Drop least recently used rows until the table fits again
+            stale = []
+            for stale_key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+                if total <= self.max_bytes:
+                    break
+                stale.append((stale_key,))
+                total -= size
+            connection.executemany("DELETE FROM responses WHERE key = ?", stale)
+        connection.commit()
+
+    def incr(self, name: str):
+        connection = self._connection()
+        connection.execute(
+            "INSERT INTO counters VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET value = value + 1", (name,)
+        )
+        connection.commit()
+
+    def counters(self) -> Dict[str, int]:
+        return dict(self._connection().execute("SELECT name, value FROM counters").fetchall())
+
+    def size(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses WHERE expires_at > ?", (time.time(),)).fetchone()[0]
+
+
+class RedisBackend:
+    """Keys with native TTLs on the shared Redis server; eviction follows its maxmemory policy"""
+    name = "redis"
+
+    def __init__(self, url: str = REDIS_URL):
+        self.client = redis.Redis.from_url(
+            url, socket_timeout=REDIS_TIMEOUT_SECONDS, socket_connect_timeout=REDIS_TIMEOUT_SECONDS
+        )
+        self.client.ping()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(REDIS_KEY_PREFIX + key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float):
+        self.client.set(REDIS_KEY_PREFIX + key, value, ex=max(1, int(ttl_seconds)))
+
+    def incr(self, name: str):
+        self.client.hincrby(REDIS_COUNTERS_KEY, name, 1)
+
+    def counters(self) -> Dict[str, int]:
+        return {
+            name.decode(): int(value)
+            for name, value in self.client.hgetall(REDIS_COUNTERS_KEY).items()
+        }
+
+    def size(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=REDIS_KEY_PREFIX + "*", count=1000))
+
+
+def create_backend(name: str = RESPONSE_CACHE_BACKEND):
+    """Shared backend by name, or None for memory-only (also when the backend is unavailable)"""
+    if name == "memory":
+        return None
+    try:
+        if name == "sqlite":
+            return SqliteBackend()
+        if name == "redis":
+            if not REDIS_AVAILABLE:
+                print("[debug] RESPONSE_CACHE_BACKEND=redis but the redis package is not installed, using memory")
+                return None
+            return RedisBackend()
+        print(f"[debug] Unknown response cache backend '{name}', using memory")
+    except Exception as e:
+        print(f"[debug] Response cache backend '{name}' unavailable ({e}), using memory")
+    return None
+
+
+class ResponseCache:
+    """
+    Cache for LLM responses to avoid repeated calls
+
+    Lookups try the in-process tier first, then the shared backend (promoting
+    hits into the local tier). Backend errors are counted and treated as
+    misses, so a Redis outage only costs cache hits.
+    """
+
+    def __init__(self, max_size: int = 100, ttl_minutes: int = 30, max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+                 backend=None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_minutes * 60
+        self.local = MemoryTier(max_size, max_bytes)
+        self.backend = backend
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.backend_errors = 0
+
+    @staticmethod
+    def _generate_key(query: str, context_summary: str = "") -> str:
+        """Generate cache key from query and context"""
+        content = f"{query.lower().strip()}{context_summary}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    async def _call_backend(self, method: str, *args):
+        try:
+            return await asyncio.to_thread(getattr(self.backend, method), *args)
+        except Exception as e:
+            self.backend_errors += 1
+            print(f"[debug] Response cache backend {method} failed: {e}")
+            return None
+
+    async def get(self, query: str, context_summary: str = "") -> Optional[str]:
+        """Get cached response if available and not expired"""
+        key = self._generate_key(query, context_summary)
+
+        value = self.local.get(key)
+        if value is None and self.backend is not None:
+            value = await self._call_backend("get", key)
+            if value is not None:
+                self.shared_hits += 1
+                self.local.set(key, value, self.ttl_seconds)
+
+        if value is None:
+            self.misses += 1
+            if self.backend is not None:
+                await self._call_backend("incr", "misses")
+            return None
+
+        self.hits += 1
+        if self.backend is not None:
+            await self._call_backend("incr", "hits")
+        print(f"[debug] Cache hit for query: {query[:50]}...")
+        return json.loads(value)["response"]
+
+    async def set(self, query: str, response: str, context_summary: str = ""):
+        """Cache response with expiration"""
+        key = self._generate_key(query, context_summary)
+        value = json.dumps({"response": response, "query": query[:100]}).encode("utf-8")
+        self.local.set(key, value, self.ttl_seconds)
+        if self.backend is not None:
+            await self._call_backend("set", key, value, self.ttl_seconds)
+        print(f"[debug] Cached response for query: {query[:50]}...")
+
+    async def stats(self) -> Dict:
+        stats = {
+            "backend": self.backend.name if self.backend is not None else "memory",
+            "entries": len(self.local.entries),
+            "bytes": self.local.bytes,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0,
+        }
+        if self.backend is not None:
+            counters = await self._call_backend("counters") or {}
+            shared_total = counters.get("hits", 0) + counters.get("misses", 0)
+            stats["shared"] = {
+                "entries": await self._call_backend("size"),
+                "hits": counters.get("hits", 0),
+                "misses": counters.get("misses", 0),
+                "hit_rate": counters.get("hits", 0) / shared_total if shared_total else 0.0,
+                "errors": self.backend_errors,
+            }
+        return stats
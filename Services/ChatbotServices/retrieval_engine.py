@@ -0,0 +1,399 @@
+"""
+Sparse Retrieval Engine
+Shared TF-IDF retrieval for the RAG stores, kept in CSR form end to end
+
+Fitted indexes are persisted as versioned bundles:
+
+    <root>/v<FORMAT>-<content hash>/
+        manifest.json   format version, content hash, shape, vectorizer settings
+        vocabulary.json terms in column order
+        idf.npy         inverse document frequencies
+        data.npy, indices.npy, indptr.npy   CSR document matrix
+
+The content hash covers the source JSON and the vectorizer settings, so a
+bundle is only reused for exactly the corpus it was built from. Arrays are
+memory-mapped on load (RAG_MMAP_INDEX, default true).
+
+Documents added at runtime go to a delta segment (vectorized with the main
+segment's vocabulary, in a new retriever that replaces the old one) and an
+append-only journal; the stores fold both back
+into the JSON and refit once the journal reaches RAG_COMPACTION_THRESHOLD.
+
+Under multi-worker gunicorn every worker has its own copy of a store, so
+writers take file_lock() on the store's files and catch up with what other
+workers wrote (file_signature() tells when) before appending or compacting.
+"""
+
+from contextlib import contextmanager
+import copy
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+try:
+    import fcntl
+    FILE_LOCKS_AVAILABLE = True
+except ImportError:
+    # Windows: no advisory locks, only single-process deployments are safe
+    FILE_LOCKS_AVAILABLE = False
+
+# Bump when the bundle layout changes so old bundles are rebuilt
+BUNDLE_FORMAT_VERSION = 1
+
+# Memory-map bundle arrays instead of copying them onto the heap
+MMAP_ENABLED = os.getenv("RAG_MMAP_INDEX", "true").lower() == "true"
+
+MATRIX_ARRAYS = ("data", "indices", "indptr")
+
+# Journal size at which a store compacts (rewrites its JSON and refits)
+COMPACTION_THRESHOLD = int(os.getenv("RAG_COMPACTION_THRESHOLD", "50"))
+
+
+def content_hash(source_file: str, vectorizer_params: Dict) -> str:
+    """sha256 over the source file bytes, the vectorizer settings and the bundle format"""
+    digest = hashlib.sha256()
+    with open(source_file, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return _finish_hash(digest, vectorizer_params)
+
+
+def records_hash(records: Iterable[Dict], vectorizer_params: Dict) -> str:
+    """content_hash for a corpus kept as records (e.g. SQLite rows) rather than a file"""
+    digest = hashlib.sha256()
+    for record in records:
+        digest.update(json.dumps(record, sort_keys=True).encode("utf-8"))
+        digest.update(b"\n")
+    return _finish_hash(digest, vectorizer_params)
+
+
+def _finish_hash(digest, vectorizer_params: Dict) -> str:
+    digest.update(json.dumps(vectorizer_params, sort_keys=True, default=list).encode("utf-8"))
+    digest.update(str(BUNDLE_FORMAT_VERSION).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def bundle_path(root: str, source_hash: str) -> str:
+    return os.path.join(root, f"v{BUNDLE_FORMAT_VERSION}-{source_hash[:16]}")
+
+
+@contextmanager
+def file_lock(path: str, shared: bool = False):
+    """
+    Advisory lock on path (created if missing) held across processes and threads
+
+    Args:
+        path: Lock file
+        shared: Take a shared (reader) lock instead of an exclusive one
+    """
+    if not FILE_LOCKS_AVAILABLE:
+        yield
+        return
+    with open(path, 'a') as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime, size) of a file, None if it doesn't exist; changes on every append or rename"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def write_json_atomic(path: str, data, indent: int = 2):
+    """Write JSON to a temporary file and rename it over the target"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class DocumentJournal:
+    """
+    Append-only JSON-lines log of records added since the last compaction
+
+    Each line stores the record with its absolute position in the corpus. The
+    JSON file is always rewritten as a prefix of the corpus, so on replay any
+    entry whose position is already inside the JSON was folded in by a
+    compaction that crashed before truncating the journal, and is skipped.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def read(self, base_count: int) -> List[Dict]:
+        """Records at positions >= base_count, in position order"""
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-append
+                    logging.warning(f"Skipping unreadable journal line in {self.path}")
+        entries.sort(key=lambda entry: entry["position"])
+        return [entry["record"] for entry in entries if entry["position"] >= base_count]
+
+    def append(self, records: List[Dict], first_position: int):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            if f.tell() > 0 and not self._ends_with_newline():
+                # Terminate a torn line so it doesn't swallow the next record
+                f.write("\n")
+            for offset, record in enumerate(records):
+                f.write(json.dumps({"position": first_position + offset, "record": record}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def rewrite(self, records: List[Dict], first_position: int):
+        """Replace the journal with the given records (or remove it when empty)"""
+        if not records:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for offset, record in enumerate(records):
+                f.write(json.dumps({"position": first_position + offset, "record": record}) + "\n")
+        os.replace(tmp_path, self.path)
+
+
+class SparseRetriever:
+    """
+    Cosine-similarity retrieval over a sparse TF-IDF document matrix
+
+    TfidfVectorizer L2-normalizes its rows, so the cosine similarity between a
+    query and every document is one sparse matrix-vector product. Only the
+    score vector (one float per document) is ever dense; top-k selection uses
+    argpartition instead of a full sort.
+    """
+
+    def __init__(self, **vectorizer_params):
+        """
+        Args:
+            **vectorizer_params: TfidfVectorizer settings used when fitting
+        """
+        self.vectorizer_params = vectorizer_params
+        self.vectorizer: Optional[TfidfVectorizer] = None
+        self.matrix: Optional[sparse.csr_matrix] = None
+        self.delta: Optional[sparse.csr_matrix] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.vectorizer is not None and self.matrix is not None
+
+    @property
+    def fingerprint(self) -> Dict:
+        """Settings that go into the content hash; bundles built with other settings are rebuilt"""
+        return self.vectorizer_params
+
+    def spawn(self) -> "SparseRetriever":
+        """Unfitted retriever with the same settings (compaction fits it off to the side)"""
+        return type(self)(**self.vectorizer_params)
+
+    def _save_extra(self, staging: str) -> Dict:
+        """Hook for subclasses to write extra bundle files; returns extra manifest fields"""
+        return {}
+
+    def _load_extra(self, path: str, manifest: Dict) -> bool:
+        """Hook for subclasses to load extra bundle files; False forces a rebuild"""
+        return True
+
+    def fit(self, documents: Sequence[str]):
+        """Fit a new vectorizer on the documents and index them"""
+        self.vectorizer = TfidfVectorizer(dtype=np.float32, **self.vectorizer_params)
+        self.matrix = sparse.csr_matrix(self.vectorizer.fit_transform(documents), dtype=np.float32)
+        self.delta = None
+        logging.info(f"Indexed {self.matrix.shape[0]} documents ({self.matrix.nnz} non-zeros, "
+                     f"{self.matrix.shape[1]} terms)")
+
+    def save_bundle(self, root: str, source_hash: str, metadata: Optional[Dict] = None) -> str:
+        """
+        Persist the fitted index as a versioned bundle and prune older versions
+
+        The bundle is written to a temporary directory and renamed into place,
+        so concurrent readers never see a partial bundle.
+
+        Returns:
+            Path of the bundle directory
+        """
+        os.makedirs(root, exist_ok=True)
+        target = bundle_path(root, source_hash)
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=root)
+        try:
+            vocabulary = [None] * len(self.vectorizer.vocabulary_)
+            for term, column in self.vectorizer.vocabulary_.items():
+                vocabulary[column] = term
+            with open(os.path.join(staging, "vocabulary.json"), 'w', encoding='utf-8') as f:
+                json.dump(vocabulary, f)
+            np.save(os.path.join(staging, "idf.npy"), np.asarray(self.vectorizer.idf_, dtype=np.float64))
+            for name in MATRIX_ARRAYS:
+                np.save(os.path.join(staging, f"{name}.npy"), getattr(self.matrix, name))
+
+            manifest = {
+                "format_version": BUNDLE_FORMAT_VERSION,
+                "content_hash": source_hash,
+                "created_at": datetime.now().isoformat(),
+                "shape": list(self.matrix.shape),
+                "vectorizer_params": self.vectorizer_params,
+                "metadata": metadata or {},
+                **self._save_extra(staging),
+            }
+            with open(os.path.join(staging, "manifest.json"), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, default=list)
+
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+            os.rename(staging, target)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        for entry in os.listdir(root):
+            path = os.path.join(root, entry)
+            if path != target and os.path.isdir(path) and entry.startswith("v"):
+                shutil.rmtree(path, ignore_errors=True)
+
+        logging.info(f"Saved index bundle {target}")
+        return target
+
+    def load_bundle(self, root: str, source_hash: str) -> bool:
+        """
+        Load the bundle built from source_hash, without re-vectorizing the corpus
+
+        Returns:
+            True if a matching bundle was loaded, False if it must be rebuilt
+        """
+        path = bundle_path(root, source_hash)
+        manifest_file = os.path.join(path, "manifest.json")
+        if not os.path.exists(manifest_file):
+            return False
+
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if (manifest.get("format_version") != BUNDLE_FORMAT_VERSION
+                    or manifest.get("content_hash") != source_hash):
+                return False
+
+            with open(os.path.join(path, "vocabulary.json"), 'r', encoding='utf-8') as f:
+                vocabulary = json.load(f)
+
+            # Rebuild the fitted vectorizer from its vocabulary and idf weights
+            vectorizer = TfidfVectorizer(
+                dtype=np.float32,
+                **{**self.vectorizer_params, "vocabulary": {term: column for column, term in enumerate(vocabulary)}}
+            )
+            vectorizer.idf_ = np.load(os.path.join(path, "idf.npy"))
+
+            mmap_mode = 'r' if MMAP_ENABLED else None
+            data, indices, indptr = (
+                np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in MATRIX_ARRAYS
+            )
+            if not self._load_extra(path, manifest):
+                return False
+            self.vectorizer = vectorizer
+            self.matrix = sparse.csr_matrix((data, indices, indptr), shape=tuple(manifest["shape"]), copy=False)
+            self.delta = None
+            logging.info(f"Loaded index bundle {path} ({self.matrix.shape[0]} documents)")
+            return True
+        except Exception as e:
+            logging.error(f"Error loading index bundle {path}: {e}")
+            return False
+
+    def with_documents(self, documents: Sequence[str]) -> "SparseRetriever":
+        """
+        Copy of this retriever with documents added to the delta segment, without refitting
+
+        Delta rows use the main segment's vocabulary and idf, so terms unseen
+        at fit time don't contribute until the next compaction refits. The
+        copy shares the main segment and this retriever is left untouched, so
+        searches already running on other threads keep a consistent view; the
+        stores swap the copy in under their lock, as compaction does.
+        """
+        extended = copy.copy(self)
+        extended._append(documents)
+        return extended
+
+    def _append(self, documents: Sequence[str]):
+        rows = sparse.csr_matrix(self.vectorizer.transform(documents), dtype=np.float32)
+        self.delta = rows if self.delta is None else sparse.vstack([self.delta, rows], format="csr")
+
+    def search(self, query: str, top_k: int, min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """
+        Find the documents most similar to a query
+
+        Args:
+            query: Search query string
+            top_k: Number of results to return
+            min_score: Minimum cosine similarity
+
+        Returns:
+            List of (document_index, score) tuples, best first
+        """
+        if not self.is_ready or top_k <= 0:
+            return []
+
+        scores = self.similarities(query)
+        if scores is None:
+            return []
+        return top_k_indices(scores, top_k, min_score)
+
+    def similarities(self, query: str) -> Optional[np.ndarray]:
+        """Cosine similarity of the query to every document, or None if no query term is indexed"""
+        query_vector = self.vectorizer.transform([query])
+        if query_vector.nnz == 0:
+            return None
+
+        scores = (self.matrix @ query_vector.T).toarray().ravel()
+        if self.delta is not None:
+            # Delta rows follow the main rows in document order
+            scores = np.concatenate([scores, (self.delta @ query_vector.T).toarray().ravel()])
+        return scores
+
+    def stats(self) -> Dict:
+        if not self.is_ready:
+            return {"documents": 0}
+        return {
+            "documents": self.matrix.shape[0],
+            "delta_documents": 0 if self.delta is None else self.delta.shape[0],
+            "terms": self.matrix.shape[1],
+            "nnz": int(self.matrix.nnz),
+            "bytes": int(self.matrix.data.nbytes + self.matrix.indices.nbytes + self.matrix.indptr.nbytes),
+        }
+
+
+def top_k_indices(scores: np.ndarray, top_k: int, min_score: float = 0.0) -> List[Tuple[int, float]]:
+    """Indices of the top_k scores at or above min_score, best first"""
+    candidates = np.flatnonzero(scores >= min_score) if min_score > 0 else np.arange(len(scores))
+    if candidates.size == 0:
+        return []
+    if candidates.size > top_k:
+        # O(n) selection of the best top_k, then sort just those
+        best = np.argpartition(scores[candidates], -top_k)[-top_k:]
+        candidates = candidates[best]
+    order = candidates[np.argsort(scores[candidates])[::-1]]
+    return [(int(index), float(scores[index])) for index in order]
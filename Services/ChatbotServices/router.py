@@ -3,14 +3,17 @@ FastAPI Router for Chatbot Services
 Exposes all chatbot, e-commerce, and knowledge base endpoints as a microservice
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, List, Optional
+import asyncio
 import json
 import traceback
-from .ai_agent import AgenticAI, AgentConfig
-from .product_qna_rag import get_product_qna_rag
+from .ai_agent import AgenticAI, peek_agent
+from .product_qna_rag import ProductQnARAG, peek_product_qna_rag
+from .rag_knowledge_base import RAGKnowledgeBase, peek_knowledge_base
+from .semantic_cache import POLICY
 
 # Pydantic models for API
 class ChatRequest(BaseModel):
@@ -47,9 +50,27 @@ class CartItemRequest(BaseModel):
     cart_item_id: str
     quantity: Optional[int] = None
 
-# Initialize AI agent
-config = AgentConfig()
-agent = AgenticAI(config)
+# The AI agent is created in the background by the gateway's startup orchestrator
+# (see app.py). Endpoints that need it receive it through this dependency and
+# answer 503 until it is ready.
+def require_agent() -> AgenticAI:
+    agent = peek_agent()
+    if agent is None:
+        raise HTTPException(status_code=503, detail="Chatbot agent is starting up. Please retry shortly.")
+    return agent
+
+# The RAG stores load the same way; building one here instead would race the orchestrator's load
+def require_knowledge_base() -> RAGKnowledgeBase:
+    kb = peek_knowledge_base()
+    if kb is None:
+        raise HTTPException(status_code=503, detail="Knowledge base is starting up. Please retry shortly.")
+    return kb
+
+def require_product_qna() -> ProductQnARAG:
+    qna_rag = peek_product_qna_rag()
+    if qna_rag is None:
+        raise HTTPException(status_code=503, detail="Product Q&A is starting up. Please retry shortly.")
+    return qna_rag
 
 # Create router for Chatbot endpoints
 router = APIRouter(tags=["Chatbot Services"])
@@ -57,7 +78,7 @@ router = APIRouter(tags=["Chatbot Services"])
 # =============== CHAT ENDPOINTS ===============
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat_with_agent(request: ChatRequest):
+async def chat_with_agent(request: ChatRequest, agent: AgenticAI = Depends(require_agent)):
     """Chat with the AI agent"""
     try:
         result = await agent.chat(request.message, request.session_id, request.user_id)
@@ -73,7 +94,7 @@ async def chat_with_agent(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/chat/stream")
-async def stream_chat_with_agent(message: str, session_id: str = "default", user_id: str = ""):
+async def stream_chat_with_agent(message: str, session_id: str = "default", user_id: str = "", agent: AgenticAI = Depends(require_agent)):
     """Stream chat responses from the AI agent using GET parameters for EventSource compatibility"""
     async def generate_stream():
         try:
@@ -107,7 +128,7 @@ async def stream_chat_with_agent(message: str, session_id: str = "default", user
     )
 
 @router.get("/history/{session_id}", response_model=HistoryResponse)
-async def get_conversation_history(session_id: str):
+async def get_conversation_history(session_id: str, agent: AgenticAI = Depends(require_agent)):
     """Get conversation history for a session"""
     try:
         messages = await agent.get_conversation_history(session_id)
@@ -116,7 +137,7 @@ async def get_conversation_history(session_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/history/{session_id}")
-async def clear_conversation(session_id: str):
+async def clear_conversation(session_id: str, agent: AgenticAI = Depends(require_agent)):
     """Clear conversation history for a session"""
     try:
         await agent.clear_conversation(session_id)
@@ -127,7 +148,7 @@ async def clear_conversation(session_id: str):
 # =============== APPROVAL ENDPOINTS ===============
 
 @router.get("/approvals")
-async def get_pending_approvals():
+async def get_pending_approvals(agent: AgenticAI = Depends(require_agent)):
     """Get pending human approvals"""
     try:
         approvals = agent.get_pending_approvals()
@@ -136,7 +157,7 @@ async def get_pending_approvals():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/approvals")
-async def provide_approval(request: ApprovalRequest):
+async def provide_approval(request: ApprovalRequest, agent: AgenticAI = Depends(require_agent)):
     """Provide human approval or rejection"""
     try:
         result = agent.provide_approval(
@@ -151,7 +172,7 @@ async def provide_approval(request: ApprovalRequest):
 # =============== SESSION ENDPOINTS ===============
 
 @router.get("/sessions")
-async def get_all_sessions():
+async def get_all_sessions(agent: AgenticAI = Depends(require_agent)):
     """Get all conversation sessions"""
     try:
         sessions = await agent.memory_store.get_all_sessions()
@@ -162,14 +183,31 @@ async def get_all_sessions():
 @router.get("/health")
 async def health_check():
     """Health check endpoint for chatbot service"""
+    agent = peek_agent()
     return {
-        "status": "healthy",
-        "agent": "ready",
-        "memory": "connected"
+        "status": "healthy" if agent is not None else "starting",
+        "agent": "ready" if agent is not None else "loading",
+        "memory": "connected" if agent is not None else "pending"
+    }
+
+@router.get("/cache/stats")
+async def cache_stats(agent: AgenticAI = Depends(require_agent)):
+    """Hit rates of the agent's response caches"""
+    return {
+        "exact": await agent.response_cache.stats(),
+        "semantic": agent.semantic_cache.stats() if agent.semantic_cache is not None else {"enabled": False},
+    }
+
+@router.get("/tools/stats")
+async def tool_stats(agent: AgenticAI = Depends(require_agent)):
+    """Per-tool latency, timeout, error and cache-hit counts, and fast-path routing counts"""
+    return {
+        **agent.tool_executor.stats(),
+        "intent_router": agent.intent_router.stats() if agent.intent_router is not None else {"enabled": False},
     }
 
 @router.get("/debug/cart/{user_id}")
-async def debug_cart(user_id: str):
+async def debug_cart(user_id: str, agent: AgenticAI = Depends(require_agent)):
     """Debug endpoint to test cart functionality"""
     try:
         print(f"[debug] Direct cart test for user: {user_id}")
@@ -193,7 +231,7 @@ async def debug_cart(user_id: str):
 # =============== E-COMMERCE ENDPOINTS ===============
 
 @router.get("/products")
-async def get_products(limit: int = 20):
+async def get_products(limit: int = 20, agent: AgenticAI = Depends(require_agent)):
     """Get all products"""
     try:
         products = await agent.get_products(limit)
@@ -204,7 +242,7 @@ async def get_products(limit: int = 20):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/products/search")
-async def search_products(request: ProductSearchRequest):
+async def search_products(request: ProductSearchRequest, agent: AgenticAI = Depends(require_agent)):
     """Search products"""
     try:
         products = await agent.search_products(request.query, request.limit)
@@ -215,14 +253,16 @@ async def search_products(request: ProductSearchRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/products/qna")
-async def get_product_qna(product_name: str, category: str, limit: int = 6):
+async def get_product_qna(product_name: str, category: str, limit: int = 6,
+                          qna_rag: ProductQnARAG = Depends(require_product_qna)):
     """
     Get pre-generated questions and answers for a product using RAG
     Returns instant Q&A pairs without needing AI generation
     """
     try:
-        qna_rag = get_product_qna_rag()
-        questions_with_answers = qna_rag.get_questions_for_product(
+        # Lookup misses read the matched pairs from the Q&A store (SQLite)
+        questions_with_answers = await asyncio.to_thread(
+            qna_rag.get_questions_for_product,
             product_name=product_name,
             category=category,
             limit=limit
@@ -238,8 +278,20 @@ async def get_product_qna(product_name: str, category: str, limit: int = 6):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/products/qna/{product_id}")
+async def get_product_qna_page(product_id: str, offset: int = 0, limit: int = 20,
+                               qna_rag: ProductQnARAG = Depends(require_product_qna)):
+    """Page through the stored Q&A pairs of one product"""
+    try:
+        page = await asyncio.to_thread(qna_rag.get_product_qna, product_id, offset=offset, limit=limit)
+        return {"success": True, **page}
+    except Exception as e:
+        print("Error in /products/qna/{product_id} endpoint:")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/products/{product_id}")
-async def get_product_details(product_id: str):
+async def get_product_details(product_id: str, agent: AgenticAI = Depends(require_agent)):
     """Get product details"""
     try:
         product = await agent.get_product_details(product_id)
@@ -254,7 +306,7 @@ async def get_product_details(product_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/products/popular/featured")
-async def get_popular_products(limit: int = 5):
+async def get_popular_products(limit: int = 5, agent: AgenticAI = Depends(require_agent)):
     """Get popular products"""
     try:
         products = await agent.get_popular_products(limit)
@@ -265,7 +317,7 @@ async def get_popular_products(limit: int = 5):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/cart/add")
-async def add_to_cart(request: CartRequest):
+async def add_to_cart(request: CartRequest, agent: AgenticAI = Depends(require_agent)):
     """Add item to cart"""
     try:
         result = await agent.add_to_cart(request.user_id, request.product_id, request.quantity)
@@ -281,7 +333,7 @@ async def add_to_cart(request: CartRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/cart/{user_id}")
-async def get_cart_items(user_id: str):
+async def get_cart_items(user_id: str, agent: AgenticAI = Depends(require_agent)):
     """Get user's cart items"""
     try:
         cart_items = await agent.get_cart_items(user_id)
@@ -292,7 +344,7 @@ async def get_cart_items(user_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/cart/{user_id}/summary")
-async def get_cart_summary(user_id: str):
+async def get_cart_summary(user_id: str, agent: AgenticAI = Depends(require_agent)):
     """Get cart summary"""
     try:
         summary = await agent.get_cart_summary(user_id)
@@ -303,7 +355,7 @@ async def get_cart_summary(user_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/cart/item/{cart_item_id}")
-async def remove_from_cart(cart_item_id: str):
+async def remove_from_cart(cart_item_id: str, agent: AgenticAI = Depends(require_agent)):
     """Remove item from cart"""
     try:
         result = await agent.remove_from_cart(cart_item_id)
@@ -319,7 +371,7 @@ async def remove_from_cart(cart_item_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/cart/item/{cart_item_id}")
-async def update_cart_quantity(cart_item_id: str, request: CartItemRequest):
+async def update_cart_quantity(cart_item_id: str, request: CartItemRequest, agent: AgenticAI = Depends(require_agent)):
     """Update cart item quantity"""
     try:
         if request.quantity is None or request.quantity < 1:
@@ -340,7 +392,7 @@ async def update_cart_quantity(cart_item_id: str, request: CartItemRequest):
 # =============== ORDER ENDPOINTS ===============
 
 @router.get("/orders/{user_id}")
-async def get_user_orders(user_id: str):
+async def get_user_orders(user_id: str, agent: AgenticAI = Depends(require_agent)):
     """Get all orders for a user"""
     try:
         result = await agent.ecommerce.get_user_orders(user_id)
@@ -356,7 +408,7 @@ async def get_user_orders(user_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/orders/details/{order_id}")
-async def get_order_details(order_id: str):
+async def get_order_details(order_id: str, agent: AgenticAI = Depends(require_agent)):
     """Get order details"""
     try:
         result = await agent.ecommerce.get_order_details(order_id)
@@ -372,7 +424,7 @@ async def get_order_details(order_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/orders/{order_id}/cancel")
-async def cancel_order(order_id: str):
+async def cancel_order(order_id: str, agent: AgenticAI = Depends(require_agent)):
     """Cancel an order"""
     try:
         result = await agent.ecommerce.cancel_order(order_id)
@@ -388,7 +440,7 @@ async def cancel_order(order_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/orders/create")
-async def create_order_endpoint(request: Dict):
+async def create_order_endpoint(request: Dict, agent: AgenticAI = Depends(require_agent)):
     """Create a new order from cart"""
     try:
         user_id = request.get("user_id", "")
@@ -413,7 +465,7 @@ async def create_order_endpoint(request: Dict):
 # =============== SHIPPING ENDPOINTS ===============
 
 @router.get("/shipping/{user_id}")
-async def get_user_shipping_addresses(user_id: str):
+async def get_user_shipping_addresses(user_id: str, agent: AgenticAI = Depends(require_agent)):
     """Get all shipping addresses for a user"""
     try:
         result = await agent.ecommerce.get_user_shipping_addresses(user_id)
@@ -431,7 +483,7 @@ async def get_user_shipping_addresses(user_id: str):
 # =============== COUPON ENDPOINTS ===============
 
 @router.post("/coupons/validate")
-async def validate_coupon_endpoint(request: Dict):
+async def validate_coupon_endpoint(request: Dict, agent: AgenticAI = Depends(require_agent)):
     """Validate a coupon code"""
     try:
         coupon_code = request.get("code", "")
@@ -446,7 +498,7 @@ async def validate_coupon_endpoint(request: Dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/coupons/available")
-async def get_available_coupons():
+async def get_available_coupons(agent: AgenticAI = Depends(require_agent)):
     """Get all available coupon codes"""
     try:
         result = await agent.ecommerce.get_available_coupons()
@@ -462,11 +514,11 @@ async def get_available_coupons():
 # =============== RAG KNOWLEDGE BASE ENDPOINTS ===============
 
 @router.get("/knowledge/search")
-async def search_knowledge_base(query: str, top_k: int = 3):
+async def search_knowledge_base(query: str, top_k: int = 3, kb: RAGKnowledgeBase = Depends(require_knowledge_base)):
     """Search the knowledge base for relevant information"""
     try:
-        from .rag_knowledge_base import search_knowledge
-        results = search_knowledge(query, top_k)
+        # Hybrid ranking encodes the query and searches the ANN index; keep it off the event loop
+        results = await asyncio.to_thread(kb.search, query, top_k)
         return {"results": results, "query": query}
     except Exception as e:
         print("Error in /knowledge/search endpoint:")
@@ -474,11 +526,10 @@ async def search_knowledge_base(query: str, top_k: int = 3):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/knowledge/context")
-async def get_knowledge_context(query: str, max_length: int = 1000):
+async def get_knowledge_context(query: str, max_length: int = 1000, kb: RAGKnowledgeBase = Depends(require_knowledge_base)):
     """Get formatted context from knowledge base for a query"""
     try:
-        from .rag_knowledge_base import get_context
-        context = get_context(query, max_length)
+        context = await asyncio.to_thread(kb.get_context_for_query, query, max_length)
         return {"context": context, "query": query}
     except Exception as e:
         print("Error in /knowledge/context endpoint:")
@@ -486,12 +537,9 @@ async def get_knowledge_context(query: str, max_length: int = 1000):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/knowledge/add")
-async def add_knowledge_document(request: Dict):
+async def add_knowledge_document(request: Dict, kb: RAGKnowledgeBase = Depends(require_knowledge_base)):
     """Add a new document to the knowledge base"""
     try:
-        from .rag_knowledge_base import get_knowledge_base
-        kb = get_knowledge_base()
-        
         title = request.get("title", "")
         content = request.get("content", "")
         category = request.get("category", "general")
@@ -500,8 +548,13 @@ async def add_knowledge_document(request: Dict):
         if not title or not content:
             raise HTTPException(status_code=400, detail="Title and content are required")
         
-        success = kb.add_document(title, content, category, keywords)
+        # Journaling, vectorizing and embedding (or a full rebuild) run off the event loop
+        success = await asyncio.to_thread(kb.add_document, title, content, category, keywords)
         if success:
+            # Cached policy answers may contradict the new document
+            agent = peek_agent()
+            if agent is not None and agent.semantic_cache is not None:
+                agent.semantic_cache.invalidate_intent(POLICY)
             return {"message": "Document added successfully", "success": True}
         else:
             raise HTTPException(status_code=500, detail="Failed to add document")
@@ -512,6 +565,44 @@ async def add_knowledge_document(request: Dict):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/products/qna/add")
+async def add_product_qna(request: Dict, qna_rag: ProductQnARAG = Depends(require_product_qna)):
+    """
+    Add Q&A pairs for a product to the product Q&A knowledge base
+    Accepts the question list returned by /products/generate-qna; the pairs are
+    indexed incrementally, so bulk loading doesn't rebuild the index per pair
+    """
+    try:
+        product_id = request.get("product_id", "")
+        product_name = request.get("product_name", "")
+        category = request.get("category", "general")
+        questions = request.get("questions", [])
+        
+        if not product_id or not product_name or not questions:
+            raise HTTPException(status_code=400, detail="product_id, product_name and questions are required")
+        
+        pairs = [
+            {
+                "product_id": product_id,
+                "product_name": product_name,
+                "category": category,
+                "question": item["question"],
+                "answer": item["answer"]
+            }
+            for item in questions
+            if item.get("question") and item.get("answer")
+        ]
+        added = await asyncio.to_thread(qna_rag.add_qna_pairs, pairs)
+        if pairs and not added:
+            raise HTTPException(status_code=500, detail="Failed to add Q&A pairs")
+        return {"message": f"Added {added} Q&A pairs", "success": True, "count": added}
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("Error in /products/qna/add endpoint:")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/products/generate-qna")
 async def generate_product_qna(request: Dict):
     """
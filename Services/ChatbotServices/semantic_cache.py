@@ -0,0 +1,235 @@
+"""
+Semantic Response Cache
+Second cache tier for the agent: reuses an answer when a new question means the same as a cached one
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from .hybrid_retrieval import get_embedder
+
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "500"))
+SEMANTIC_CACHE_TTL_MINUTES = float(os.getenv("SEMANTIC_CACHE_TTL_MINUTES", "15"))
+
+# Minimum cosine similarity for a hit; embeddings and character n-grams need different cut-offs
+EMBEDDING_THRESHOLD = 0.92
+NGRAM_THRESHOLD = 0.9
+SEMANTIC_CACHE_THRESHOLD = os.getenv("SEMANTIC_CACHE_THRESHOLD")
+
+# Words that phrase a question without changing what it asks for
+FILLER_WORDS = {
+    "a", "an", "the", "what", "which", "whats", "do", "does", "you", "your", "have", "has", "sell",
+    "carry", "offer", "is", "are", "can", "could", "i", "me", "of", "to", "for", "any", "there",
+    "tell", "about", "show", "please", "pls", "get", "find", "list", "some", "kind", "kinds", "type", "types",
+}
+
+# Questions that lean on the conversation ("is it in stock?") can't be answered from another session
+FOLLOW_UP_WORDS = {"it", "its", "this", "that", "these", "those", "them", "they", "one", "ones", "same", "other", "else"}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+
+# Intents used to invalidate cached answers when their source data changes
+CATALOG = "catalog"
+POLICY = "policy"
+GENERAL = "general"
+
+INTENT_KEYWORDS = {
+    POLICY: {"shipping", "ship", "delivery", "deliver", "return", "returns", "refund", "refunds", "warranty",
+             "exchange", "payment", "pay", "policy", "policies", "privacy", "track", "tracking"},
+    GENERAL: {"hi", "hello", "hey", "thanks", "thank", "help", "who", "contact", "hours", "open", "support",
+              "account", "login", "password"},
+}
+
+
+def classify_intent(query: str) -> str:
+    """Coarse intent of a question, used only for cache invalidation"""
+    tokens = set(TOKEN_PATTERN.findall(query.lower()))
+    if tokens & INTENT_KEYWORDS[POLICY]:
+        return POLICY
+    if tokens & INTENT_KEYWORDS[GENERAL]:
+        return GENERAL
+    # Anything else may list products, prices or stock
+    return CATALOG
+
+
+class SemanticCache:
+    """
+    Response cache matched on meaning instead of exact text
+
+    Questions are normalized (filler words dropped) and embedded with the local
+    sentence-embedding model when one is configured (see hybrid_retrieval), or
+    hashed character n-grams otherwise, which need no fitting and absorb
+    rephrasings like "what laptops do you have" / "which laptops do you sell".
+    A lookup is one matrix-vector product over the cached vectors.
+
+    A hit also requires the same numbers ("under 500" never matches "under
+    1500") and the same intent. Entries are tagged with an intent so a catalog
+    change drops only catalog-dependent answers. Hit rate and the LLM time
+    saved (the recorded latency of each reused answer) are tracked.
+    """
+
+    def __init__(self, max_size: int = SEMANTIC_CACHE_SIZE, ttl_minutes: float = SEMANTIC_CACHE_TTL_MINUTES,
+                 threshold: Optional[float] = None):
+        self.embedder = get_embedder()
+        if self.embedder is None:
+            self.vectorizer = HashingVectorizer(
+                analyzer='char_wb', ngram_range=(3, 5), n_features=2 ** 18,
+                alternate_sign=False, norm='l2', dtype=np.float32
+            )
+        default_threshold = EMBEDDING_THRESHOLD if self.embedder is not None else NGRAM_THRESHOLD
+        if threshold is None:
+            threshold = float(SEMANTIC_CACHE_THRESHOLD) if SEMANTIC_CACHE_THRESHOLD else default_threshold
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_minutes * 60
+
+        self.entries: "OrderedDict[int, Dict]" = OrderedDict()
+        self._next_id = 0
+        self._matrix = None  # Stacked entry vectors, rebuilt lazily after changes
+        self._matrix_ids: List[int] = []
+        self._lock = threading.Lock()
+
+        self.lookups = 0
+        self.hits = 0
+        self.saved_seconds = 0.0
+
+    # =============== KEYS ===============
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(token for token in TOKEN_PATTERN.findall(query.lower()) if token not in FILLER_WORDS)
+
+    @staticmethod
+    def is_cacheable(query: str) -> bool:
+        """Standalone questions only: follow-ups depend on the conversation they are in"""
+        tokens = set(TOKEN_PATTERN.findall(query.lower()))
+        return bool(tokens) and not tokens & FOLLOW_UP_WORDS
+
+    def _vector(self, normalized: str):
+        """(1, dimension) row: dense for embeddings, sparse for hashed n-grams"""
+        if self.embedder is not None:
+            return self.embedder.encode([normalized])
+        return self.vectorizer.transform([normalized])
+
+    def _stacked(self):
+        if self._matrix is None:
+            self._matrix_ids = list(self.entries)
+            if self._matrix_ids:
+                rows = [self.entries[entry_id]["vector"] for entry_id in self._matrix_ids]
+                self._matrix = np.vstack(rows) if self.embedder is not None else sparse.vstack(rows, format="csr")
+        return self._matrix
+
+    # =============== CACHE OPERATIONS ===============
+
+    def get(self, query: str) -> Optional[str]:
+        """Cached answer to an equivalent question, or None"""
+        if not self.is_cacheable(query):
+            return None
+        normalized = self.normalize(query)
+        if not normalized:
+            return None
+        vector = self._vector(normalized)
+        numbers = NUMBER_PATTERN.findall(normalized)
+        intent = classify_intent(query)
+
+        with self._lock:
+            self.lookups += 1
+            self._expire()
+            matrix = self._stacked()
+            if matrix is None:
+                return None
+
+            similarities = matrix @ vector.T
+            similarities = np.asarray(similarities.toarray() if sparse.issparse(similarities) else similarities).ravel()
+            for position in np.argsort(similarities)[::-1]:
+                if similarities[position] < self.threshold:
+                    break
+                entry_id = self._matrix_ids[position]
+                entry = self.entries[entry_id]
+                if entry["numbers"] != numbers or entry["intent"] != intent:
+                    continue
+                self.entries.move_to_end(entry_id)
+                self.hits += 1
+                self.saved_seconds += entry["latency"]
+                print(f"[debug] Semantic cache hit ({similarities[position]:.2f}) for: {query[:50]}... "
+                      f"matched: {entry['query'][:50]}")
+                return entry["response"]
+        return None
+
+    def set(self, query: str, response: str, latency: float = 0.0):
+        """
+        Cache an answer
+
+        Args:
+            query: The user's question
+            response: Answer returned by the LLM
+            latency: Seconds the LLM took, credited to saved_seconds on every hit
+        """
+        if not self.is_cacheable(query) or not response:
+            return
+        normalized = self.normalize(query)
+        if not normalized:
+            return
+        entry = {
+            "query": query[:100],
+            "response": response,
+            "vector": self._vector(normalized),
+            "numbers": NUMBER_PATTERN.findall(normalized),
+            "intent": classify_intent(query),
+            "latency": latency,
+            "expires_at": time.monotonic() + self.ttl_seconds,
+        }
+        with self._lock:
+            self.entries[self._next_id] = entry
+            self._next_id += 1
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+            self._matrix = None
+
+    def invalidate_intent(self, intent: str) -> int:
+        """Drop cached answers with the given intent; returns how many were dropped"""
+        with self._lock:
+            stale = [entry_id for entry_id, entry in self.entries.items() if entry["intent"] == intent]
+            for entry_id in stale:
+                del self.entries[entry_id]
+            if stale:
+                self._matrix = None
+        if stale:
+            print(f"[debug] Semantic cache dropped {len(stale)} {intent} answers")
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self._matrix = None
+
+    def _expire(self):
+        now = time.monotonic()
+        expired = [entry_id for entry_id, entry in self.entries.items() if entry["expires_at"] <= now]
+        for entry_id in expired:
+            del self.entries[entry_id]
+        if expired:
+            self._matrix = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "enabled": SEMANTIC_CACHE_ENABLED,
+                "backend": self.embedder.name if self.embedder is not None else "char_ngrams",
+                "threshold": self.threshold,
+                "entries": len(self.entries),
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+                "saved_seconds": round(self.saved_seconds, 3),
+            }
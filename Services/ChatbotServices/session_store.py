@@ -0,0 +1,262 @@
+"""
+Session State Store
+Conversation messages and flow metadata per chat session: an in-process hot tier over MongoDB
+
+A chat turn costs at most one read and one small write:
+
+- reads are a single projected find_one that returns only the last N messages
+  and the metadata, and are skipped entirely when the session is in the hot tier
+- writes append the turn's new messages with $push/$slice and $set only the
+  metadata keys that changed, instead of replacing the whole document
+
+With the hot tier enabled, writes are applied to the in-memory entry at once
+and flushed to MongoDB in the background (write-behind); writes queued for a
+session while a flush is running are coalesced into the next one. The hot tier
+is only correct when every request of a session reaches this process, so it is
+turned off by default under multi-worker gunicorn (see gunicorn_conf.py).
+"""
+
+import asyncio
+import copy
+from collections import OrderedDict
+from datetime import datetime
+import os
+from typing import Dict, List, Optional, Tuple
+
+from pymongo.errors import PyMongoError
+
+SESSION_HOT_TIER = os.getenv("SESSION_HOT_TIER", "true").lower() == "true"
+SESSION_HOT_TIER_SIZE = int(os.getenv("SESSION_HOT_TIER_SIZE", "1000"))
+
+# Messages kept per session document
+MAX_MESSAGES = 50
+
+# Write-behind flush attempts before the pending writes of a session are dropped
+FLUSH_ATTEMPTS = 3
+FLUSH_RETRY_SECONDS = 0.5
+
+
+def metadata_changes(previous: Dict, current: Dict) -> Tuple[Dict, List[str]]:
+    """Keys of current that differ from previous, and keys of previous that were removed"""
+    changed = {key: value for key, value in current.items() if key not in previous or previous[key] != value}
+    removed = [key for key in previous if key not in current]
+    return changed, removed
+
+
+class SessionStore:
+    """
+    Per-session messages and metadata backed by the conversations collection
+
+    Hot entries hold a session's most recent messages (at most MAX_MESSAGES)
+    and its metadata. An entry loaded with a message limit only knows that
+    many messages, so it serves later loads with the same or a smaller limit
+    and falls through to MongoDB for longer histories.
+    """
+
+    def __init__(self, conversations, hot_tier: bool = SESSION_HOT_TIER, hot_size: int = SESSION_HOT_TIER_SIZE):
+        self.conversations = conversations
+        self.hot_tier = hot_tier
+        self.hot_size = hot_size
+        self.hot: "OrderedDict[str, Dict]" = OrderedDict()
+        self._pending: Dict[str, Dict] = {}  # session_id -> coalesced writes not yet flushed
+        self._flushes: Dict[str, asyncio.Task] = {}
+        self._reads: Dict[str, List[Dict]] = {}  # session_id -> MongoDB reads in flight, flagged stale by writes
+
+        self.hot_hits = 0
+        self.reads = 0
+        self.writes = 0
+        self.failed_flushes = 0
+
+    # =============== READS ===============
+
+    async def load(self, session_id: str, limit: int = 20) -> Tuple[List[Dict], Optional[Dict]]:
+        """
+        Recent messages and metadata of a session
+
+        Returns:
+            (last `limit` messages, metadata) - metadata is None when the session
+            has no document yet. Both are copies the caller may modify.
+        """
+        entry = self.hot.get(session_id)
+        if entry is not None and (entry["complete"] or len(entry["messages"]) >= limit):
+            self.hot.move_to_end(session_id)
+            self.hot_hits += 1
+            return copy.deepcopy(entry["messages"][-limit:]), copy.deepcopy(entry["metadata"])
+
+        # An evicted entry may still be on its way to MongoDB
+        flush = self._flushes.get(session_id)
+        if flush is not None:
+            await asyncio.shield(flush)
+
+        self.reads += 1
+        read = {"stale": False}
+        self._reads.setdefault(session_id, []).append(read)
+        try:
+            doc = await self.conversations.find_one(
+                {"session_id": session_id},
+                {"messages": {"$slice": -limit}, "metadata": 1, "_id": 0}
+            )
+        finally:
+            reads = self._reads[session_id]
+            reads.remove(read)
+            if not reads:
+                del self._reads[session_id]
+        if doc is None:
+            messages, metadata = [], None
+        else:
+            messages, metadata = doc.get("messages", []), doc.get("metadata") or {}
+
+        if read["stale"]:
+            # A write for the session landed while the read was in flight, so the document may
+            # predate it; keep the hot entry the write produced instead of installing this one
+            entry = self.hot.get(session_id)
+            if entry is not None and (entry["complete"] or len(entry["messages"]) >= limit):
+                return copy.deepcopy(entry["messages"][-limit:]), copy.deepcopy(entry["metadata"])
+        elif self.hot_tier:
+            self._remember(session_id, {
+                "messages": messages,
+                "metadata": metadata,
+                # Fewer messages than asked for means this is the whole history
+                "complete": len(messages) < limit,
+            })
+        return copy.deepcopy(messages), copy.deepcopy(metadata)
+
+    # =============== WRITES ===============
+
+    async def append(self, session_id: str, messages: List[Dict], metadata: Dict, previous_metadata: Dict = None):
+        """
+        Append new messages and apply the changed metadata keys
+
+        Args:
+            session_id: Session to update (created if missing)
+            messages: Messages added since the session was loaded
+            metadata: Full metadata for the session after this turn
+            previous_metadata: Metadata as loaded, used to work out what changed
+        """
+        changed, removed = metadata_changes(previous_metadata or {}, metadata)
+        if not messages and not changed and not removed:
+            return
+        self._invalidate_reads(session_id)
+
+        if not self.hot_tier:
+            await self._write(session_id, list(messages), changed, removed)
+            return
+
+        entry = self.hot.get(session_id)
+        if entry is not None:
+            entry["messages"] = (entry["messages"] + copy.deepcopy(messages))[-MAX_MESSAGES:]
+            entry["metadata"] = {
+                **{key: value for key, value in (entry["metadata"] or {}).items() if key not in removed},
+                **copy.deepcopy(changed),
+            }
+            self.hot.move_to_end(session_id)
+
+        pending = self._pending.setdefault(session_id, {"messages": [], "set": {}, "unset": set()})
+        pending["messages"].extend(copy.deepcopy(messages))
+        for key, value in changed.items():
+            pending["set"][key] = copy.deepcopy(value)
+            pending["unset"].discard(key)
+        for key in removed:
+            pending["set"].pop(key, None)
+            pending["unset"].add(key)
+
+        if session_id not in self._flushes:
+            self._flushes[session_id] = asyncio.create_task(self._flush_session(session_id))
+
+    async def replace(self, session_id: str, messages: List[Dict], metadata: Dict = None):
+        """Overwrite a session's messages and metadata (written through immediately)"""
+        self._invalidate_reads(session_id)
+        await self._drain(session_id)
+        messages = messages[-MAX_MESSAGES:]
+        now = datetime.utcnow()
+        await self.conversations.replace_one(
+            {"session_id": session_id},
+            {
+                "session_id": session_id,
+                "messages": messages,
+                "metadata": metadata or {},
+                "timestamp": now,
+                "last_updated": now,
+            },
+            upsert=True
+        )
+        self.writes += 1
+        if self.hot_tier:
+            self._remember(session_id, {
+                "messages": copy.deepcopy(messages), "metadata": copy.deepcopy(metadata or {}), "complete": True
+            })
+
+    async def delete(self, session_id: str) -> int:
+        """Remove a session everywhere; returns the number of documents deleted"""
+        self._invalidate_reads(session_id)
+        self.hot.pop(session_id, None)
+        self._pending.pop(session_id, None)
+        await self._drain(session_id)
+        result = await self.conversations.delete_one({"session_id": session_id})
+        return result.deleted_count
+
+    async def flush_all(self):
+        """Wait for every queued write to reach MongoDB (called on shutdown)"""
+        while self._flushes:
+            await asyncio.gather(*list(self._flushes.values()), return_exceptions=True)
+
+    async def _write(self, session_id: str, messages: List[Dict], changed: Dict, removed):
+        now = datetime.utcnow()
+        update = {
+            "$push": {"messages": {"$each": messages, "$slice": -MAX_MESSAGES}},
+            "$set": {
+                **{f"metadata.{key}": value for key, value in changed.items()},
+                "timestamp": now,
+                "last_updated": now,
+            },
+        }
+        if removed:
+            update["$unset"] = {f"metadata.{key}": "" for key in removed}
+        await self.conversations.update_one({"session_id": session_id}, update, upsert=True)
+        self.writes += 1
+
+    async def _flush_session(self, session_id: str):
+        try:
+            while session_id in self._pending:
+                pending = self._pending.pop(session_id)
+                for attempt in range(1, FLUSH_ATTEMPTS + 1):
+                    try:
+                        await self._write(session_id, pending["messages"], pending["set"], pending["unset"])
+                        break
+                    except PyMongoError as e:
+                        if attempt == FLUSH_ATTEMPTS:
+                            self.failed_flushes += 1
+                            # The hot entry is now ahead of MongoDB; drop it so reads see what was stored
+                            self.hot.pop(session_id, None)
+                            print(f"[debug] Dropped session writes for {session_id} after {attempt} attempts: {e}")
+                        else:
+                            await asyncio.sleep(FLUSH_RETRY_SECONDS * attempt)
+        finally:
+            self._flushes.pop(session_id, None)
+
+    async def _drain(self, session_id: str):
+        """Wait until no flush is running for the session"""
+        while session_id in self._flushes:
+            await asyncio.shield(self._flushes[session_id])
+
+    def _invalidate_reads(self, session_id: str):
+        """Keep reads of the session that are in flight from installing what they return"""
+        for read in self._reads.get(session_id, ()):
+            read["stale"] = True
+
+    def _remember(self, session_id: str, entry: Dict):
+        self.hot[session_id] = entry
+        self.hot.move_to_end(session_id)
+        while len(self.hot) > self.hot_size:
+            self.hot.popitem(last=False)
+
+    def stats(self) -> Dict:
+        return {
+            "hot_tier": self.hot_tier,
+            "hot_entries": len(self.hot),
+            "hot_hits": self.hot_hits,
+            "reads": self.reads,
+            "writes": self.writes,
+            "pending_sessions": len(self._pending),
+            "failed_flushes": self.failed_flushes,
+        }
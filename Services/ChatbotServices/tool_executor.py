@@ -0,0 +1,254 @@
+"""
+Agent Tool Executor
+Runs the tool calls of one LLM step: read-only calls concurrently, each under its own deadline
+
+Replaces LangGraph's ToolNode in the agent's tools node. Calls are taken in
+the order the model emitted them; consecutive read-only calls run together,
+and any other call (cart, checkout, order changes) runs on its own, so writes
+keep their order relative to the reads around them. A call that exceeds its
+deadline or raises becomes an error ToolMessage the model can react to, so
+one stuck tool can no longer hold the turn until the graph timeout. Read-only
+calls are cancelled at the deadline; write calls are not, since stopping one
+halfway through its MongoDB writes could leave a partial order or cart. They
+finish in the background and the model is told not to retry.
+
+Idempotent catalog-wide lookups are cached for a short TTL, and per-tool
+latency, timeout and error counts are kept for the /tools/stats endpoint.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import ToolMessage
+
+TOOL_TIMEOUT_SECONDS = float(os.getenv("TOOL_TIMEOUT_SECONDS", "15"))
+TOOL_CACHE_TTL_SECONDS = float(os.getenv("TOOL_CACHE_TTL_SECONDS", "60"))
+
+# Deadlines that differ from TOOL_TIMEOUT_SECONDS
+TOOL_TIMEOUTS = {
+    "create_order_tool": 30.0,
+    "confirm_and_place_order_tool": 30.0,
+    "place_order_with_confirmation_tool": 30.0,
+    "finalize_order_directly_tool": 30.0,
+}
+
+# Tools that only read, so they may run alongside each other
+READ_ONLY_TOOLS = {
+    "search_products_tool",
+    "get_products_tool",
+    "get_product_details_tool",
+    "get_product_categories_tool",
+    "get_products_by_category_tool",
+    "get_featured_products_tool",
+    "get_price_range_tool",
+    "get_low_stock_products_tool",
+    "get_cart_summary_tool",
+    "get_cart_items_tool",
+    "get_orders_tool",
+    "get_order_details_tool",
+    "track_order_tool",
+    "get_shipping_addresses_tool",
+    "check_shipping_and_suggest_next_step_tool",
+    "validate_coupon_tool",
+    "get_available_coupons_tool",
+    "search_knowledge_base_tool",
+    "get_product_information_tool",
+}
+
+# Read-only tools whose answer doesn't depend on the user, cached for TOOL_CACHE_TTL_SECONDS
+CACHEABLE_TOOLS = {
+    "get_product_categories_tool",
+    "get_price_range_tool",
+    "get_available_coupons_tool",
+}
+
+
+def _content(output: Any) -> str:
+    """ToolMessage content for a tool's return value"""
+    if isinstance(output, str):
+        return output
+    return json.dumps(output, ensure_ascii=False, default=str)
+
+
+def _is_error(output: Any) -> bool:
+    return isinstance(output, dict) and ("error" in output or output.get("success") is False)
+
+
+class ToolExecutor:
+    """Executes tool calls with concurrency, deadlines, a TTL cache and latency stats"""
+
+    def __init__(self, tools: List, timeout: float = TOOL_TIMEOUT_SECONDS, cache_ttl: float = TOOL_CACHE_TTL_SECONDS):
+        self.tools = {t.name: t for t in tools}
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._background: set = set()  # Write calls still running past their deadline
+        self._stats: Dict[str, Dict] = {}
+
+    async def run(self, tool_calls: List[Dict], config: Optional[Dict] = None) -> List[ToolMessage]:
+        """
+        Execute the tool calls of an AIMessage
+
+        Args:
+            tool_calls: AIMessage.tool_calls ({name, args, id} dictionaries)
+            config: Runnable config of the calling node, so tool runs show up in streamed events
+
+        Returns:
+            One ToolMessage per call, in call order
+        """
+        messages: List[ToolMessage] = []
+        batch: List[Dict] = []
+        for call in tool_calls:
+            if call["name"] in READ_ONLY_TOOLS:
+                batch.append(call)
+                continue
+            if batch:
+                messages.extend(await asyncio.gather(*(self._execute(c, config) for c in batch)))
+                batch = []
+            messages.append(await self._execute(call, config))
+        if batch:
+            messages.extend(await asyncio.gather(*(self._execute(c, config) for c in batch)))
+        return messages
+
+    async def invoke(self, name: str, args: Dict, config: Optional[Dict] = None) -> Any:
+        """
+        Run one tool and return its raw output (served from the cache for CACHEABLE_TOOLS)
+
+        Raises:
+            KeyError: Unknown tool
+            asyncio.TimeoutError: The tool missed its deadline (a write tool keeps running)
+            Exception: Whatever the tool raised
+        """
+        tool = self.tools[name]
+        cache_key = (name, json.dumps(args, sort_keys=True, default=str))
+        if name in CACHEABLE_TOOLS:
+            cached = self._cached(cache_key)
+            if cached is not None:
+                self._record(name, 0.0, cache_hit=True)
+                return cached
+
+        timeout = TOOL_TIMEOUTS.get(name, self.timeout)
+        started = time.perf_counter()
+        try:
+            if name in READ_ONLY_TOOLS:
+                output = await asyncio.wait_for(tool.ainvoke(args, config), timeout=timeout)
+            else:
+                task = asyncio.ensure_future(tool.ainvoke(args, config))
+                try:
+                    output = await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+                except asyncio.TimeoutError:
+                    self._background.add(task)
+                    task.add_done_callback(lambda done: self._finished_in_background(name, done))
+                    raise
+        except asyncio.TimeoutError:
+            self._record(name, time.perf_counter() - started, timed_out=True)
+            print(f"[debug] Tool {name} timed out after {timeout:g}s")
+            raise
+        except Exception as e:
+            self._record(name, time.perf_counter() - started, failed=True)
+            print(f"[debug] Tool {name} failed: {e}")
+            raise
+
+        elapsed = time.perf_counter() - started
+        self._record(name, elapsed)
+        print(f"[debug] Tool {name} finished in {elapsed * 1000:.0f}ms")
+        if name in CACHEABLE_TOOLS and not _is_error(output):
+            with self._lock:
+                self._cache[cache_key] = (output, time.monotonic() + self.cache_ttl)
+        return output
+
+    async def _execute(self, call: Dict, config: Optional[Dict]) -> ToolMessage:
+        name = call["name"]
+        if name not in self.tools:
+            return ToolMessage(
+                content=f"Error: {name} is not a valid tool, try one of [{', '.join(self.tools)}].",
+                name=name, tool_call_id=call["id"], status="error"
+            )
+        try:
+            output = await self.invoke(name, call.get("args", {}), config)
+        except asyncio.TimeoutError:
+            timeout = TOOL_TIMEOUTS.get(name, self.timeout)
+            if name not in READ_ONLY_TOOLS:
+                return ToolMessage(
+                    content=f"Error: {name} is still processing after {timeout:g} seconds and will finish on its own. "
+                            "Do NOT call it again and do NOT tell the user to retry, or the change may be applied twice. "
+                            "Tell the user their request is still being processed and to check their cart or order "
+                            "status in a moment.",
+                    name=name, tool_call_id=call["id"], status="error"
+                )
+            return ToolMessage(
+                content=f"Error: {name} did not respond within {timeout:g} seconds. Tell the user to try again shortly.",
+                name=name, tool_call_id=call["id"], status="error"
+            )
+        except Exception as e:
+            return ToolMessage(
+                content=f"Error: {repr(e)}\n Please fix your mistakes.",
+                name=name, tool_call_id=call["id"], status="error"
+            )
+        return ToolMessage(content=_content(output), name=name, tool_call_id=call["id"])
+
+    def _finished_in_background(self, name: str, task: asyncio.Task):
+        self._background.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            print(f"[debug] Tool {name} failed after its deadline: {error}")
+        else:
+            print(f"[debug] Tool {name} finished after its deadline")
+
+    # =============== CACHE ===============
+
+    def _cached(self, key: Tuple[str, str]) -> Any:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            output, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._cache[key]
+                return None
+            return output
+
+    def clear_cache(self):
+        """Drop cached tool results (the catalog or coupons changed)"""
+        with self._lock:
+            self._cache.clear()
+
+    # =============== STATS ===============
+
+    def _record(self, name: str, seconds: float, cache_hit: bool = False, timed_out: bool = False, failed: bool = False):
+        with self._lock:
+            stats = self._stats.setdefault(name, {
+                "calls": 0, "cache_hits": 0, "timeouts": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+            })
+            stats["calls"] += 1
+            stats["cache_hits"] += cache_hit
+            stats["timeouts"] += timed_out
+            stats["errors"] += failed
+            if not cache_hit:
+                stats["total_seconds"] += seconds
+                stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            tools = {}
+            for name, stats in self._stats.items():
+                executed = stats["calls"] - stats["cache_hits"]
+                tools[name] = {
+                    **stats,
+                    "total_seconds": round(stats["total_seconds"], 3),
+                    "max_seconds": round(stats["max_seconds"], 3),
+                    "avg_seconds": round(stats["total_seconds"] / executed, 3) if executed else 0.0,
+                }
+            return {
+                "timeout_seconds": self.timeout,
+                "cache_ttl_seconds": self.cache_ttl,
+                "cached_results": len(self._cache),
+                "tools": tools,
+            }
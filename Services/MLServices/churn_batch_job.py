@@ -0,0 +1,232 @@
+"""
+Churn Batch Scoring Job
+Streams customer metrics from MongoDB, scores them in chunks with the churn model
+and writes churn_probability / risk_tier back with bulk writes
+
+The job walks the `customermetrics` collection in _id order and records the last
+written _id in a checkpoint file after every chunk, so an interrupted run picks
+up where it stopped. Profile fields (gender, city tier, ...) are read from
+`customerprofiles` with one $in query per chunk, using the same feature mapping
+as the Node backend's MLServiceController.
+
+Usage:
+    python -m MLServices.churn_batch_job [--chunk-size 1000] [--restart]
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from bson import ObjectId
+from dotenv import load_dotenv
+from pymongo import MongoClient, UpdateOne
+
+from .churn_preprocessing import (
+    feature_encoder,
+    get_risk_tier,
+    is_model_loaded,
+    load_model,
+    score_matrix
+)
+
+logger = logging.getLogger(__name__)
+
+SERVICES_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CHECKPOINT_FILE = Path(__file__).resolve().parent / "churn_job_checkpoint.json"
+
+# Only the fields needed to build the feature payload
+METRICS_PROJECTION = {
+    "user": 1, "tenure": 1, "complain": 1, "cashbackAmountAvg": 1, "orderCount": 1,
+    "couponUsed": 1, "orderAmountHikeFromLastYear": 1, "daysSinceLastOrder": 1,
+    "warehouseToHome": 1
+}
+PROFILE_PROJECTION = {
+    "user": 1, "gender": 1, "satisfactionScore": 1, "cityTier": 1,
+    "maritalStatus": 1, "preferredCategories": 1
+}
+
+
+def build_feature_record(metrics: dict, profile: dict) -> dict:
+    """Assemble the model payload from a metrics and profile document (mirrors fetchCustomerDataFromDB)"""
+    complain = metrics.get("complain") or 0
+    categories = profile.get("preferredCategories") or []
+    return {
+        'Gender': profile.get("gender") or 'Unknown',
+        'SatisfactionScore': profile.get("satisfactionScore") or 3,
+        'CityTier': profile.get("cityTier") or 3,
+        'MaritalStatus': profile.get("maritalStatus") or 'Single',
+        'Tenure': metrics.get("tenure") or 0,
+        'Complain_Raw': complain,
+        'CashbackAmount': metrics.get("cashbackAmountAvg") or 0,
+        'OrderCount': metrics.get("orderCount") or 0,
+        'CouponUsed': metrics.get("couponUsed") or 0,
+        'OrderAmountHikeFromlastYear': metrics.get("orderAmountHikeFromLastYear") or 0,
+        'DaySinceLastOrder': metrics.get("daysSinceLastOrder") or 7,
+        'WarehouseToHome': metrics.get("warehouseToHome") or 12.0,
+        'PreferedOrderCat': categories[0] if categories else 'Others',
+        'HourSpendOnApp': 1.5,
+        'NumberOfAddress': 3,
+        'PreferredLoginDevice': 'Mobile Phone',
+        'PreferredPaymentMode': 'Credit Card',
+        'Complain_Str': 'Recent Complaint' if complain == 1 else 'No Complain',
+    }
+
+
+def load_checkpoint(path: Path) -> Optional[dict]:
+    """Read the checkpoint file, if any"""
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+
+
+def save_checkpoint(path: Path, state: dict):
+    """Write the checkpoint atomically so a crash never leaves a half-written file"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def iter_chunks(collection, chunk_size: int, after_id: Optional[ObjectId]) -> Iterator[List[dict]]:
+    """Stream metrics documents in _id order, yielding fixed-size chunks"""
+    query = {"_id": {"$gt": after_id}} if after_id is not None else {}
+    cursor = collection.find(query, METRICS_PROJECTION).sort("_id", 1).batch_size(chunk_size)
+
+    chunk = []
+    for doc in cursor:
+        chunk.append(doc)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def score_chunk(metrics_docs: List[dict], profiles: Dict[str, dict]) -> Tuple[List[UpdateOne], int]:
+    """Score one chunk and build the bulk update operations"""
+    scored_docs = []
+    records = []
+    for doc in metrics_docs:
+        profile = profiles.get(str(doc.get("user")))
+        if profile is None:
+            continue
+        scored_docs.append(doc)
+        records.append(build_feature_record(doc, profile))
+
+    if not records:
+        return [], len(metrics_docs)
+
+    risk_percentages = score_matrix(feature_encoder.encode(records))
+    scored_at = datetime.utcnow()
+    operations = [
+        UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {
+                "churn_probability": float(risk_percentage),
+                "risk_tier": get_risk_tier(risk_percentage),
+                "churn_scored_at": scored_at
+            }}
+        )
+        for doc, risk_percentage in zip(scored_docs, risk_percentages)
+    ]
+    return operations, len(metrics_docs) - len(scored_docs)
+
+
+def run_churn_scoring_job(mongo_uri: str, db_name: str = "TechHive", chunk_size: int = 1000,
+                          checkpoint_file: Path = DEFAULT_CHECKPOINT_FILE, resume: bool = True) -> dict:
+    """
+    Score every customer in customermetrics and write the results back
+
+    Args:
+        mongo_uri: MongoDB connection string
+        db_name: Database holding customermetrics / customerprofiles
+        chunk_size: Documents fetched, scored and written per round trip
+        checkpoint_file: Where progress is recorded between chunks
+        resume: Continue from the checkpoint instead of starting over
+
+    Returns:
+        Summary dictionary with counts and elapsed time
+    """
+    if not is_model_loaded():
+        load_model()
+    if not is_model_loaded():
+        raise RuntimeError("Churn model not loaded. Check server logs.")
+
+    checkpoint = load_checkpoint(checkpoint_file) if resume else None
+    after_id = ObjectId(checkpoint["last_id"]) if checkpoint and checkpoint.get("last_id") else None
+    stats = {
+        "processed": checkpoint.get("processed", 0) if checkpoint else 0,
+        "updated": checkpoint.get("updated", 0) if checkpoint else 0,
+        "skipped_missing_profile": checkpoint.get("skipped_missing_profile", 0) if checkpoint else 0,
+    }
+    if after_id is not None:
+        logger.info(f"Resuming churn job after _id {after_id} ({stats['processed']} already processed)")
+
+    client = MongoClient(mongo_uri)
+    db = client[db_name]
+    metrics_collection = db.customermetrics
+    profiles_collection = db.customerprofiles
+
+    started = time.perf_counter()
+    try:
+        for chunk in iter_chunks(metrics_collection, chunk_size, after_id):
+            users = [str(doc.get("user")) for doc in chunk if doc.get("user") is not None]
+            profiles = {
+                str(profile["user"]): profile
+                for profile in profiles_collection.find({"user": {"$in": users}}, PROFILE_PROJECTION)
+            }
+
+            operations, skipped = score_chunk(chunk, profiles)
+            if operations:
+                result = metrics_collection.bulk_write(operations, ordered=False)
+                stats["updated"] += result.modified_count
+            stats["processed"] += len(chunk)
+            stats["skipped_missing_profile"] += skipped
+
+            save_checkpoint(checkpoint_file, {
+                "last_id": str(chunk[-1]["_id"]),
+                "updated_at": datetime.utcnow().isoformat(),
+                **stats
+            })
+            logger.info(f"Churn job: {stats['processed']} processed, {stats['updated']} updated")
+    finally:
+        client.close()
+
+    # Finished cleanly: the next run starts from the beginning
+    if checkpoint_file.exists():
+        checkpoint_file.unlink()
+
+    stats["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+    return stats
+
+
+if __name__ == "__main__":
+    load_dotenv(dotenv_path=SERVICES_DIR / ".env")
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Score all customers for churn and write results to MongoDB")
+    parser.add_argument("--mongo-uri", default=os.getenv("MONGO_URI", "mongodb://localhost:27017/TechHive"))
+    parser.add_argument("--db-name", default="TechHive")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--checkpoint-file", default=str(DEFAULT_CHECKPOINT_FILE))
+    parser.add_argument("--restart", action="store_true", help="Ignore any existing checkpoint")
+    args = parser.parse_args()
+
+    summary = run_churn_scoring_job(
+        args.mongo_uri,
+        db_name=args.db_name,
+        chunk_size=args.chunk_size,
+        checkpoint_file=Path(args.checkpoint_file),
+        resume=not args.restart
+    )
+    print(json.dumps(summary, indent=2))
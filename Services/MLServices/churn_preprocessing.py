@@ -3,18 +3,51 @@ Churn Prediction Data Preprocessing
 Handles data transformation and prediction for the churn prediction model
 """
 
+import os
+import numpy as np
 import pandas as pd
 import joblib
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import Literal
+from typing import Dict, Iterable, List, Literal
 
 logger = logging.getLogger(__name__)
 
 # Global model variable
 model = None
 
+# Expected features (must match training data)
+EXPECTED_FEATURES = [
+    'Tenure', 'WarehouseToHome', 'HourSpendOnApp', 'SatisfactionScore', 
+    'NumberOfAddress', 'OrderAmountHikeFromlastYear', 'CouponUsed', 
+    'OrderCount', 'DaySinceLastOrder', 'CashbackAmount', 
+    'PreferredLoginDevice_Mobile Phone', 'PreferredLoginDevice_Phone', 
+    'CityTier_2', 'CityTier_3', 
+    'PreferredPaymentMode_Credit Card', 'PreferredPaymentMode_Debit Card', 
+    'PreferredPaymentMode_E wallet', 'PreferredPaymentMode_UPI', 
+    'Gender_Male', 
+    'PreferedOrderCat_Grocery', 'PreferedOrderCat_Laptop & Accessory', 
+    'PreferedOrderCat_Mobile Phone', 'PreferedOrderCat_Others', 
+    'MaritalStatus_Married', 'MaritalStatus_Single', 
+    'Complain_1', 
+    'Complain_Str_No Complain' 
+]
+
+# Categorical inputs that were one-hot encoded at training time
+CATEGORICAL_FIELDS = [
+    'PreferredLoginDevice', 'CityTier', 'PreferredPaymentMode', 
+    'Gender', 'PreferedOrderCat', 'MaritalStatus', 'Complain_Str' 
+]
+
+# Numeric feature columns that are fed from a differently named input field
+NUMERIC_FIELD_ALIASES = {
+    'Complain_1': 'Complain_Raw'
+}
+
+# Upper bound on customers accepted by one batch request
+MAX_BATCH_RECORDS = int(os.getenv("CHURN_BATCH_MAX_RECORDS", "50000"))
+
 # Pydantic models for request/response
 class ChurnPredictionInput(BaseModel):
     """Input schema for churn prediction"""
@@ -61,23 +94,23 @@ def load_model():
             model = joblib.load(model_path)
             logger.info(f"Churn model loaded successfully from {model_path}")
             logger.info(f"Model type: {type(model)}")
+            return True
         else:
             logger.error(f"Model file not found: {model_path}")
+            return False
     except Exception as e:
         logger.error(f"Failed to load model: {e}")
         logger.error(f"Error type: {type(e).__name__}")
         import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
+        return False
 
 def is_model_loaded():
     """Check if model is loaded"""
     return model is not None
 
-def preprocess_input(user_data: dict) -> pd.DataFrame:
-    """
-    Preprocess input data for model prediction
-    """
-    # Extract values (handle both single values and arrays from Node.js)
+def _normalize_record(user_data: dict) -> dict:
+    """Unwrap single-item lists from Node.js and resolve field name variations"""
     input_values = {}
     for key, value in user_data.items():
         if isinstance(value, list) and len(value) > 0:
@@ -89,67 +122,123 @@ def preprocess_input(user_data: dict) -> pd.DataFrame:
     if 'PreferedOrderCategory' in input_values and 'PreferedOrderCat' not in input_values:
         input_values['PreferedOrderCat'] = input_values['PreferedOrderCategory']
 
-    # Create DataFrame
-    input_dict = {
-        'Gender': [input_values.get('Gender')],
-        'SatisfactionScore': [input_values.get('SatisfactionScore')],
-        'CityTier': [input_values.get('CityTier')],
-        'MaritalStatus': [input_values.get('MaritalStatus')],
-        'PreferedOrderCat': [input_values.get('PreferedOrderCat')],
-        'Tenure': [input_values.get('Tenure')],
-        'Complain_Raw': [input_values.get('Complain_Raw')],
-        'CashbackAmount': [input_values.get('CashbackAmount')],
-        'OrderAmountHikeFromlastYear': [input_values.get('OrderAmountHikeFromlastYear')], 
-        'CouponUsed': [input_values.get('CouponUsed')], 
-        'OrderCount': [input_values.get('OrderCount')], 
-        'DaySinceLastOrder': [input_values.get('DaySinceLastOrder')], 
-        'WarehouseToHome': [input_values.get('WarehouseToHome')], 	
-        'HourSpendOnApp': [input_values.get('HourSpendOnApp')], 	
-        'NumberOfAddress': [input_values.get('NumberOfAddress')], 
-        'PreferredLoginDevice': [input_values.get('PreferredLoginDevice')], 
-        'PreferredPaymentMode': [input_values.get('PreferredPaymentMode')], 	
-        'Complain_Str': [input_values.get('Complain_Str')], 
-    }
-    
-    input_df = pd.DataFrame(input_dict)
-    
-    # Fix feature name: 'Complain' -> 'Complain_1'
-    input_df['Complain_1'] = input_df['Complain_Raw']
-    input_df = input_df.drop(columns=['Complain_Raw'])
+    return input_values
 
-    # One-hot encoding for categorical features
-    categorical_cols_for_ohe = [
-        'PreferredLoginDevice', 'CityTier', 'PreferredPaymentMode', 
-        'Gender', 'PreferedOrderCat', 'MaritalStatus', 'Complain_Str' 
-    ]
+def _to_float(value) -> float:
+    """Convert a raw numeric input, treating missing values as NaN"""
+    if value is None or value == '':
+        return np.nan
+    return float(value)
+
+class ChurnFeatureEncoder:
+    """
+    Precompiled encoder from raw customer records to the model's feature matrix
     
-    input_df['CityTier'] = input_df['CityTier'].astype(object) 
-    input_df = pd.get_dummies(input_df, columns=categorical_cols_for_ohe, drop_first=False)
-
-    # Expected features (must match training data)
-    expected_features = [
-        'Tenure', 'WarehouseToHome', 'HourSpendOnApp', 'SatisfactionScore', 
-        'NumberOfAddress', 'OrderAmountHikeFromlastYear', 'CouponUsed', 
-        'OrderCount', 'DaySinceLastOrder', 'CashbackAmount', 
-        'PreferredLoginDevice_Mobile Phone', 'PreferredLoginDevice_Phone', 
-        'CityTier_2', 'CityTier_3', 
-        'PreferredPaymentMode_Credit Card', 'PreferredPaymentMode_Debit Card', 
-        'PreferredPaymentMode_E wallet', 'PreferredPaymentMode_UPI', 
-        'Gender_Male', 
-        'PreferedOrderCat_Grocery', 'PreferedOrderCat_Laptop & Accessory', 
-        'PreferedOrderCat_Mobile Phone', 'PreferedOrderCat_Others', 
-        'MaritalStatus_Married', 'MaritalStatus_Single', 
-        'Complain_1', 
-        'Complain_Str_No Complain' 
-    ]
+    Equivalent to building a DataFrame and calling pd.get_dummies, but the
+    category -> column lookups are resolved once from the feature names, so
+    encoding a record is a handful of dict lookups into a preallocated NumPy row.
+    """
+
+    def __init__(self, feature_names: List[str] = EXPECTED_FEATURES):
+        self.feature_names = list(feature_names)
+        self.numeric_columns: List[tuple] = []
+        self.categorical_lookup: Dict[str, Dict[str, int]] = {field: {} for field in CATEGORICAL_FIELDS}
+
+        for index, name in enumerate(self.feature_names):
+            for field in CATEGORICAL_FIELDS:
+                prefix = f"{field}_"
+                if name.startswith(prefix):
+                    # get_dummies names columns after str(value), e.g. CityTier 2 -> 'CityTier_2'
+                    self.categorical_lookup[field][name[len(prefix):]] = index
+                    break
+            else:
+                self.numeric_columns.append((NUMERIC_FIELD_ALIASES.get(name, name), index))
 
-    final_input_df = pd.DataFrame(0, index=[0], columns=expected_features)
+    def encode(self, records: Iterable[dict]) -> np.ndarray:
+        """
+        Encode raw records into a (n_records, n_features) float matrix
+        
+        Args:
+            records: Raw customer dictionaries (API or Node.js format)
+            
+        Returns:
+            NumPy matrix with columns in expected_features order
+        """
+        records = list(records)
+        matrix = np.zeros((len(records), len(self.feature_names)), dtype=np.float64)
+
+        for row, record in enumerate(records):
+            values = _normalize_record(record)
+            for field, column in self.numeric_columns:
+                matrix[row, column] = _to_float(values.get(field))
+            for field, lookup in self.categorical_lookup.items():
+                value = values.get(field)
+                if value is None:
+                    continue
+                column = lookup.get(str(value))
+                if column is not None:
+                    matrix[row, column] = 1.0
+
+        return matrix
+
+# Shared encoder instance
+feature_encoder = ChurnFeatureEncoder()
+
+def get_risk_tier(risk_percentage: float) -> str:
+    """Map a churn percentage to its risk tier"""
+    if risk_percentage >= 65:
+        return 'High'
+    elif risk_percentage >= 30:
+        return 'Medium'
+    return 'Low'
+
+def _model_input(matrix: np.ndarray):
+    """Wrap the matrix in a DataFrame only when the model was fitted with feature names"""
+    if hasattr(model, 'feature_names_in_'):
+        return pd.DataFrame(matrix, columns=feature_encoder.feature_names)
+    return matrix
+
+def score_matrix(matrix: np.ndarray) -> np.ndarray:
+    """
+    Score an encoded feature matrix with a single predict_proba call
     
-    for col in final_input_df.columns:
-        if col in input_df.columns:
-            final_input_df[col] = input_df[col].iloc[0]
+    Returns:
+        Churn percentages (0-100, rounded to 2 decimals), one per row
+    """
+    if model is None:
+        raise Exception("Model not loaded. Check server logs.")
+    
+    prediction_proba = model.predict_proba(_model_input(matrix))[:, 1]
+    return np.round(prediction_proba * 100, 2)
+
+def preprocess_input(user_data: dict) -> pd.DataFrame:
+    """
+    Preprocess input data for model prediction
+    """
+    matrix = feature_encoder.encode([user_data])
+    return pd.DataFrame(matrix, columns=feature_encoder.feature_names)
 
-    return final_input_df[expected_features]
+def predict_churn_batch(records: List[dict]) -> List[dict]:
+    """
+    Predict churn for many customers in one predict_proba call
+    
+    Args:
+        records: Raw customer dictionaries
+        
+    Returns:
+        List of {'churn_probability', 'risk_tier'} dictionaries in input order
+    """
+    if not records:
+        return []
+    
+    risk_percentages = score_matrix(feature_encoder.encode(records))
+    return [
+        {
+            'churn_probability': float(risk_percentage),
+            'risk_tier': get_risk_tier(risk_percentage)
+        }
+        for risk_percentage in risk_percentages
+    ]
 
 def predict_churn_from_pydantic(data: ChurnPredictionInput):
     """
@@ -162,25 +251,8 @@ def predict_churn_from_pydantic(data: ChurnPredictionInput):
         # Convert Pydantic model to dict
         input_data = data.dict(by_alias=True)
         
-        # Preprocess the data
-        input_df = preprocess_input(input_data)
-        
-        # Make prediction
-        prediction_proba = model.predict_proba(input_df)[:, 1][0]
-        risk_percentage = float(round(prediction_proba * 100, 2))
-        
-        # Determine risk tier
-        if risk_percentage >= 65:
-            risk_tier = 'High'
-        elif risk_percentage >= 30:
-            risk_tier = 'Medium'
-        else:
-            risk_tier = 'Low'
-        
-        return ChurnPredictionOutput(
-            churn_probability=risk_percentage,
-            risk_tier=risk_tier
-        )
+        result = predict_churn_batch([input_data])[0]
+        return ChurnPredictionOutput(**result)
         
     except Exception as e:
         logger.error(f"Prediction failed: {e}")
@@ -194,33 +266,90 @@ def predict_churn_from_dict(request_data: dict):
         raise Exception("Model not loaded. Check server logs.")
     
     try:
-        # Handle field name conversion for Node.js compatibility
-        if 'PreferedOrderCategory' in request_data:
-            request_data['PreferedOrderCat'] = request_data['PreferedOrderCategory']
-        
-        # Preprocess the data
-        input_df = preprocess_input(request_data)
-        
-        # Make prediction
-        prediction_proba = model.predict_proba(input_df)[:, 1][0]
-        risk_percentage = float(round(prediction_proba * 100, 2))
-        
-        # Determine risk tier
-        if risk_percentage >= 65:
-            risk_tier = 'High'
-        elif risk_percentage >= 30:
-            risk_tier = 'Medium'
-        else:
-            risk_tier = 'Low'
-        
-        return {
-            'churn_probability': risk_percentage,
-            'risk_tier': risk_tier
-        }
+        return predict_churn_batch([request_data])[0]
         
     except Exception as e:
         logger.error(f"Prediction failed: {e}")
         raise Exception("Prediction failed due to internal processing error")
 
-# Load model when module is imported
-load_model()
\ No newline at end of file
+# Representative customer used to warm up the model after loading
+WARMUP_RECORD = {
+    'Gender': 'Male', 'SatisfactionScore': 3, 'CityTier': 2, 'MaritalStatus': 'Single',
+    'PreferedOrderCat': 'Laptop & Accessory', 'Tenure': 10, 'Complain_Raw': 0,
+    'CashbackAmount': 150.0, 'OrderAmountHikeFromlastYear': 15.0, 'CouponUsed': 1,
+    'OrderCount': 2, 'DaySinceLastOrder': 5, 'WarehouseToHome': 12.0, 'HourSpendOnApp': 2,
+    'NumberOfAddress': 2, 'PreferredLoginDevice': 'Mobile Phone',
+    'PreferredPaymentMode': 'Credit Card', 'Complain_Str': 'No Complain'
+}
+
+def warm_up():
+    """Run one prediction so the first real request doesn't pay first-call overhead"""
+    predict_churn_batch([WARMUP_RECORD])
+
+# Records for the encoder parity check: unseen and missing categories, numeric
+# aliases, Node.js list values and missing numbers on top of WARMUP_RECORD
+PARITY_RECORDS = [
+    WARMUP_RECORD,
+    {**WARMUP_RECORD, 'Gender': 'Female', 'CityTier': 1, 'PreferredLoginDevice': 'Computer',
+     'PreferredPaymentMode': 'Cash on Delivery', 'PreferedOrderCat': 'Fashion', 'MaritalStatus': 'Divorced',
+     'Complain_Str': 'Complain', 'Complain_Raw': 1},
+    {key: value for key, value in WARMUP_RECORD.items() if key not in ('MaritalStatus', 'PreferedOrderCat', 'Gender')},
+    {**{key: value for key, value in WARMUP_RECORD.items() if key != 'PreferedOrderCat'},
+     'PreferedOrderCategory': 'Mobile Phone', 'CityTier': '3'},
+    {key: [value] for key, value in WARMUP_RECORD.items()},
+    {**WARMUP_RECORD, 'Tenure': None, 'CashbackAmount': '', 'CityTier': 2.0, 'PreferredPaymentMode': 'UPI'},
+]
+
+def _get_dummies_features(user_data: dict) -> pd.DataFrame:
+    """The DataFrame + pd.get_dummies encoding ChurnFeatureEncoder replaced, kept as the parity reference"""
+    input_values = _normalize_record(user_data)
+    input_fields = [
+        'Gender', 'SatisfactionScore', 'CityTier', 'MaritalStatus', 'PreferedOrderCat', 'Tenure',
+        'Complain_Raw', 'CashbackAmount', 'OrderAmountHikeFromlastYear', 'CouponUsed', 'OrderCount',
+        'DaySinceLastOrder', 'WarehouseToHome', 'HourSpendOnApp', 'NumberOfAddress',
+        'PreferredLoginDevice', 'PreferredPaymentMode', 'Complain_Str'
+    ]
+    input_df = pd.DataFrame({field: [input_values.get(field)] for field in input_fields})
+    
+    input_df['Complain_1'] = input_df['Complain_Raw']
+    input_df = input_df.drop(columns=['Complain_Raw'])
+    input_df['CityTier'] = input_df['CityTier'].astype(object)
+    input_df = pd.get_dummies(input_df, columns=CATEGORICAL_FIELDS, drop_first=False)
+    
+    final_input_df = pd.DataFrame(0, index=[0], columns=EXPECTED_FEATURES)
+    for col in final_input_df.columns:
+        if col in input_df.columns:
+            final_input_df[col] = input_df[col].iloc[0]
+    return final_input_df[EXPECTED_FEATURES]
+
+def check_encoder_parity(records: List[dict] = None) -> List[str]:
+    """
+    Compare ChurnFeatureEncoder with the pd.get_dummies pipeline it replaced
+    
+    Args:
+        records: Raw customer records (defaults to PARITY_RECORDS)
+        
+    Returns:
+        One message per record whose encoded row differs (empty when they all match)
+    """
+    records = PARITY_RECORDS if records is None else records
+    encoder = ChurnFeatureEncoder()
+    mismatches = []
+    for index, record in enumerate(records):
+        expected = pd.to_numeric(_get_dummies_features(record).iloc[0], errors='coerce').to_numpy(dtype=np.float64)
+        actual = encoder.encode([record])[0]
+        if not np.array_equal(expected, actual, equal_nan=True):
+            columns = [name for name, a, b in zip(encoder.feature_names, expected, actual)
+                       if not (a == b or (np.isnan(a) and np.isnan(b)))]
+            mismatches.append(f"record {index}: columns {columns} differ")
+    return mismatches
+
+# Note: the model is loaded in the background by the gateway's startup orchestrator
+# (see app.py); call load_model() directly when using this module standalone.
+
+if __name__ == "__main__":
+    problems = check_encoder_parity()
+    for problem in problems:
+        print(problem)
+    print(f"Encoder parity: {len(PARITY_RECORDS) - len(problems)}/{len(PARITY_RECORDS)} records match get_dummies")
+    raise SystemExit(1 if problems else 0)
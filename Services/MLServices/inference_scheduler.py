@@ -0,0 +1,154 @@
+"""
+Micro-batching Inference Scheduler
+Collects concurrent prediction requests into dynamic micro-batches and runs them on a dedicated worker thread
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sentinel used to wake the worker thread on shutdown
+_STOP = object()
+
+
+class _PendingRequest:
+    """A single queued request waiting for its batch to run"""
+    __slots__ = ("item", "future", "loop")
+
+    def __init__(self, item: Any, future: asyncio.Future, loop: asyncio.AbstractEventLoop):
+        self.item = item
+        self.future = future
+        self.loop = loop
+
+
+def _resolve(future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None):
+    """Set a future's outcome unless the caller already gave up on it"""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class MicroBatchScheduler:
+    """
+    Gathers concurrent requests into micro-batches
+
+    A batch is dispatched when it reaches ``max_batch_size`` items or when the
+    oldest queued request has waited ``max_wait_ms`` milliseconds, whichever
+    comes first. ``batch_fn`` receives a list of items and must return a list of
+    results in the same order. It runs on a dedicated worker thread so the
+    event loop stays free while the model is busy.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], max_batch_size: int = 32,
+                 max_wait_ms: float = 10.0, name: str = "inference"):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self.name = name
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # Simple counters for the health endpoint
+        self.batches_run = 0
+        self.items_processed = 0
+
+    def start(self):
+        """Start the worker thread (idempotent)"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self._run, name=f"{self.name}-batcher", daemon=True
+            )
+            self._worker.start()
+            logger.info(
+                f"{self.name} scheduler started (max_batch_size={self.max_batch_size}, "
+                f"max_wait_ms={self.max_wait_ms})"
+            )
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the worker thread after it drains the current batch"""
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None and worker.is_alive():
+            self._queue.put(_STOP)
+            worker.join(timeout)
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result"""
+        self.start()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put(_PendingRequest(item, future, loop))
+        return await future
+
+    def stats(self) -> dict:
+        """Return batching statistics"""
+        avg = self.items_processed / self.batches_run if self.batches_run else 0.0
+        return {
+            "running": self._worker is not None and self._worker.is_alive(),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "queued": self._queue.qsize(),
+            "batches_run": self.batches_run,
+            "items_processed": self.items_processed,
+            "avg_batch_size": round(avg, 2),
+        }
+
+    def _collect_batch(self, first: _PendingRequest) -> Tuple[List[_PendingRequest], bool]:
+        """Collect more requests until the batch is full or the wait budget runs out"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    pending = self._queue.get_nowait()
+                else:
+                    pending = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if pending is _STOP:
+                return batch, True
+            batch.append(pending)
+        return batch, False
+
+    def _run(self):
+        """Worker loop: block for the first request, then fill and run a batch"""
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            batch, stopping = self._collect_batch(first)
+            try:
+                results = self.batch_fn([pending.item for pending in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"{self.name} batch function returned {len(results)} results for {len(batch)} inputs"
+                    )
+                for pending, result in zip(batch, results):
+                    pending.loop.call_soon_threadsafe(_resolve, pending.future, result, None)
+            except Exception as e:
+                logger.error(f"{self.name} batch of {len(batch)} failed: {e}")
+                for pending in batch:
+                    pending.loop.call_soon_threadsafe(_resolve, pending.future, None, e)
+
+            self.batches_run += 1
+            self.items_processed += len(batch)
+
+            if stopping:
+                return
@@ -3,27 +3,39 @@ FastAPI Router for ML Services
 Simple routing layer - all logic is in preprocessing modules
 """
 
+import json
+from typing import List, Union
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from .churn_preprocessing import (
     ChurnPredictionInput, 
     ChurnPredictionOutput, 
     predict_churn_from_pydantic, 
     predict_churn_from_dict, 
+    predict_churn_batch,
+    MAX_BATCH_RECORDS as MAX_CHURN_BATCH_RECORDS,
     is_model_loaded as is_churn_model_loaded
 )
 from .sentiment_preprocessing import (
     SentimentAnalysisInput,
     SentimentAnalysisOutput,
-    predict_sentiment_from_pydantic,
-    predict_sentiment_from_dict,
+    predict_sentiment_from_pydantic_async,
+    predict_sentiment_from_dict_async,
+    sentiment_scheduler,
+    SentimentBatchInput,
+    MAX_BATCH_TEXTS,
+    iter_sentiment_bulk,
     is_model_loaded as is_sentiment_model_loaded,
-    load_model as load_sentiment_model
+    get_backend_name as get_sentiment_backend_name
 )
 
 # Create router for ML endpoints
 router = APIRouter(tags=["Machine Learning"])
 
-# Note: Sentiment model is loaded in sentiment_preprocessing.py on module import
+# Note: Models are loaded in the background by the startup orchestrator (see app.py);
+# endpoints return 503 until their model is ready
+# Sentiment requests go through a micro-batching scheduler (see inference_scheduler.py)
 
 @router.post("/predict")
 async def predict_legacy(request_data: dict):
@@ -36,6 +48,25 @@ async def predict_legacy(request_data: dict):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/predict/batch")
+async def predict_churn_batch_endpoint(request_data: Union[List[dict], dict]):
+    """Score many customers in one call; accepts a list or {"customers": [...]}"""
+    if not is_churn_model_loaded():
+        raise HTTPException(status_code=503, detail="Churn model not loaded. Check server logs.")
+    
+    customers = request_data.get("customers") if isinstance(request_data, dict) else request_data
+    if not isinstance(customers, list) or not customers:
+        raise HTTPException(status_code=400, detail="Provide a non-empty list of customers")
+    
+    if len(customers) > MAX_CHURN_BATCH_RECORDS:
+        raise HTTPException(status_code=400, detail=f"Too many customers: maximum is {MAX_CHURN_BATCH_RECORDS} per request")
+    
+    try:
+        predictions = await run_in_threadpool(predict_churn_batch, customers)
+        return {"count": len(predictions), "predictions": predictions}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/sentiment", response_model=SentimentAnalysisOutput)
 async def analyze_sentiment(input_data: SentimentAnalysisInput):
     """Analyze sentiment of text using DistilBERT model"""
@@ -43,7 +74,7 @@ async def analyze_sentiment(input_data: SentimentAnalysisInput):
         raise HTTPException(status_code=503, detail="Sentiment model not loaded. Check server logs.")
     
     try:
-        return predict_sentiment_from_pydantic(input_data)
+        return await predict_sentiment_from_pydantic_async(input_data)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -54,7 +85,35 @@ async def predict_sentiment_legacy(request_data: dict):
         raise HTTPException(status_code=503, detail="Sentiment model not loaded. Check server logs.")
     
     try:
-        return predict_sentiment_from_dict(request_data)
+        return await predict_sentiment_from_dict_async(request_data)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/sentiment/batch")
+async def analyze_sentiment_batch(input_data: SentimentBatchInput):
+    """Analyze sentiment for many texts in one call (results keep the input order)"""
+    if not is_sentiment_model_loaded():
+        raise HTTPException(status_code=503, detail="Sentiment model not loaded. Check server logs.")
+    
+    if len(input_data.texts) > MAX_BATCH_TEXTS:
+        raise HTTPException(status_code=400, detail=f"Too many texts: maximum is {MAX_BATCH_TEXTS} per request")
+    
+    texts = [text.strip() for text in input_data.texts]
+    empty = [i for i, text in enumerate(texts) if not text]
+    if empty:
+        raise HTTPException(status_code=400, detail=f"Texts cannot be empty (indexes: {empty[:10]})")
+    
+    if input_data.stream:
+        def ndjson_lines():
+            for index, result in enumerate(iter_sentiment_bulk(texts)):
+                yield json.dumps({"index": index, **result}) + "\n"
+        
+        # Starlette iterates sync generators in a worker thread
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+    
+    try:
+        results = await run_in_threadpool(lambda: list(iter_sentiment_bulk(texts)))
+        return {"count": len(results), "results": results}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -64,5 +123,7 @@ async def health_check():
     return {
         "status": "healthy",
         "churn_model_loaded": is_churn_model_loaded(),
-        "sentiment_model_loaded": is_sentiment_model_loaded()
+        "sentiment_model_loaded": is_sentiment_model_loaded(),
+        "sentiment_backend": get_sentiment_backend_name(),
+        "sentiment_batching": sentiment_scheduler.stats()
     }
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""
+Sentiment Inference Backends
+Pluggable CPU/GPU backends for the DistilBERT sentiment model, plus a parity and latency check
+
+Backends:
+    torch       - fp32 PyTorch (the original path, uses CUDA when available)
+    torch_int8  - PyTorch with int8 dynamic quantization of the Linear layers (CPU)
+    onnx        - ONNX Runtime session, exported from the PyTorch model on first use
+
+Every backend takes NumPy ``input_ids`` / ``attention_mask`` arrays produced by the
+fast (Rust) tokenizer and returns a NumPy array of class probabilities.
+
+Usage (parity + latency report):
+    python -m MLServices.sentiment_backends
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+from transformers import DistilBertForSequenceClassification, DistilBertTokenizerFast
+
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+    logging.warning("onnxruntime not available, the 'onnx' sentiment backend is disabled")
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = Path(__file__).parent
+# Generated on first use of the onnx backend; kept out of git (see .gitignore)
+ONNX_MODEL_PATH = Path(os.getenv("SENTIMENT_ONNX_PATH", str(MODEL_DIR / "sentiment_model.onnx")))
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    """Numerically stable softmax over the last axis"""
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def load_fast_tokenizer(model_dir: Path = MODEL_DIR) -> DistilBertTokenizerFast:
+    """Load the Rust tokenizer from tokenizer.json"""
+    return DistilBertTokenizerFast.from_pretrained(str(model_dir))
+
+
+class TorchBackend:
+    """fp32 PyTorch inference"""
+    name = "torch"
+
+    def __init__(self, model_dir: Path = MODEL_DIR):
+        self.model = DistilBertForSequenceClassification.from_pretrained(str(model_dir))
+        self.model.eval()
+        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        self.model.to(self.device)
+
+    def predict_proba(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        with torch.no_grad():
+            outputs = self.model(
+                input_ids=torch.from_numpy(input_ids).to(self.device),
+                attention_mask=torch.from_numpy(attention_mask).to(self.device)
+            )
+            return torch.softmax(outputs.logits, dim=-1).cpu().numpy()
+
+
+class QuantizedTorchBackend(TorchBackend):
+    """PyTorch with int8 dynamic quantization (CPU only)"""
+    name = "torch_int8"
+
+    def __init__(self, model_dir: Path = MODEL_DIR):
+        model = DistilBertForSequenceClassification.from_pretrained(str(model_dir))
+        model.eval()
+        self.model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.device = torch.device('cpu')
+
+
+class OnnxBackend:
+    """ONNX Runtime inference, exporting the model to ONNX if needed"""
+    name = "onnx"
+
+    def __init__(self, model_dir: Path = MODEL_DIR, onnx_path: Path = ONNX_MODEL_PATH):
+        if not ONNX_AVAILABLE:
+            raise RuntimeError("onnxruntime is not installed")
+
+        weights_path = model_dir / 'model.safetensors'
+        if not onnx_path.exists() or (
+            weights_path.exists() and weights_path.stat().st_mtime > onnx_path.stat().st_mtime
+        ):
+            export_onnx(model_dir, onnx_path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        intra_threads = int(os.getenv("SENTIMENT_ONNX_THREADS", "0"))
+        if intra_threads > 0:
+            options.intra_op_num_threads = intra_threads
+        self.session = ort.InferenceSession(
+            str(onnx_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+
+    def predict_proba(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        logits = self.session.run(
+            ["logits"],
+            {"input_ids": input_ids.astype(np.int64), "attention_mask": attention_mask.astype(np.int64)}
+        )[0]
+        return _softmax(logits)
+
+
+def export_onnx(model_dir: Path = MODEL_DIR, onnx_path: Path = ONNX_MODEL_PATH):
+    """Export the PyTorch model to ONNX with dynamic batch and sequence axes"""
+    logger.info(f"Exporting sentiment model to ONNX: {onnx_path}")
+    onnx_path.parent.mkdir(parents=True, exist_ok=True)
+    model = DistilBertForSequenceClassification.from_pretrained(str(model_dir))
+    model.eval()
+    model.config.return_dict = False
+
+    dummy_ids = torch.ones((1, 8), dtype=torch.long)
+    dummy_mask = torch.ones((1, 8), dtype=torch.long)
+    torch.onnx.export(
+        model,
+        (dummy_ids, dummy_mask),
+        str(onnx_path),
+        input_names=["input_ids", "attention_mask"],
+        output_names=["logits"],
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "logits": {0: "batch"}
+        },
+        opset_version=14
+    )
+    logger.info("ONNX export complete")
+
+
+BACKENDS = {
+    TorchBackend.name: TorchBackend,
+    QuantizedTorchBackend.name: QuantizedTorchBackend,
+    OnnxBackend.name: OnnxBackend,
+}
+
+
+def create_backend(name: str, model_dir: Path = MODEL_DIR):
+    """Instantiate a backend by name"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown sentiment backend '{name}'. Choose one of: {', '.join(BACKENDS)}")
+    return BACKENDS[name](model_dir)
+
+
+# Sample texts for the parity check when none are supplied
+SAMPLE_TEXTS = [
+    "The laptop arrived quickly and works perfectly, really happy with it.",
+    "Terrible experience, the GPU was dead on arrival and support never replied.",
+    "It's okay. Does what it says, nothing special.",
+    "Battery life is shorter than advertised but the screen is gorgeous.",
+    "Worst purchase I've made this year.",
+    "Packaging was fine.",
+    "Absolutely love this keyboard, the switches feel amazing!",
+    "The order took two weeks to arrive and the box was damaged.",
+]
+
+
+def compare_backends(texts: Optional[List[str]] = None, backend_names: Optional[List[str]] = None,
+                     batch_size: int = 32, repeats: int = 3) -> Dict[str, dict]:
+    """
+    Compare backends against the fp32 torch reference
+
+    Args:
+        texts: Texts to score (defaults to SAMPLE_TEXTS)
+        backend_names: Backends to compare (defaults to every available backend)
+        batch_size: Texts per forward pass
+        repeats: Timed passes per backend (the best run is reported)
+
+    Returns:
+        Dictionary keyed by backend name with label agreement, max probability
+        difference and latency figures
+    """
+    texts = texts or SAMPLE_TEXTS
+    if backend_names is None:
+        backend_names = [name for name in BACKENDS if name != "onnx" or ONNX_AVAILABLE]
+
+    tokenizer = load_fast_tokenizer()
+    batches = []
+    for start in range(0, len(texts), batch_size):
+        encoded = tokenizer(texts[start:start + batch_size], truncation=True, padding=True,
+                            max_length=512, return_tensors="np")
+        batches.append((encoded["input_ids"], encoded["attention_mask"]))
+
+    def run(backend) -> np.ndarray:
+        return np.concatenate([backend.predict_proba(ids, mask) for ids, mask in batches])
+
+    reference = run(TorchBackend())
+    reference_labels = reference.argmax(axis=-1)
+
+    report = {}
+    for name in backend_names:
+        try:
+            backend = create_backend(name)
+            probs = run(backend)  # warm-up pass, also used for parity
+            timings = []
+            for _ in range(max(1, repeats)):
+                started = time.perf_counter()
+                run(backend)
+                timings.append(time.perf_counter() - started)
+            best = min(timings)
+            report[name] = {
+                "label_agreement": round(float((probs.argmax(axis=-1) == reference_labels).mean()), 4),
+                "max_probability_diff": round(float(np.abs(probs - reference).max()), 6),
+                "total_ms": round(best * 1000, 2),
+                "ms_per_text": round(best * 1000 / len(texts), 3),
+            }
+        except Exception as e:
+            report[name] = {"error": str(e)}
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Compare sentiment backends for parity and latency")
+    parser.add_argument("--texts-file", help="File with one text per line (defaults to built-in samples)")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    sample = None
+    if args.texts_file:
+        with open(args.texts_file, 'r', encoding='utf-8') as f:
+            sample = [line.strip() for line in f if line.strip()]
+
+    print(json.dumps(compare_backends(sample, batch_size=args.batch_size, repeats=args.repeats), indent=2))
@@ -6,16 +6,24 @@ Handles loading the DistilBERT model and performing sentiment analysis on text
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import Literal, Optional
-import torch
-from transformers import DistilBertForSequenceClassification, DistilBertTokenizer
+from typing import Iterator, List, Literal, Optional
+import numpy as np
 import os
+import threading
+from .inference_scheduler import MicroBatchScheduler
+from .sentiment_backends import create_backend, load_fast_tokenizer
 
 logger = logging.getLogger(__name__)
 
-# Global model and tokenizer variables
-model = None
+# Global backend and tokenizer variables
+backend = None
 tokenizer = None
+# The Rust tokenizer keeps its padding/truncation settings on the shared object and
+# each call resets them, so the scheduler thread and /sentiment/batch threads take turns
+_tokenizer_lock = threading.Lock()
+
+# Inference backend: torch, torch_int8 or onnx (see sentiment_backends.py)
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "torch")
 
 # Label mapping (based on config.json - 3 labels: Negative, Neutral, Positive)
 LABEL_MAPPING = {
@@ -35,9 +43,18 @@ class SentimentAnalysisOutput(BaseModel):
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score for the prediction")
     probabilities: dict = Field(..., description="Probability scores for each sentiment class")
 
-def load_model():
-    """Load the DistilBERT sentiment analysis model and tokenizer"""
-    global model, tokenizer
+class SentimentBatchInput(BaseModel):
+    """Input schema for bulk sentiment analysis"""
+    texts: List[str] = Field(..., min_length=1, description="Texts to analyze for sentiment")
+    stream: bool = Field(False, description="Stream results back as NDJSON instead of a single JSON body")
+
+# Upper bound on texts accepted by one bulk request
+MAX_BATCH_TEXTS = int(os.getenv("SENTIMENT_BATCH_MAX_TEXTS", "10000"))
+
+def load_model(backend_name: Optional[str] = None):
+    """Load the DistilBERT sentiment analysis backend and fast tokenizer"""
+    global backend, tokenizer
+    backend_name = backend_name or SENTIMENT_BACKEND
     try:
         # Get the directory where this file is located
         current_dir = Path(__file__).parent
@@ -58,21 +75,19 @@ def load_model():
             logger.error(f"Config file not found: {config_path}")
             return False
         
-        logger.info("Loading DistilBERT model and tokenizer...")
+        if not tokenizer_path.exists():
+            logger.error(f"Tokenizer file not found: {tokenizer_path}")
+            return False
+        
+        logger.info(f"Loading DistilBERT model ({backend_name} backend) and tokenizer...")
         
-        # Load tokenizer
-        tokenizer = DistilBertTokenizer.from_pretrained(str(model_dir))
+        # Load the Rust tokenizer from tokenizer.json
+        tokenizer = load_fast_tokenizer(model_dir)
         logger.info("Tokenizer loaded successfully")
         
         # Load model
-        model = DistilBertForSequenceClassification.from_pretrained(str(model_dir))
-        model.eval()  # Set to evaluation mode
-        logger.info(f"Sentiment model loaded successfully from {model_dir}")
-        
-        # Check if CUDA is available, otherwise use CPU
-        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        model.to(device)
-        logger.info(f"Model loaded on device: {device}")
+        backend = create_backend(backend_name, model_dir)
+        logger.info(f"Sentiment model loaded successfully from {model_dir} using the {backend_name} backend")
         
         return True
         
@@ -85,59 +100,67 @@ def load_model():
 
 def is_model_loaded():
     """Check if model and tokenizer are loaded"""
-    return model is not None and tokenizer is not None
+    return backend is not None and tokenizer is not None
 
-def predict_sentiment(text: str) -> dict:
+def get_backend_name() -> Optional[str]:
+    """Name of the active inference backend, or None if not loaded"""
+    return backend.name if backend is not None else None
+
+def _forward(inputs) -> np.ndarray:
+    """Run the backend on tokenized inputs and return class probabilities"""
+    return backend.predict_proba(
+        np.asarray(inputs["input_ids"], dtype=np.int64),
+        np.asarray(inputs["attention_mask"], dtype=np.int64)
+    )
+
+def _format_prediction(probabilities) -> dict:
+    """Convert one row of class probabilities into the API response shape"""
+    # Get predicted class and confidence
+    predicted_class = int(np.argmax(probabilities))
+    confidence = float(probabilities[predicted_class])
+    
+    # Map class to sentiment label
+    sentiment = LABEL_MAPPING.get(predicted_class, "Neutral")
+    
+    # Get probabilities for all classes
+    prob_dict = {
+        LABEL_MAPPING[i]: float(probabilities[i])
+        for i in range(len(LABEL_MAPPING))
+    }
+    
+    return {
+        "sentiment": sentiment,
+        "confidence": round(confidence, 4),
+        "probabilities": prob_dict
+    }
+
+def predict_sentiment_batch(texts: List[str]) -> List[dict]:
     """
-    Predict sentiment for a given text
+    Predict sentiment for several texts in a single forward pass
     
     Args:
-        text: The text to analyze
+        texts: The texts to analyze
         
     Returns:
-        Dictionary with sentiment, confidence, and probabilities
+        List of result dictionaries, in the same order as the input texts
     """
     if not is_model_loaded():
         raise ValueError("Model not loaded. Please ensure the model is initialized.")
     
+    if not texts:
+        return []
+    
     try:
-        # Tokenize the input text
-        inputs = tokenizer(
-            text,
-            truncation=True,
-            padding=True,
-            max_length=512,
-            return_tensors="pt"
-        )
-        
-        # Move inputs to the same device as model
-        device = next(model.parameters()).device
-        inputs = {k: v.to(device) for k, v in inputs.items()}
-        
-        # Make prediction
-        with torch.no_grad():
-            outputs = model(**inputs)
-            logits = outputs.logits
-            probabilities = torch.softmax(logits, dim=-1)[0]
-        
-        # Get predicted class and confidence
-        predicted_class = torch.argmax(probabilities).item()
-        confidence = probabilities[predicted_class].item()
-        
-        # Map class to sentiment label
-        sentiment = LABEL_MAPPING.get(predicted_class, "Neutral")
-        
-        # Get probabilities for all classes
-        prob_dict = {
-            LABEL_MAPPING[i]: probabilities[i].item() 
-            for i in range(len(LABEL_MAPPING))
-        }
-        
-        return {
-            "sentiment": sentiment,
-            "confidence": round(confidence, 4),
-            "probabilities": prob_dict
-        }
+        # Tokenize the batch, padding to the longest text in it
+        with _tokenizer_lock:
+            inputs = tokenizer(
+                list(texts),
+                truncation=True,
+                padding=True,
+                max_length=512,
+                return_tensors="np"
+            )
+        return [_format_prediction(row) for row in _forward(inputs)]
         
     except Exception as e:
         logger.error(f"Error during sentiment prediction: {e}")
@@ -145,6 +168,89 @@ def predict_sentiment(text: str) -> dict:
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise
 
+def iter_sentiment_bulk(texts: List[str], chunk_size: int = 1024, bucket_size: int = 32) -> Iterator[dict]:
+    """
+    Predict sentiment for a large list of texts, yielding results in input order
+    
+    Texts are processed in chunks of ``chunk_size``. Inside a chunk they are
+    tokenized once without padding, sorted by token length and split into
+    buckets of ``bucket_size``, so each bucket is only padded to its own longest
+    text. Results are yielded chunk by chunk, which keeps memory bounded for
+    very large jobs.
+    
+    Args:
+        texts: The texts to analyze
+        chunk_size: Number of texts held in memory at once
+        bucket_size: Number of texts per forward pass
+        
+    Returns:
+        Iterator of result dictionaries, in the same order as the input texts
+    """
+    if not is_model_loaded():
+        raise ValueError("Model not loaded. Please ensure the model is initialized.")
+    
+    for start in range(0, len(texts), chunk_size):
+        chunk = list(texts[start:start + chunk_size])
+        with _tokenizer_lock:
+            encoded = tokenizer(chunk, truncation=True, max_length=512)
+        input_ids = encoded["input_ids"]
+        attention_mask = encoded["attention_mask"]
+        
+        # Group texts of similar length so padding stays small
+        order = sorted(range(len(chunk)), key=lambda i: len(input_ids[i]))
+        results = [None] * len(chunk)
+        
+        for b in range(0, len(order), bucket_size):
+            bucket = order[b:b + bucket_size]
+            with _tokenizer_lock:
+                inputs = tokenizer.pad(
+                    {
+                        "input_ids": [input_ids[i] for i in bucket],
+                        "attention_mask": [attention_mask[i] for i in bucket]
+                    },
+                    return_tensors="np"
+                )
+            for i, row in zip(bucket, _forward(inputs)):
+                results[i] = _format_prediction(row)
+        
+        yield from results
+
+def predict_sentiment(text: str) -> dict:
+    """
+    Predict sentiment for a given text
+    
+    Args:
+        text: The text to analyze
+        
+    Returns:
+        Dictionary with sentiment, confidence, and probabilities
+    """
+    return predict_sentiment_batch([text])[0]
+
+# Micro-batching scheduler shared by the API endpoints. Concurrent requests are
+# grouped into one forward pass instead of running one model call per request.
+sentiment_scheduler = MicroBatchScheduler(
+    predict_sentiment_batch,
+    max_batch_size=int(os.getenv("SENTIMENT_MAX_BATCH_SIZE", "32")),
+    max_wait_ms=float(os.getenv("SENTIMENT_MAX_WAIT_MS", "10")),
+    name="sentiment"
+)
+
+async def predict_sentiment_async(text: str) -> dict:
+    """
+    Predict sentiment through the micro-batching scheduler
+    
+    Args:
+        text: The text to analyze
+        
+    Returns:
+        Dictionary with sentiment, confidence, and probabilities
+    """
+    if not is_model_loaded():
+        raise ValueError("Model not loaded. Please ensure the model is initialized.")
+    
+    return await sentiment_scheduler.submit(text)
+
 def predict_sentiment_from_dict(request_data: dict) -> dict:
     """
     Predict sentiment from a dictionary input (for API compatibility)
@@ -174,6 +280,42 @@ def predict_sentiment_from_pydantic(input_data: SentimentAnalysisInput) -> Senti
     result = predict_sentiment(input_data.text)
     return SentimentAnalysisOutput(**result)
 
-# Load model when module is imported (similar to churn_preprocessing.py)
-load_model()
+async def predict_sentiment_from_dict_async(request_data: dict) -> dict:
+    """
+    Batched variant of predict_sentiment_from_dict used by the API endpoints
+    
+    Args:
+        request_data: Dictionary containing 'text' key
+        
+    Returns:
+        Dictionary with sentiment analysis results
+    """
+    text = request_data.get('text', '')
+    if not text or not text.strip():
+        raise ValueError("Text field is required and cannot be empty")
+    
+    return await predict_sentiment_async(text.strip())
+
+async def predict_sentiment_from_pydantic_async(input_data: SentimentAnalysisInput) -> SentimentAnalysisOutput:
+    """
+    Batched variant of predict_sentiment_from_pydantic used by the API endpoints
+    
+    Args:
+        input_data: SentimentAnalysisInput Pydantic model
+        
+    Returns:
+        SentimentAnalysisOutput Pydantic model
+    """
+    result = await predict_sentiment_async(input_data.text)
+    return SentimentAnalysisOutput(**result)
+
+# Text used to warm up the backend after loading (configurable via SENTIMENT_WARMUP_TEXT)
+WARMUP_TEXT = os.getenv("SENTIMENT_WARMUP_TEXT", "The product arrived on time and works as expected.")
+
+def warm_up():
+    """Run a short batch through the model so the first real request isn't the cold one"""
+    predict_sentiment_batch([WARMUP_TEXT, WARMUP_TEXT[:16]])
+
+# Note: the model is loaded in the background by the gateway's startup orchestrator
+# (see app.py); call load_model() directly when using this module standalone.
 
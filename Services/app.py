@@ -5,6 +5,7 @@ TechHive AI Services Gateway - Microservices Architecture
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 import uvicorn
 import logging
 import os
@@ -13,6 +14,11 @@ import os
 from MLServices.router import router as ml_router
 from ChatbotServices.router import router as chatbot_router
 from MailServices.router import router as mail_router
+from MLServices import churn_preprocessing, sentiment_preprocessing
+from ChatbotServices.ai_agent import get_agent, peek_agent, warm_up_agent
+from ChatbotServices.rag_knowledge_base import get_knowledge_base, peek_knowledge_base
+from ChatbotServices.product_qna_rag import get_product_qna_rag, peek_product_qna_rag
+from startup_orchestrator import orchestrator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -63,6 +69,41 @@ app.include_router(ml_router, prefix="/api/ml", tags=["Machine Learning"])
 app.include_router(chatbot_router, prefix="/api/chatbot", tags=["Chatbot & E-commerce"])
 app.include_router(mail_router, prefix="/api/mail", tags=["Mail Services"])
 
+# Heavy components load in parallel in the background once the server is up,
+# instead of serially at import time before uvicorn can bind
+orchestrator.register("churn_model", churn_preprocessing.load_model, warmup=churn_preprocessing.warm_up)
+orchestrator.register("sentiment_model", sentiment_preprocessing.load_model, warmup=sentiment_preprocessing.warm_up)
+orchestrator.register("knowledge_base", get_knowledge_base,
+                      warmup=lambda: get_knowledge_base().search("shipping policy"))
+orchestrator.register("product_qna", get_product_qna_rag,
+                      warmup=lambda: get_product_qna_rag().search("battery life"))
+orchestrator.register("chatbot_agent", get_agent, warmup=warm_up_agent, depends_on=["knowledge_base"])
+
+# Multi-process mode (gunicorn_conf.py): load the read-only models in the parent
+# before workers fork so they share the weights copy-on-write. The agent opens
+# MongoDB connections, which are not fork-safe, so each worker builds its own.
+FORK_SAFE_COMPONENTS = ["churn_model", "sentiment_model", "knowledge_base", "product_qna"]
+if os.getenv("PRELOAD_MODELS", "false").lower() == "true":
+    orchestrator.preload(FORK_SAFE_COMPONENTS)
+    # Loading a RAG store with a large journal starts a compaction thread. A fork while it
+    # holds a store lock would leave that lock held forever in every worker, so finish it here
+    for store in (peek_knowledge_base(), peek_product_qna_rag()):
+        if store is not None:
+            store.wait_for_compaction()
+
+@app.on_event("startup")
+async def start_components():
+    await orchestrator.start()
+
+@app.on_event("shutdown")
+async def stop_components():
+    sentiment_preprocessing.sentiment_scheduler.stop()
+    # Session updates are written behind the response; don't lose the last ones
+    agent = peek_agent()
+    if agent is not None:
+        await agent.memory_store.flush()
+    orchestrator.shutdown()
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -103,15 +144,29 @@ async def global_health():
     """
     Global health check endpoint for all microservices
     """
+    startup = orchestrator.status()
     return {
-        "status": "healthy",
+        "status": startup["status"],
         "message": "AI Services Gateway is operational",
+        "startup": startup,
         "services": {
             "ml_service": "available at /api/ml/health",
             "chatbot_service": "available at /api/chatbot/health"
         }
     }
 
+# Readiness probe for deploys: 503 until every required component is loaded
+@app.get("/ready")
+async def readiness():
+    """
+    Readiness check - returns 503 while components are still loading
+    """
+    ready = orchestrator.all_required_ready
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "components": orchestrator.status()["components"]}
+    )
+
 # Main execution
 if __name__ == "__main__":
     logger.info("Starting TechHive AI Services Gateway...")
@@ -0,0 +1,57 @@
+"""
+Gunicorn configuration for the multi-process production launch mode
+
+    cd Services
+    gunicorn -c gunicorn_conf.py app:app
+
+The app is imported once in the master with PRELOAD_MODELS=true, which loads the
+churn model, DistilBERT and the RAG indexes before any worker forks. Workers then
+share those pages copy-on-write, so adding workers does not multiply RSS by the
+size of the models. Each worker still builds its own AI agent and MongoDB
+connections after fork.
+
+Environment:
+    WORKERS                   Number of worker processes (default: CPU count)
+    PORT                      Port to bind (default: 5000)
+    TORCH_THREADS_PER_WORKER  Intra-op threads per worker (default: CPUs / workers)
+    SESSION_HOT_TIER          Keep chat sessions in worker memory (default: false with
+                              more than one worker)
+"""
+
+import gc
+import multiprocessing
+import os
+
+# Models must be in memory before fork for copy-on-write sharing
+os.environ.setdefault("PRELOAD_MODELS", "true")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv("WORKERS", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Consecutive requests of a chat session can land on different workers, so a
+# per-worker copy of the session would go stale; read sessions from MongoDB
+if workers > 1:
+    os.environ.setdefault("SESSION_HOT_TIER", "false")
+preload_app = True
+timeout = 180
+graceful_timeout = 30
+keepalive = 5
+
+
+def pre_fork(server, worker):
+    # Move everything allocated so far into the permanent generation so the
+    # cyclic GC never touches (and so never copies) the shared model pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Split the cores between workers instead of every worker spawning a full
+    # intra-op thread pool
+    threads = int(os.getenv("TORCH_THREADS_PER_WORKER", max(1, multiprocessing.cpu_count() // max(1, workers))))
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    server.log.info(f"Worker {worker.pid} started with {threads} torch thread(s)")
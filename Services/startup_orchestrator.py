@@ -0,0 +1,213 @@
+"""
+Startup Orchestrator
+Loads models and services in parallel in the background and tracks per-component readiness
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Component states
+PENDING = "pending"
+LOADING = "loading"
+WARMING_UP = "warming_up"
+READY = "ready"
+FAILED = "failed"
+
+
+class Component:
+    """A unit of startup work: a loader, an optional warm-up and its dependencies"""
+
+    def __init__(self, name: str, loader: Callable[[], Any], warmup: Optional[Callable[[], Any]] = None,
+                 depends_on: Iterable[str] = (), required: bool = True):
+        self.name = name
+        self.loader = loader
+        self.warmup = warmup
+        self.depends_on = list(depends_on)
+        self.required = required
+
+        self.state = PENDING
+        self.preloaded = False
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.done: Optional[asyncio.Event] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "required": self.required,
+            "preloaded": self.preloaded,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "error": self.error,
+        }
+
+
+class StartupOrchestrator:
+    """
+    Runs component loaders concurrently once the server is accepting connections
+
+    Sync loaders run in a thread pool; async loaders run on the event loop. A
+    loader that returns ``False`` or raises marks its component as failed.
+    Components wait for the components they depend on, and a failed dependency
+    fails its dependents. Warm-up callables run right after a successful load
+    when warm-up is enabled (STARTUP_WARMUP, default true).
+    """
+
+    def __init__(self, warmup_enabled: Optional[bool] = None):
+        if warmup_enabled is None:
+            warmup_enabled = os.getenv("STARTUP_WARMUP", "true").lower() == "true"
+        self.warmup_enabled = warmup_enabled
+        self.components: Dict[str, Component] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._task: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def register(self, name: str, loader: Callable[[], Any], warmup: Optional[Callable[[], Any]] = None,
+                 depends_on: Iterable[str] = (), required: bool = True):
+        """Register a component to load at startup"""
+        self.components[name] = Component(name, loader, warmup, depends_on, required)
+
+    def is_ready(self, name: str) -> bool:
+        component = self.components.get(name)
+        return component is not None and component.state == READY
+
+    @property
+    def all_required_ready(self) -> bool:
+        return all(c.state == READY for c in self.components.values() if c.required)
+
+    def status(self) -> dict:
+        """Overall status plus per-component readiness"""
+        states = [c.state for c in self.components.values()]
+        if any(c.state == FAILED and c.required for c in self.components.values()):
+            overall = "degraded"
+        elif all(state in (READY, FAILED) for state in states):
+            overall = "healthy"
+        else:
+            overall = "starting"
+
+        elapsed = None
+        if self._started_at is not None:
+            elapsed = round((self._finished_at or time.monotonic()) - self._started_at, 2)
+
+        return {
+            "status": overall,
+            "startup_seconds": elapsed,
+            "warmup_enabled": self.warmup_enabled,
+            "components": {name: c.to_dict() for name, c in self.components.items()},
+        }
+
+    def preload(self, names: Iterable[str]):
+        """
+        Load the named components synchronously, in parallel, before workers fork
+
+        Used by the multi-process launch mode (gunicorn_conf.py) so model weights
+        and indexes live in the parent and are shared copy-on-write. Only
+        fork-safe components (no open sockets or background threads) belong
+        here; warm-up is deferred to each worker because running inference
+        before fork leaves thread pools that don't survive it.
+        """
+        targets = [self.components[name] for name in names if name in self.components]
+        if not targets:
+            return
+
+        def load(component: Component):
+            started = time.monotonic()
+            try:
+                result = component.loader()
+                if result is False:
+                    raise RuntimeError("loader reported failure")
+                component.preloaded = True
+                component.load_seconds = round(time.monotonic() - started, 2)
+                logger.info(f"Preloaded '{component.name}' in {component.load_seconds}s")
+            except Exception as e:
+                # Left for the worker to retry at startup
+                logger.error(f"Preloading '{component.name}' failed: {e}")
+
+        with ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="preload") as executor:
+            list(executor.map(load, targets))
+
+    async def start(self):
+        """Begin loading every component in the background and return immediately"""
+        if self._task is not None:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.components)), thread_name_prefix="startup"
+        )
+        self._started_at = time.monotonic()
+        self._task = asyncio.create_task(self._run_all())
+
+    async def wait(self):
+        """Wait until every component has finished loading (or failed)"""
+        if self._task is not None:
+            await self._task
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _call(self, fn: Callable[[], Any]) -> Any:
+        """Run a sync callable in the pool, or await an async one"""
+        if inspect.iscoroutinefunction(fn):
+            return await fn()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn)
+
+    async def _run_component(self, component: Component):
+        try:
+            for dependency in component.depends_on:
+                dep = self.components.get(dependency)
+                if dep is None:
+                    continue
+                await dep.done.wait()
+                if dep.state != READY:
+                    raise RuntimeError(f"dependency '{dependency}' failed to load")
+
+            if not component.preloaded:
+                component.state = LOADING
+                started = time.monotonic()
+                result = await self._call(component.loader)
+                component.load_seconds = round(time.monotonic() - started, 2)
+                if result is False:
+                    raise RuntimeError("loader reported failure")
+
+            if component.warmup is not None and self.warmup_enabled:
+                component.state = WARMING_UP
+                started = time.monotonic()
+                try:
+                    await self._call(component.warmup)
+                except Exception as e:
+                    # A failed warm-up is not fatal; the first request just pays the cold cost
+                    logger.warning(f"Warm-up for {component.name} failed: {e}")
+                component.warmup_seconds = round(time.monotonic() - started, 2)
+
+            component.state = READY
+            logger.info(f"Component '{component.name}' ready (load {component.load_seconds}s, "
+                        f"warm-up {component.warmup_seconds}s)")
+        except Exception as e:
+            component.state = FAILED
+            component.error = str(e)
+            logger.error(f"Component '{component.name}' failed to start: {e}")
+        finally:
+            component.done.set()
+
+    async def _run_all(self):
+        for component in self.components.values():
+            component.done = asyncio.Event()
+        await asyncio.gather(*(self._run_component(c) for c in self.components.values()))
+        self._finished_at = time.monotonic()
+        ready = [c.name for c in self.components.values() if c.state == READY]
+        logger.info(f"Startup finished in {self._finished_at - self._started_at:.2f}s; ready: {ready}")
+
+
+# Gateway-wide orchestrator used by app.py
+orchestrator = StartupOrchestrator()